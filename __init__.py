@@ -11,6 +11,12 @@ __author__ = 'Wilmar Osorio y Santiago Alexander Losada'
 
 # Importaciones principales para facilitar el uso del paquete
 from .utilidades import Colores, formatear_numero
+from .modelo_pl import ProblemaPL, ResultadoPL, LimitesResolucion
+from .metricas import MetricasResolucion
+from .matrices import MatrizDispersa
+from .modelo_mapeado import guardar_modelo_npy
+from .formato_mps_lp import leer_mps, escribir_mps, leer_lp, escribir_lp
+from .modelador import Modelo, Expresion
 from .manejo_consola import (
     mostrar_menu_principal,
     ingresar_problema_completo,
@@ -18,21 +24,54 @@ from .manejo_consola import (
 )
 from .resolucion_simplex import (
     resolver_simplex_revisado,
-    validar_factibilidad,
-    mostrar_solucion_final
+    mostrar_solucion_final,
+    resolver_parametrico_objetivo,
+    reanudar_resolucion,
+    reanudar_desde_punto_control
 )
+from .observadores import EventoSimplex, ObservadorTablero, ObservadorProgreso
+from .punto_control import PuntoControl, cargar_punto_control
+from .traza import TrazaSimplex, ReproductorTraza
+from .api_async import resolver_async, resolver_lote_async, resolver_con_progreso
+from .escenarios import MatrizCompartida, resolver_escenarios
 from .visualizacion_grafica import graficar_solucion_2d
 from .exportacion_resultados import guardar_resultado_txt
 
 __all__ = [
     'Colores',
     'formatear_numero',
+    'ProblemaPL',
+    'ResultadoPL',
+    'LimitesResolucion',
+    'MetricasResolucion',
+    'MatrizDispersa',
+    'guardar_modelo_npy',
+    'leer_mps',
+    'escribir_mps',
+    'leer_lp',
+    'escribir_lp',
+    'Modelo',
+    'Expresion',
     'mostrar_menu_principal',
     'ingresar_problema_completo',
     'confirmar_accion',
     'resolver_simplex_revisado',
-    'validar_factibilidad',
     'mostrar_solucion_final',
+    'resolver_parametrico_objetivo',
+    'reanudar_resolucion',
+    'reanudar_desde_punto_control',
+    'PuntoControl',
+    'EventoSimplex',
+    'ObservadorTablero',
+    'ObservadorProgreso',
+    'cargar_punto_control',
+    'TrazaSimplex',
+    'ReproductorTraza',
+    'resolver_async',
+    'resolver_lote_async',
+    'resolver_con_progreso',
+    'MatrizCompartida',
+    'resolver_escenarios',
     'graficar_solucion_2d',
     'guardar_resultado_txt'
 ]
@@ -0,0 +1,201 @@
+"""
+==================================================================================
+MÓDULO DE API ASÍNCRONA
+==================================================================================
+Envoltorio para usar el solucionador desde aplicaciones asyncio sin bloquear
+el ciclo de eventos: cada resolución corre en un ejecutor de hilos o de
+procesos, en modo silencioso (sin tableros ni input()), y cancelar la tarea
+activa la señal de cancelación que el simplex consulta entre pivotes.
+
+    resultado = await resolver_async(problema)
+    resultados = await resolver_lote_async(problemas, concurrencia=4)
+
+    progreso = resolver_con_progreso(problema)
+    async for evento in progreso:
+        ...
+    resultado = await progreso.resultado
+==================================================================================
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from modelo_pl import LimitesResolucion
+from observadores import FIN
+from resolucion_simplex import resolver_problema_general
+
+
+# ==================================================================================
+# SEÑALES DE CANCELACIÓN
+# ==================================================================================
+
+class _AlgunaSenal:
+    """Señal activa si lo está cualquiera de las dadas (la del usuario y la de la tarea)."""
+
+    __slots__ = ('senales',)
+
+    def __init__(self, *senales):
+        self.senales = senales
+
+    def is_set(self):
+        return any(senal.is_set() for senal in self.senales)
+
+
+_administrador = None
+_candado_administrador = threading.Lock()
+
+
+def _nueva_senal(executor):
+    """
+    Señal de cancelación adecuada al ejecutor: threading.Event para hilos y un
+    Event de un multiprocessing.Manager (compartido y creado una sola vez)
+    para procesos, ya que la señal debe llegar al proceso que resuelve.
+    """
+    global _administrador
+    if not isinstance(executor, ProcessPoolExecutor):
+        return threading.Event()
+    with _candado_administrador:
+        if _administrador is None:
+            _administrador = multiprocessing.Manager()
+    return _administrador.Event()
+
+
+def _validar_cancelacion(limites, executor):
+    """
+    Raises:
+        ValueError: Si la señal de cancelación del usuario es un threading.Event
+                    y el ejecutor es de procesos (no se puede enviar a otro proceso)
+    """
+    cancelacion = limites.cancelacion if limites is not None else None
+    if isinstance(executor, ProcessPoolExecutor) and isinstance(cancelacion, threading.Event):
+        raise ValueError("limites.cancelacion es un threading.Event, que no llega a un ejecutor de procesos; "
+                         "use multiprocessing.Manager().Event() o no pase una señal propia (cancelar la "
+                         "tarea ya detiene la resolución).")
+
+
+def _limites_con_senal(limites, senal):
+    base = limites if limites is not None else LimitesResolucion()
+    cancelacion = senal if base.cancelacion is None else _AlgunaSenal(base.cancelacion, senal)
+    return LimitesResolucion(base.max_iteraciones, base.tiempo_maximo, cancelacion)
+
+
+# ==================================================================================
+# RESOLUCIÓN
+# ==================================================================================
+
+async def resolver_async(problema, executor=None, **opciones):
+    """
+    Resuelve un problema en executor (por defecto, el de hilos del ciclo de
+    eventos) sin bloquear el ciclo. Si la tarea se cancela, el simplex se
+    detiene en el siguiente pivote y se propaga CancelledError.
+
+    Args:
+        problema: ProblemaPL o diccionario del problema
+        executor: concurrent.futures.Executor de hilos o de procesos
+        **opciones: Argumentos de resolver_problema_general (metodo, limites,
+                    observadores, ...); silencioso y pausa se ignoran
+
+    Returns:
+        ResultadoPL: Resultado de la resolución
+
+    Raises:
+        ValueError: Si limites.cancelacion es un threading.Event y executor es de procesos
+    """
+    _validar_cancelacion(opciones.get('limites'), executor)
+    opciones.pop('silencioso', None)
+    opciones.pop('pausa', None)
+    loop = asyncio.get_running_loop()
+    senal = _nueva_senal(executor)
+    opciones['limites'] = _limites_con_senal(opciones.get('limites'), senal)
+    futuro = loop.run_in_executor(executor, functools.partial(resolver_problema_general, problema,
+                                                              silencioso=True, **opciones))
+    try:
+        return await asyncio.shield(futuro)
+    except asyncio.CancelledError:
+        senal.set()
+        # Se espera a que el simplex vea la señal para no dejar trabajo huérfano
+        try:
+            await futuro
+        except Exception:
+            pass
+        raise
+
+
+async def resolver_lote_async(problemas, executor=None, concurrencia=None, **opciones):
+    """
+    Resuelve varios problemas con a lo sumo concurrencia resoluciones a la
+    vez. Cancelar el lote cancela todas las resoluciones pendientes.
+
+    Returns:
+        list: Un ResultadoPL por problema, en el mismo orden
+
+    Raises:
+        ValueError: Si limites.cancelacion es un threading.Event y executor es de procesos
+    """
+    _validar_cancelacion(opciones.get('limites'), executor)
+    limite = asyncio.Semaphore(concurrencia) if concurrencia else None
+
+    async def resolver_uno(problema):
+        if limite is None:
+            return await resolver_async(problema, executor, **opciones)
+        async with limite:
+            return await resolver_async(problema, executor, **opciones)
+
+    tareas = [asyncio.ensure_future(resolver_uno(problema)) for problema in problemas]
+    try:
+        return await asyncio.gather(*tareas)
+    except BaseException:
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        raise
+
+
+# ==================================================================================
+# PROGRESO COMO ITERADOR ASÍNCRONO
+# ==================================================================================
+
+class ProgresoAsync:
+    """
+    Resolución en curso cuyos eventos (ver observadores.EventoSimplex, sin
+    contexto) se recorren con async for; el recorrido termina con el evento
+    FIN y resultado es la tarea que entrega el ResultadoPL. Cancelar
+    resultado cancela la resolución.
+    """
+
+    def __init__(self, problema, executor=None, tipos=None, **opciones):
+        if isinstance(executor, ProcessPoolExecutor):
+            raise TypeError("El progreso solo se puede seguir con un ejecutor de hilos.")
+        loop = asyncio.get_running_loop()
+        self._eventos = asyncio.Queue()
+        self._tipos = tipos
+
+        def observador(evento):
+            if self._tipos is None or evento.tipo in self._tipos or evento.tipo == FIN:
+                loop.call_soon_threadsafe(self._eventos.put_nowait, evento.sin_contexto())
+
+        opciones['observadores'] = list(opciones.get('observadores') or []) + [observador]
+        self.resultado = asyncio.ensure_future(resolver_async(problema, executor, **opciones))
+        self.resultado.add_done_callback(lambda _: self._eventos.put_nowait(None))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        evento = await self._eventos.get()
+        if evento is None:
+            raise StopAsyncIteration
+        return evento
+
+
+def resolver_con_progreso(problema, executor=None, tipos=None, **opciones):
+    """
+    Inicia una resolución y retorna un ProgresoAsync para recorrer sus eventos.
+    Debe llamarse desde una corrutina (con el ciclo de eventos en marcha).
+
+    Args:
+        tipos: Tipos de evento que interesan (por defecto, todos; FIN siempre llega)
+    """
+    return ProgresoAsync(problema, executor, tipos, **opciones)
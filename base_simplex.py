@@ -0,0 +1,118 @@
+"""
+==================================================================================
+MÓDULO DE LA BASE SIMPLEX
+==================================================================================
+Estructura compacta para la base del Método Simplex Revisado, respaldada por
+arreglos de NumPy en lugar de listas de Python.
+==================================================================================
+"""
+
+import numpy as np
+
+
+# ==================================================================================
+# ESTADOS DE LAS VARIABLES
+# ==================================================================================
+
+BASICA = 0
+EN_INFERIOR = 1   # No básica en su cota inferior (cero)
+EN_SUPERIOR = 2   # No básica en su cota superior (reservado para variables acotadas)
+
+
+# ==================================================================================
+# CLASE BASE SIMPLEX
+# ==================================================================================
+
+class BaseSimplex:
+    """
+    Base del simplex con tres arreglos sincronizados:
+
+    - indices: variable básica de cada posición (fila) de la base;
+    - posicion: posición en la base de cada columna, o -1 si no es básica;
+    - estado: BASICA, EN_INFERIOR o EN_SUPERIOR para cada columna.
+
+    Pertenencia y posición se consultan en O(1) y un pivote cuesta O(1).
+    """
+
+    __slots__ = ('indices', 'posicion', 'estado')
+
+    def __init__(self, indices, num_columnas):
+        """
+        Args:
+            indices: Variables básicas en orden de posición
+            num_columnas: Número total de columnas del problema extendido
+        """
+        self.indices = np.array(indices, dtype=np.intp)
+        self.posicion = np.full(num_columnas, -1, dtype=np.intp)
+        self.posicion[self.indices] = np.arange(len(self.indices))
+        self.estado = np.full(num_columnas, EN_INFERIOR, dtype=np.int8)
+        self.estado[self.indices] = BASICA
+
+    @classmethod
+    def desde(cls, base, num_columnas):
+        """Retorna base tal cual si ya es una BaseSimplex; si no, la construye."""
+        return base if isinstance(base, cls) else cls(base, num_columnas)
+
+    # ------------------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------------------
+
+    @property
+    def num_columnas(self):
+        return len(self.posicion)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return iter(self.indices.tolist())
+
+    def __getitem__(self, k):
+        return int(self.indices[k])
+
+    def __contains__(self, j):
+        return 0 <= j < len(self.posicion) and self.posicion[j] >= 0
+
+    def __repr__(self):
+        return f"BaseSimplex({self.indices.tolist()})"
+
+    def posicion_de(self, j):
+        """Posición de la columna j en la base (-1 si no es básica)."""
+        return int(self.posicion[j])
+
+    def mascara_no_basicas(self):
+        """Máscara booleana de las columnas no básicas."""
+        return self.estado != BASICA
+
+    def no_basicas(self):
+        """Índices de las columnas no básicas, en orden creciente."""
+        return np.flatnonzero(self.estado != BASICA)
+
+    def huella(self):
+        """Huella hashable de la base (independiente del orden de las posiciones)."""
+        return np.sort(self.indices).tobytes()
+
+    # ------------------------------------------------------------------------------
+    # Modificación
+    # ------------------------------------------------------------------------------
+
+    def reemplazar(self, k, var_entrante):
+        """Pivote: var_entrante ocupa la posición k y la variable saliente queda en su cota inferior."""
+        var_saliente = self.indices[k]
+        self.posicion[var_saliente] = -1
+        self.estado[var_saliente] = EN_INFERIOR
+        self.indices[k] = var_entrante
+        self.posicion[var_entrante] = k
+        self.estado[var_entrante] = BASICA
+
+    def copia(self):
+        """Copia independiente de la base."""
+        nueva = BaseSimplex.__new__(BaseSimplex)
+        nueva.indices = self.indices.copy()
+        nueva.posicion = self.posicion.copy()
+        nueva.estado = self.estado.copy()
+        return nueva
+
+    def reindexar(self, nuevo_indice, num_columnas):
+        """Nueva base tras agregar o quitar columnas; nuevo_indice mapea columna vieja -> nueva."""
+        return BaseSimplex(np.asarray(nuevo_indice)[self.indices], num_columnas)
@@ -0,0 +1,153 @@
+"""
+==================================================================================
+MÓDULO DE ESCENARIOS EN MEMORIA COMPARTIDA
+==================================================================================
+Resolución de muchos escenarios de un mismo modelo (la matriz A fija; solo
+cambian b y/o c) en un grupo de procesos. A se copia una sola vez a un bloque
+de multiprocessing.shared_memory y cada proceso la adjunta sin copiarla; a
+cada tarea solo viajan los vectores del escenario.
+==================================================================================
+"""
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from formato_json import resultado_a_dict
+from modelo_pl import LimitesResolucion, ProblemaPL
+from resolucion_simplex import resolver_problema_general
+
+
+# ==================================================================================
+# MATRIZ EN MEMORIA COMPARTIDA
+# ==================================================================================
+
+class MatrizCompartida:
+    """
+    Copia de una matriz en un bloque de memoria compartida, con su descriptor
+    (nombre, forma y tipo) para adjuntarla desde otros procesos. El bloque se
+    libera al salir del with, con liberar() o, si se olvida, cuando el objeto
+    se recolecta o termina el intérprete.
+    """
+
+    def __init__(self, matriz):
+        matriz = np.ascontiguousarray(matriz, dtype=np.float64)
+        self._memoria = shared_memory.SharedMemory(create=True, size=max(1, matriz.nbytes))
+        self.matriz = np.ndarray(matriz.shape, dtype=matriz.dtype, buffer=self._memoria.buf)
+        self.matriz[...] = matriz
+        self.descriptor = (self._memoria.name, matriz.shape, matriz.dtype.str)
+        self._finalizador = weakref.finalize(self, _liberar_memoria, self._memoria)
+
+    def liberar(self):
+        """Libera el bloque (la matriz deja de ser válida)."""
+        self.matriz = None
+        self._finalizador()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.liberar()
+
+
+def _liberar_memoria(memoria):
+    memoria.close()
+    memoria.unlink()
+
+
+def adjuntar_matriz(descriptor):
+    """
+    Adjunta (sin copiar) una matriz creada con MatrizCompartida en otro proceso.
+    La vista es de solo lectura; el bloque lo libera quien lo creó.
+
+    Returns:
+        tuple: (memoria, matriz); memoria debe seguir viva mientras se use la matriz
+    """
+    nombre, forma, tipo = descriptor
+    memoria = _abrir_sin_seguimiento(nombre)
+    matriz = np.ndarray(forma, dtype=np.dtype(tipo), buffer=memoria.buf)
+    matriz.flags.writeable = False
+    return memoria, matriz
+
+
+def _abrir_sin_seguimiento(nombre):
+    """
+    Abre un bloque existente sin registrarlo en el resource_tracker: si no, al
+    terminar cada proceso adjunto el bloque se borraría (o se avisaría de una
+    fuga) aunque el creador lo siga usando. Python 3.13+ lo permite con track=False.
+    """
+    try:
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    except TypeError:
+        pass
+    from multiprocessing import resource_tracker
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=nombre)
+    finally:
+        resource_tracker.register = registrar
+
+
+# ==================================================================================
+# TRABAJO DE CADA PROCESO
+# ==================================================================================
+
+_modelo = {}
+
+
+def _iniciar_proceso(descriptor, base):
+    """Inicializador: adjunta A y guarda los datos comunes del modelo en el proceso."""
+    memoria, A = adjuntar_matriz(descriptor)
+    _modelo.update(base, memoria=memoria, A=A)
+
+
+def _resolver_escenario(escenario):
+    """Resuelve un escenario (índice, b o None, c o None) sobre la A compartida."""
+    indice, b, c = escenario
+    problema = ProblemaPL(_modelo['c'] if c is None else c, _modelo['A'], _modelo['b'] if b is None else b,
+                          _modelo['tipos_restricciones'], _modelo['tipo'], _modelo['nombres_vars'],
+                          f"{_modelo['nombre'] or 'escenario'} #{indice}")
+    resultado = resolver_problema_general(problema, silencioso=True, metodo=_modelo['metodo'],
+                                          limites=LimitesResolucion(_modelo['max_iteraciones'],
+                                                                    _modelo['tiempo_maximo']))
+    return {'escenario': indice, **resultado_a_dict(resultado, problema)}
+
+
+# ==================================================================================
+# RESOLUCIÓN DE ESCENARIOS
+# ==================================================================================
+
+def resolver_escenarios(problema, escenarios, procesos=None, metodo='dos_fases', max_iteraciones=10000,
+                        tiempo_maximo=None, tam_bloque=8):
+    """
+    Resuelve cada escenario del problema en un grupo de procesos que comparten A.
+
+    Args:
+        problema: ProblemaPL o diccionario con el modelo base
+        escenarios: Iterable de diccionarios con 'b' y/o 'c' (lo que falte se
+                    toma del modelo base)
+        procesos: Procesos del grupo (por defecto, uno por CPU)
+        metodo: 'dos_fases' o 'gran_m'
+        max_iteraciones, tiempo_maximo: Presupuesto de cada escenario
+        tam_bloque: Escenarios que se envían juntos a un proceso
+
+    Returns:
+        list: Un resultado serializable por escenario (ver formato_json.resultado_a_dict),
+              en el mismo orden y con su índice en 'escenario'
+    """
+    problema = ProblemaPL.desde(problema)
+    base = {'c': problema.c, 'b': problema.b, 'tipos_restricciones': problema.tipos_restricciones,
+            'tipo': problema.tipo, 'nombres_vars': problema.nombres_vars, 'nombre': problema.nombre,
+            'metodo': metodo, 'max_iteraciones': max_iteraciones, 'tiempo_maximo': tiempo_maximo}
+    tareas = ((k, _vector(e.get('b')), _vector(e.get('c'))) for k, e in enumerate(escenarios))
+
+    with MatrizCompartida(problema.A) as compartida:
+        with ProcessPoolExecutor(max_workers=procesos or os.cpu_count() or 1, initializer=_iniciar_proceso,
+                                 initargs=(compartida.descriptor, base)) as ejecutor:
+            return list(ejecutor.map(_resolver_escenario, tareas, chunksize=tam_bloque))
+
+
+def _vector(valores):
+    return None if valores is None else np.ascontiguousarray(valores, dtype=np.float64)
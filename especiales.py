@@ -1,4 +1,22 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from metricas import MetricasResolucion
+from modelo_pl import ProblemaPL
 from resolucion_simplex import resolver_problema_general
+from manejo_consola import esperar_enter
+from traza import TrazaSimplex, ReproductorTraza
+from ejemplos_casos_prueba import generar_problema_complejo
+from problema_definido import (
+    obtener_problema_dos_fases,
+    obtener_problema_grafico_grande,
+    obtener_problema_multiples_variables,
+    obtener_problema_infactible,
+    obtener_problema_no_acotado,
+    obtener_problema_multiples_optimos
+)
 
 def caso_empate_variable_entrante():
     """
@@ -19,7 +37,7 @@ def caso_empate_variable_entrante():
         'nombres_vars': ['x1', 'x2'],
         'tipos_restricciones': ['<=', '<=']
     }
-    resolver_problema_general(problema)
+    resolver_problema_general(problema, pausa=esperar_enter)
 
 def caso_degeneracion():
     """
@@ -40,7 +58,7 @@ def caso_degeneracion():
         'nombres_vars': ['x1', 'x2'],
         'tipos_restricciones': ['<=', '<=']
     }
-    resolver_problema_general(problema)
+    resolver_problema_general(problema, pausa=esperar_enter)
 
 def caso_solucion_no_acotada():
     """
@@ -61,7 +79,105 @@ def caso_solucion_no_acotada():
         'nombres_vars': ['x1', 'x2'],
         'tipos_restricciones': ['<=', '<=']
     }
-    resolver_problema_general(problema)
+    resolver_problema_general(problema, pausa=esperar_enter)
+
+def comparar_gran_m_vs_dos_fases(repeticiones=200):
+    """
+    Compara el método compuesto de una fase (Gran M adaptativa) con el de
+    dos fases en los problemas de restricciones mixtas del catálogo.
+    Reporta el estado, el valor óptimo, el tiempo y las iteraciones promedio
+    de cada método (sumando las métricas de todas las repeticiones).
+    """
+    print("\n--- COMPARACIÓN: GRAN M (UNA FASE) VS DOS FASES ---")
+    problemas = [ProblemaPL.desde(generar_problema_complejo()), obtener_problema_dos_fases(), obtener_problema_infactible()]
+
+    print(f"\n  {'Problema':<12}{'Método':<12}{'Estado':<14}{'Valor':>12}{'Tiempo (ms)':>14}{'Iteraciones':>13}")
+    for k, problema in enumerate(problemas, start=1):
+        for metodo in ('dos_fases', 'gran_m'):
+            inicio = time.perf_counter()
+            metricas = []
+            for _ in range(repeticiones):
+                resultado = resolver_problema_general(problema, silencioso=True, metodo=metodo)
+                metricas.append(resultado.metricas)
+            tiempo_ms = (time.perf_counter() - inicio) * 1000 / repeticiones
+            promedio = MetricasResolucion.sumar(metricas).como_dict(por_resolucion=True)
+            iteraciones = promedio['iteraciones_fase_1'] + promedio['iteraciones_fase_2']
+            valor = resultado.valor
+            valor_str = f"{valor:.4f}" if valor is not None else "-"
+            print(f"  {k:<12}{metodo:<12}{resultado.estado:<14}{valor_str:>12}{tiempo_ms:>14.3f}{iteraciones:>13.1f}")
+
+def _resumen_resultado(resultado):
+    """Estado, valor y solución de un resultado, para comparar resoluciones."""
+    if resultado.estado != 'optimo':
+        return resultado.estado, None, None
+    return resultado.estado, resultado.valor, resultado.solucion
+
+
+def prueba_concurrencia(num_hilos=8, repeticiones=50):
+    """
+    Resuelve los problemas del catálogo desde num_hilos hilos a la vez, con
+    ambos métodos, y compara cada resultado con el de la resolución en serie.
+    NumPy libera el GIL en los productos y factorizaciones, así que los hilos
+    avanzan en paralelo sobre las mismas matrices (que no se modifican).
+
+    Returns:
+        bool: True si todas las resoluciones concurrentes coinciden con las seriales
+    """
+    print("\n--- PRUEBA DE CONCURRENCIA: RESOLUCIONES EN HILOS VS EN SERIE ---")
+    problemas = [ProblemaPL.desde(generar_problema_complejo()), obtener_problema_dos_fases(),
+                 obtener_problema_grafico_grande(), obtener_problema_multiples_variables(),
+                 obtener_problema_infactible(), obtener_problema_no_acotado(),
+                 obtener_problema_multiples_optimos()]
+    casos = [(problema, metodo) for problema in problemas for metodo in ('dos_fases', 'gran_m')]
+    esperados = [_resumen_resultado(resolver_problema_general(p, silencioso=True, metodo=m)) for p, m in casos]
+
+    def resolver_caso(k):
+        problema, metodo = casos[k % len(casos)]
+        return k, _resumen_resultado(resolver_problema_general(problema, silencioso=True, metodo=metodo))
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_hilos) as ejecutor:
+        obtenidos = list(ejecutor.map(resolver_caso, range(len(casos) * repeticiones)))
+    tiempo_ms = (time.perf_counter() - inicio) * 1000
+
+    discrepancias = 0
+    for k, (estado, valor, solucion) in obtenidos:
+        estado_serial, valor_serial, solucion_serial = esperados[k % len(casos)]
+        if estado != estado_serial or (valor is not None and not (
+                np.isclose(valor, valor_serial) and np.allclose(solucion, solucion_serial))):
+            discrepancias += 1
+
+    print(f"\n  Hilos: {num_hilos}   Resoluciones: {len(obtenidos)}   Tiempo: {tiempo_ms:.1f} ms")
+    print(f"  Discrepancias con la resolución en serie: {discrepancias}")
+    return discrepancias == 0
+
+def reproducir_traza(problema=None):
+    """
+    Resuelve sin mostrar tableros, registrando solo la traza binaria de los
+    pivotes, y después reconstruye desde el archivo .npz el tablero de las
+    iteraciones que se pidan.
+    """
+    print("\n--- TRAZA BINARIA Y REPRODUCCIÓN DE TABLEROS ---")
+    problema = problema if problema is not None else obtener_problema_dos_fases()
+    traza = TrazaSimplex()
+    resultado = resolver_problema_general(problema, silencioso=True, crash=False, observadores=[traza])
+    ruta = os.path.join(tempfile.gettempdir(), 'traza_simplex.npz')
+    traza.guardar(ruta)
+    print(f"\n  Estado: {resultado.estado}   Pivotes: {traza.num_pivotes}   Traza: {ruta} ({os.path.getsize(ruta)} bytes)")
+
+    reproductor = ReproductorTraza(ruta)
+    print(f"\n  {'k':<5}{'Fase':<12}{'Iter.':<7}{'Entra':<8}{'Sale':<8}{'Paso':>10}{'Objetivo':>12}")
+    for k, fase, iteracion, entrante, saliente, paso, objetivo in reproductor.pivotes():
+        print(f"  {k:<5}{fase:<12}{iteracion:<7}{entrante:<8}{saliente:<8}{paso:>10.4f}{objetivo:>12.4f}")
+
+    while True:
+        opcion = input(f"\nPivote a reconstruir (0-{reproductor.num_pivotes}, ENTER para terminar): ").strip()
+        if not opcion:
+            break
+        try:
+            reproductor.mostrar_tablero(int(opcion))
+        except (ValueError, IndexError) as error:
+            print(f"❌ {error}")
 
 if __name__ == '__main__':
     while True:
@@ -71,7 +187,10 @@ if __name__ == '__main__':
         print("1. Empate en la variable que entra")
         print("2. Empate en la variable que sale (Degeneración)")
         print("3. Solución no acotada (Z no acotada)")
-        print("4. Salir")
+        print("4. Comparar Gran M (una fase) vs Dos Fases")
+        print("5. Prueba de concurrencia (resoluciones en hilos)")
+        print("6. Traza binaria y reproducción de tableros")
+        print("7. Salir")
         
         opcion = input("\nSeleccione una opción para probar: ")
         
@@ -82,6 +201,12 @@ if __name__ == '__main__':
         elif opcion == '3':
             caso_solucion_no_acotada()
         elif opcion == '4':
+            comparar_gran_m_vs_dos_fases()
+        elif opcion == '5':
+            prueba_concurrencia()
+        elif opcion == '6':
+            reproducir_traza()
+        elif opcion == '7':
             print("Saliendo del programa de pruebas.")
             break
         else:
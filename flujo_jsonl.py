@@ -0,0 +1,122 @@
+"""
+==================================================================================
+MÓDULO DE FLUJO JSONL
+==================================================================================
+Resuelve un flujo de problemas (un objeto JSON por línea, con la forma de
+problema_definido.py) y escribe un flujo de resultados JSONL, sin cargar la
+entrada completa: las líneas se leen a medida que hay lugar en una ventana
+acotada de lotes en vuelo repartidos entre procesos, así que la memoria no
+depende del largo del flujo.
+
+    python main.py flujo modelos.jsonl --salida resultados.jsonl --procesos 4
+    generador | python main.py flujo --sin-orden > resultados.jsonl
+==================================================================================
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from formato_json import problema_desde_dict, resultado_a_dict
+from modelo_pl import LimitesResolucion
+from resolucion_simplex import resolver_problema_general
+
+
+# ==================================================================================
+# TRABAJO DE CADA PROCESO
+# ==================================================================================
+
+def _resolver_linea(numero, texto, metodo, max_iteraciones, tiempo_maximo):
+    """Resuelve una línea JSON y retorna (estado, línea JSON del resultado)."""
+    inicio = time.perf_counter()
+    try:
+        problema = problema_desde_dict(json.loads(texto))
+        resultado = resolver_problema_general(problema, silencioso=True, metodo=metodo,
+                                              limites=LimitesResolucion(max_iteraciones, tiempo_maximo))
+        datos = resultado_a_dict(resultado, problema)
+    except (TypeError, ValueError) as error:  # json.JSONDecodeError es un ValueError
+        datos = {'estado': 'error', 'mensaje': str(error)}
+    datos = {'linea': numero, **datos, 'tiempo_ms': (time.perf_counter() - inicio) * 1000}
+    return datos['estado'], json.dumps(datos, ensure_ascii=False)
+
+
+def _resolver_lote(lote, metodo, max_iteraciones, tiempo_maximo):
+    """Resuelve un lote de (número de línea, texto); se ejecuta en un proceso del grupo."""
+    return [_resolver_linea(numero, texto, metodo, max_iteraciones, tiempo_maximo) for numero, texto in lote]
+
+
+def _lotes(entrada, tamano):
+    """Agrupa las líneas no vacías de entrada de a tamano, con su número de línea (desde 1)."""
+    lote = []
+    for numero, texto in enumerate(entrada, start=1):
+        if texto.strip():
+            lote.append((numero, texto))
+            if len(lote) == tamano:
+                yield lote
+                lote = []
+    if lote:
+        yield lote
+
+
+# ==================================================================================
+# FLUJO
+# ==================================================================================
+
+def resolver_flujo(entrada, salida, procesos=None, ventana=None, lote=16, ordenado=True, metodo='dos_fases',
+                   max_iteraciones=10000, tiempo_maximo=None):
+    """
+    Resuelve cada línea de entrada y escribe una línea JSON por resultado en
+    salida, con el número de línea de entrada en 'linea'.
+
+    Args:
+        entrada: Iterable de líneas de texto (archivo abierto, sys.stdin, ...)
+        salida: Objeto con write() para los resultados
+        procesos: Procesos del grupo (None: uno por CPU; 0: en este proceso)
+        ventana: Lotes en vuelo como máximo (por defecto, 2 por proceso)
+        lote: Líneas que se envían juntas a un proceso
+        ordenado: Si es False, cada resultado se escribe apenas está listo
+        metodo: 'dos_fases' o 'gran_m'
+        max_iteraciones, tiempo_maximo: Presupuesto de cada problema
+
+    Returns:
+        dict: Cantidad de resultados por estado
+    """
+    conteo = {}
+    argumentos = (metodo, max_iteraciones, tiempo_maximo)
+
+    def escribir(resultados):
+        for estado, linea in resultados:
+            salida.write(linea + "\n")
+            conteo[estado] = conteo.get(estado, 0) + 1
+
+    if procesos == 0:
+        for siguiente in _lotes(entrada, lote):
+            escribir(_resolver_lote(siguiente, *argumentos))
+        return conteo
+
+    procesos = procesos or os.cpu_count() or 1
+    ventana = ventana or 2 * procesos
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        en_vuelo = deque() if ordenado else set()
+        for siguiente in _lotes(entrada, lote):
+            if len(en_vuelo) >= ventana:
+                if ordenado:
+                    escribir(en_vuelo.popleft().result())
+                else:
+                    listos, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                    for futuro in listos:
+                        escribir(futuro.result())
+            futuro = ejecutor.submit(_resolver_lote, siguiente, *argumentos)
+            if ordenado:
+                en_vuelo.append(futuro)
+            else:
+                en_vuelo.add(futuro)
+
+        if ordenado:
+            while en_vuelo:
+                escribir(en_vuelo.popleft().result())
+        else:
+            for futuro in as_completed(en_vuelo):
+                escribir(futuro.result())
+    return conteo
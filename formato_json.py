@@ -0,0 +1,109 @@
+"""
+==================================================================================
+MÓDULO DE FORMATO JSON
+==================================================================================
+Lectura de modelos guardados como JSON (el mismo diccionario que arman
+problema_definido.py y manejo_consola.py) y conversión de un resultado a un
+diccionario serializable, para la línea de comandos y los procesos por lotes.
+==================================================================================
+"""
+
+import json
+import os
+from formato_mps_lp import leer_lp, leer_mps
+from modelo_mapeado import resolver_referencias
+from modelo_pl import ProblemaPL
+
+
+# ==================================================================================
+# MODELOS
+# ==================================================================================
+
+LECTORES = {'.mps': leer_mps, '.lp': leer_lp}
+
+
+def leer_modelo(ruta):
+    """
+    Lee un modelo desde un archivo JSON, o MPS / LP según la extensión
+    (.mps, .lp, también comprimidos .gz; ver formato_mps_lp.py).
+
+    Args:
+        ruta: Archivo con las claves c, A, b y, opcionalmente, tipos_restricciones,
+              tipo, nombres_vars y nombre (las demás se ignoran); c, A y b
+              pueden ser referencias a archivos .npy (ver modelo_mapeado.py)
+
+    Returns:
+        ProblemaPL: Problema leído
+
+    Raises:
+        ValueError: Si el archivo no es JSON válido o el modelo es inconsistente
+    """
+    lector = LECTORES.get(extension_modelo(ruta))
+    if lector is not None:
+        return problema_desde_dict(lector(ruta))
+    with open(ruta, encoding='utf-8') as archivo:
+        try:
+            datos = json.load(archivo)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"JSON inválido: {error}") from error
+    if isinstance(datos, dict):
+        datos = resolver_referencias(datos, os.path.dirname(ruta))
+    return problema_desde_dict(datos)
+
+
+def extension_modelo(ruta):
+    """Extensión de un archivo de modelo en minúsculas, sin el .gz final."""
+    ruta = ruta[:-3] if ruta.lower().endswith('.gz') else ruta
+    return os.path.splitext(ruta)[1].lower()
+
+
+def problema_desde_dict(datos):
+    """Convierte un diccionario de modelo en ProblemaPL, con errores de clave como ValueError."""
+    if not isinstance(datos, dict):
+        raise ValueError("El modelo debe ser un objeto JSON.")
+    faltantes = [clave for clave in ('c', 'A', 'b') if clave not in datos]
+    if faltantes:
+        raise ValueError(f"Faltan las claves {faltantes} en el modelo.")
+    return ProblemaPL.desde(datos)
+
+
+# ==================================================================================
+# RESULTADOS
+# ==================================================================================
+
+def resultado_a_dict(resultado, problema):
+    """
+    Resumen serializable de un resultado: estado, valor, solución por nombre
+    de variable, precios sombra en el sentido del problema original (con el
+    signo de la minimización ya aplicado) e iteraciones.
+
+    Args:
+        resultado: ResultadoPL de resolver_problema_general
+        problema: ProblemaPL resuelto
+
+    Returns:
+        dict: Valores de Python (float, int, str, list, dict, None)
+    """
+    datos = {
+        'nombre': problema.nombre,
+        'estado': resultado.estado,
+        'valor': None,
+        'solucion': None,
+        'precios_sombra': None,
+        'multiples_optimos': bool(resultado.multiples_optimos),
+        'mensaje': resultado.mensaje,
+    }
+    if resultado.estado == 'optimo':
+        precios_sombra = resultado.precios_sombra[:problema.num_restricciones]
+        if problema.tipo == 'min':
+            precios_sombra = -precios_sombra
+        datos['valor'] = float(resultado.valor)
+        datos['solucion'] = dict(zip(problema.nombres_vars, resultado.solucion.tolist()))
+        datos['precios_sombra'] = precios_sombra.tolist()
+    elif resultado.estado == 'limite':
+        datos['valor'] = float(resultado.valor) if resultado.valor is not None else None
+        datos['motivo_limite'] = resultado.motivo_limite
+    if resultado.metricas is not None:
+        contadores = resultado.metricas.contadores
+        datos['iteraciones'] = contadores['iteraciones_fase_1'] + contadores['iteraciones_fase_2']
+    return datos
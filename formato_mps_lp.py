@@ -0,0 +1,517 @@
+"""
+==================================================================================
+MÓDULO DE FORMATOS MPS Y LP
+==================================================================================
+Lectura y escritura de modelos en MPS libre y en formato LP de CPLEX, para
+intercambiar modelos con otras herramientas. Los lectores recorren el
+archivo línea por línea y guardan cada coeficiente directamente en arreglos
+compactos (array.array) que se entregan a NumPy sin copiarlos; A se arma
+de una vez como matrices.MatrizDispersa.
+
+El modelo del solucionador es max/min c·x con A·x (<=, >=, =) b y x >= 0, así
+que al leer:
+
+- las cotas superiores (y las inferiores positivas) se agregan como filas;
+- los rangos de MPS se agregan como una segunda fila con la otra cota;
+- la integralidad se ignora (se resuelve la relajación lineal);
+- las variables libres o con cota inferior negativa no se admiten.
+==================================================================================
+"""
+
+import gzip
+import math
+import os
+import re
+from array import array
+import numpy as np
+from matrices import MatrizDispersa
+from modelo_pl import ProblemaPL
+
+
+# ==================================================================================
+# ARMADO DEL MODELO
+# ==================================================================================
+
+class _Constructor:
+    """Acumula filas, columnas y coeficientes mientras se lee un archivo."""
+
+    def __init__(self):
+        self.indice_columna = {}
+        self.nombres = []
+        self.costos = array('d')
+        self.filas = array('q')
+        self.columnas = array('q')
+        self.valores = array('d')
+        self.tipos = []
+        self.rhs = []
+        self.cota_inferior = {}
+        self.cota_superior = {}
+
+    def columna(self, nombre):
+        """Índice de la variable nombre (se crea la primera vez que aparece)."""
+        j = self.indice_columna.get(nombre)
+        if j is None:
+            j = self.indice_columna[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+            self.costos.append(0.0)
+        return j
+
+    def modelo(self, nombre, tipo, rangos=None):
+        """
+        Diccionario del problema (con A dispersa), con los rangos y las cotas
+        ya convertidos en filas.
+
+        Raises:
+            ValueError: Si alguna variable es libre o tiene cota inferior negativa
+        """
+        filas = np.frombuffer(self.filas, dtype=np.int64)
+        columnas = np.frombuffer(self.columnas, dtype=np.int64)
+        valores = np.frombuffer(self.valores, dtype=np.float64)
+        tipos, rhs = list(self.tipos), list(self.rhs)
+
+        # Un rango agrega una copia de la fila con la cota que falta
+        if rangos:
+            copias = _filas_de_rangos(rangos, tipos, rhs)
+            mapa = np.full(len(self.tipos), -1, dtype=np.int64)
+            mapa[list(copias)] = np.arange(len(tipos), len(tipos) + len(copias))
+            elegidas = mapa[filas] >= 0
+            filas = np.concatenate([filas, mapa[filas[elegidas]]])
+            columnas = np.concatenate([columnas, columnas[elegidas]])
+            valores = np.concatenate([valores, valores[elegidas]])
+            for tipo_copia, rhs_copia in copias.values():
+                tipos.append(tipo_copia); rhs.append(rhs_copia)
+
+        # Cada cota no trivial es una fila con un solo coeficiente
+        negativas = [self.nombres[j] for j, cota in self.cota_inferior.items() if cota < 0]
+        if negativas:
+            raise ValueError(f"Variables libres o con cota inferior negativa no soportadas: {negativas[:5]}")
+        cotas = []
+        for j in range(len(self.nombres)):
+            inferior, superior = self.cota_inferior.get(j, 0.0), self.cota_superior.get(j, math.inf)
+            if inferior == superior:
+                cotas.append((j, '=', inferior))
+                continue
+            if inferior > 0:
+                cotas.append((j, '>=', inferior))
+            if superior < math.inf:
+                cotas.append((j, '<=', superior))
+        if cotas:
+            filas = np.concatenate([filas, np.arange(len(tipos), len(tipos) + len(cotas))])
+            columnas = np.concatenate([columnas, [j for j, _, _ in cotas]])
+            valores = np.concatenate([valores, np.ones(len(cotas))])
+            tipos += [t for _, t, _ in cotas]
+            rhs += [valor for _, _, valor in cotas]
+
+        A = MatrizDispersa.desde_coo(filas, columnas, valores, (len(tipos), len(self.nombres)))
+        return {'c': np.frombuffer(self.costos, dtype=np.float64), 'A': A, 'b': np.array(rhs, dtype=np.float64),
+                'tipos_restricciones': tipos, 'tipo': tipo, 'nombres_vars': self.nombres, 'nombre': nombre}
+
+
+def _filas_de_rangos(rangos, tipos, rhs):
+    """
+    Aplica los rangos de MPS: cambia el tipo de la fila original si hace falta
+    y retorna {fila a copiar: (tipo, rhs) de la copia}.
+    """
+    copias = {}
+    for i, rango in rangos.items():
+        if tipos[i] == '<=':
+            copias[i] = ('>=', rhs[i] - abs(rango))
+        elif tipos[i] == '>=':
+            copias[i] = ('<=', rhs[i] + abs(rango))
+        elif rango >= 0:
+            tipos[i] = '>='
+            copias[i] = ('<=', rhs[i] + rango)
+        else:
+            tipos[i] = '<='
+            copias[i] = ('>=', rhs[i] + rango)
+    return copias
+
+
+def _abrir(ruta, modo='rt'):
+    """Abre un archivo de texto, comprimido con gzip si termina en .gz."""
+    if ruta.endswith('.gz'):
+        return gzip.open(ruta, modo, encoding='utf-8')
+    return open(ruta, modo, encoding='utf-8')
+
+
+def _nombre_base(ruta):
+    nombre = os.path.basename(ruta)
+    return os.path.splitext(nombre[:-3] if nombre.endswith('.gz') else nombre)[0]
+
+
+def _sentido(palabra):
+    palabra = palabra.lower()
+    if palabra.startswith('max'):
+        return 'max'
+    if palabra.startswith('min'):
+        return 'min'
+    raise ValueError(f"Sentido de optimización desconocido: {palabra}")
+
+
+# ==================================================================================
+# MPS LIBRE
+# ==================================================================================
+
+_TIPOS_FILA_MPS = {'L': '<=', 'G': '>=', 'E': '='}
+_SECCIONES_MPS = ('NAME', 'OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'ENDATA')
+
+
+def leer_mps(ruta):
+    """
+    Lee un modelo en MPS libre (campos separados por espacios; .gz admitido).
+    La primera fila N es el objetivo (las demás se descartan) y sin OBJSENSE
+    se minimiza.
+
+    Returns:
+        dict: Diccionario del problema con A como MatrizDispersa
+
+    Raises:
+        ValueError: Si el archivo no es MPS válido o usa algo no soportado
+    """
+    with _abrir(ruta) as archivo:
+        return _leer_mps(archivo, _nombre_base(ruta))
+
+
+def _leer_mps(lineas, nombre):
+    modelo = _Constructor()
+    indice_fila, rangos = {}, {}
+    seccion, tipo, objetivo = None, 'min', None
+    columna_actual, j = None, -1
+    # Métodos ligados a variables locales: el ciclo de COLUMNS es el que más se repite
+    agregar_fila, agregar_columna, agregar_valor = modelo.filas.append, modelo.columnas.append, modelo.valores.append
+    costos = modelo.costos
+
+    numero = 0
+    try:
+        for numero, linea in enumerate(lineas, start=1):
+            partes = linea.split()
+            if not partes or linea[0] == '*':
+                continue
+            if not linea[0].isspace():
+                seccion = partes[0].upper()
+                if seccion not in _SECCIONES_MPS:
+                    raise ValueError(f"sección desconocida {partes[0]}")
+                if seccion == 'NAME' and len(partes) > 1:
+                    nombre = partes[1]
+                elif seccion == 'OBJSENSE' and len(partes) > 1:
+                    tipo = _sentido(partes[1])
+                elif seccion == 'ENDATA':
+                    break
+                continue
+
+            if seccion == 'COLUMNS':
+                if partes[1] == "'MARKER'":
+                    continue
+                if partes[0] != columna_actual:
+                    columna_actual = partes[0]
+                    j = modelo.columna(columna_actual)
+                for k in range(1, len(partes) - 1, 2):
+                    i = indice_fila[partes[k]]
+                    if i >= 0:
+                        agregar_fila(i); agregar_columna(j); agregar_valor(float(partes[k + 1]))
+                    elif i == -1:
+                        costos[j] += float(partes[k + 1])
+            elif seccion == 'ROWS':
+                if partes[0].upper() == 'N':
+                    indice_fila[partes[1]] = -1 if objetivo is None else -2
+                    objetivo = objetivo or partes[1]
+                else:
+                    indice_fila[partes[1]] = len(modelo.tipos)
+                    modelo.tipos.append(_TIPOS_FILA_MPS[partes[0].upper()])
+                    modelo.rhs.append(0.0)
+            elif seccion in ('RHS', 'RANGES'):
+                # El nombre del conjunto es opcional: los pares van al final
+                for k in range(len(partes) % 2, len(partes), 2):
+                    i = indice_fila[partes[k]]
+                    if i >= 0 and seccion == 'RHS':
+                        modelo.rhs[i] = float(partes[k + 1])
+                    elif i >= 0:
+                        rangos[i] = float(partes[k + 1])
+            elif seccion == 'BOUNDS':
+                _cota_mps(modelo, partes)
+            elif seccion == 'OBJSENSE':
+                tipo = _sentido(partes[0])
+            else:
+                raise ValueError("dato fuera de una sección")
+    except KeyError as error:
+        raise ValueError(f"MPS línea {numero}: nombre no declarado {error}") from None
+    except IndexError:
+        raise ValueError(f"MPS línea {numero}: línea incompleta") from None
+    except ValueError as error:
+        raise ValueError(f"MPS línea {numero}: {error}") from None
+    return modelo.modelo(nombre, tipo, rangos)
+
+
+def _cota_mps(modelo, partes):
+    tipo_cota = partes[0].upper()
+    sin_valor = tipo_cota in ('FR', 'MI', 'PL', 'BV')
+    # [tipo, conjunto, columna, valor] con el conjunto opcional
+    j = modelo.columna(partes[-1] if sin_valor else partes[-2])
+    valor = None if sin_valor else float(partes[-1])
+    if tipo_cota in ('UP', 'UI'):
+        modelo.cota_superior[j] = valor
+    elif tipo_cota in ('LO', 'LI'):
+        modelo.cota_inferior[j] = valor
+    elif tipo_cota == 'FX':
+        modelo.cota_inferior[j] = modelo.cota_superior[j] = valor
+    elif tipo_cota in ('FR', 'MI'):
+        modelo.cota_inferior[j] = -math.inf
+    elif tipo_cota == 'PL':
+        modelo.cota_superior[j] = math.inf
+    elif tipo_cota == 'BV':
+        modelo.cota_inferior[j], modelo.cota_superior[j] = 0.0, 1.0
+    else:
+        raise ValueError(f"tipo de cota no soportado {partes[0]}")
+
+
+def escribir_mps(problema, ruta):
+    """
+    Escribe un problema (ProblemaPL o diccionario, con A densa o dispersa) en
+    MPS libre, con filas R1..Rm, objetivo 'obj' y OBJSENSE.
+    """
+    problema = ProblemaPL.desde(problema)
+    nombres = [_nombre_valido(nombre) for nombre in problema.nombres_vars]
+    filas_A, columnas_A, valores_A = _coordenadas(problema.A)
+    inicios = np.searchsorted(columnas_A, np.arange(problema.num_vars + 1)).tolist()
+    filas_A, valores_A, costos = (filas_A + 1).tolist(), valores_A.tolist(), problema.c.tolist()
+
+    with _abrir(ruta, 'wt') as archivo:
+        archivo.write(f"NAME {_nombre_valido(problema.nombre or _nombre_base(ruta))}\n")
+        archivo.write(f"OBJSENSE\n    {problema.tipo.upper()}\nROWS\n N  obj\n")
+        letras = {'<=': 'L', '>=': 'G', '=': 'E'}
+        archivo.writelines(f" {letras[t]}  R{i + 1}\n" for i, t in enumerate(problema.tipos_restricciones))
+        archivo.write("COLUMNS\n")
+        for j, nombre in enumerate(nombres):
+            pares = [f"R{filas_A[k]} {valores_A[k]!r}" for k in range(inicios[j], inicios[j + 1])]
+            if costos[j] != 0.0 or not pares:
+                pares.insert(0, f"obj {costos[j]!r}")
+            # Dos pares (fila, valor) por línea, como permite el formato
+            archivo.writelines(f"    {nombre} {'   '.join(pares[k:k + 2])}\n" for k in range(0, len(pares), 2))
+        archivo.write("RHS\n")
+        archivo.writelines(f"    RHS R{i + 1} {valor!r}\n" for i, valor in enumerate(problema.b.tolist()) if valor != 0.0)
+        archivo.write("ENDATA\n")
+    return ruta
+
+
+# ==================================================================================
+# FORMATO LP (CPLEX)
+# ==================================================================================
+
+_SECCIONES_LP = {
+    'maximize': 'max', 'maximise': 'max', 'maximum': 'max', 'max': 'max',
+    'minimize': 'min', 'minimise': 'min', 'minimum': 'min', 'min': 'min',
+    'subject to': 'restricciones', 'such that': 'restricciones', 'st': 'restricciones',
+    's.t.': 'restricciones', 'st.': 'restricciones',
+    'bounds': 'cotas', 'bound': 'cotas',
+    'general': 'enteras', 'generals': 'enteras', 'gen': 'enteras',
+    'integer': 'enteras', 'integers': 'enteras',
+    'binary': 'binarias', 'binaries': 'binarias', 'bin': 'binarias',
+    'end': 'fin',
+}
+_OPERADORES_LP = {'<': '<=', '<=': '<=', '=<': '<=', '>': '>=', '>=': '>=', '=>': '>=', '=': '='}
+_TOKEN_LP = re.compile(r"<=|=<|>=|=>|[<>=:+-]|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|[^\s<>=:+\-\[\]\\*^]+")
+_INFINITOS = ('inf', 'infinity')
+
+
+def leer_lp(ruta):
+    """
+    Lee un modelo en formato LP de CPLEX (.gz admitido): objetivo, Subject To,
+    Bounds, Generals/Binaries (como relajación) y End.
+
+    Returns:
+        dict: Diccionario del problema con A como MatrizDispersa
+
+    Raises:
+        ValueError: Si el archivo no es LP válido o usa algo no soportado
+    """
+    with _abrir(ruta) as archivo:
+        return _leer_lp(archivo, _nombre_base(ruta))
+
+
+def _palabra_clave(texto):
+    """(sección, resto de la línea) si la línea empieza con una palabra clave de LP."""
+    minusculas = texto.lower()
+    for clave in ('subject to', 'such that'):
+        if minusculas.startswith(clave):
+            return _SECCIONES_LP[clave], texto[len(clave):]
+    palabras = minusculas.split(None, 1)
+    if palabras and palabras[0] in _SECCIONES_LP and (len(palabras) == 1 or ':' not in palabras[1][:1]):
+        return _SECCIONES_LP[palabras[0]], texto[len(palabras[0]):]
+    return None, texto
+
+
+def _leer_lp(lineas, nombre):
+    modelo = _Constructor()
+    filas, columnas, valores, costos = modelo.filas, modelo.columnas, modelo.valores, modelo.costos
+    seccion, tipo = None, None
+    # Estado de la expresión en curso (puede seguir en varias líneas)
+    signo, coeficiente, constante, operador = 1.0, None, 0.0, None
+
+    numero = 0
+    try:
+        for numero, linea in enumerate(lineas, start=1):
+            texto = linea.split('\\', 1)[0].strip()
+            if not texto:
+                continue
+            clave, texto = _palabra_clave(texto)
+            if clave is not None:
+                if operador is not None:
+                    raise ValueError("restricción sin lado derecho")
+                signo, coeficiente, constante = 1.0, None, 0.0
+                if clave in ('max', 'min'):
+                    tipo = clave
+                    clave = 'objetivo'
+                seccion = clave
+                if seccion == 'fin':
+                    break
+            if '[' in texto or '^' in texto:
+                raise ValueError("los términos cuadráticos no están soportados")
+            tokens = _TOKEN_LP.findall(texto)
+            if not tokens:
+                continue
+
+            if seccion in ('objetivo', 'restricciones'):
+                fila = len(modelo.tipos)
+                k = 0
+                while k < len(tokens):
+                    token = tokens[k]
+                    if k + 1 < len(tokens) and tokens[k + 1] == ':':
+                        k += 2  # etiqueta de la restricción o del objetivo
+                        continue
+                    inicial = token[0]
+                    if inicial in '+-':
+                        signo = -signo if inicial == '-' else signo
+                    elif inicial.isdigit() or inicial == '.':
+                        if operador is not None:
+                            # Lado derecho: cierra la restricción
+                            modelo.tipos.append(operador)
+                            modelo.rhs.append(signo * float(token) - constante)
+                            fila = len(modelo.tipos)
+                            signo, coeficiente, constante, operador = 1.0, None, 0.0, None
+                        else:
+                            coeficiente = float(token) if coeficiente is None else coeficiente * float(token)
+                    elif inicial in '<>=':
+                        if seccion != 'restricciones':
+                            raise ValueError("operador en el objetivo")
+                        if coeficiente is not None:
+                            constante += signo * coeficiente
+                        operador = _OPERADORES_LP[token]
+                        signo, coeficiente = 1.0, None
+                    else:
+                        j = modelo.columna(token)
+                        valor = signo * (1.0 if coeficiente is None else coeficiente)
+                        if seccion == 'objetivo':
+                            costos[j] += valor
+                        else:
+                            filas.append(fila); columnas.append(j); valores.append(valor)
+                        signo, coeficiente = 1.0, None
+                    k += 1
+            elif seccion == 'cotas':
+                _cota_lp(modelo, tokens)
+            elif seccion == 'enteras':
+                for token in tokens:
+                    modelo.columna(token)
+            elif seccion == 'binarias':
+                for token in tokens:
+                    j = modelo.columna(token)
+                    modelo.cota_inferior[j], modelo.cota_superior[j] = 0.0, 1.0
+            else:
+                raise ValueError("dato fuera de una sección")
+    except ValueError as error:
+        raise ValueError(f"LP línea {numero}: {error}") from None
+    if operador is not None:
+        raise ValueError("LP: la última restricción no tiene lado derecho.")
+    if tipo is None:
+        raise ValueError("LP: falta la sección Maximize o Minimize.")
+    return modelo.modelo(nombre, tipo)
+
+
+def _cota_lp(modelo, tokens):
+    """Una línea de Bounds: 'x <= u', 'l <= x', 'l <= x <= u', 'x = v' o 'x free'."""
+    if len(tokens) == 2 and tokens[1].lower() == 'free':
+        modelo.cota_inferior[modelo.columna(tokens[0])] = -math.inf
+        return
+    # Se unen signos y números (incluido infinito); queda una sola variable
+    partes, signo = [], 1.0
+    for token in tokens:
+        if token in '+-':
+            signo = -signo if token == '-' else signo
+        elif token[0].isdigit() or token[0] == '.' or token.lower() in _INFINITOS:
+            partes.append(signo * (math.inf if token.lower() in _INFINITOS else float(token)))
+            signo = 1.0
+        elif token[0] in '<>=':
+            partes.append(_OPERADORES_LP[token])
+        else:
+            partes.append(token)
+    variables = [k for k, parte in enumerate(partes) if isinstance(parte, str) and parte not in _OPERADORES_LP.values()]
+    operadores = partes[1::2]
+    if len(variables) != 1 or len(partes) not in (3, 5) or variables[0] % 2 \
+            or any(operador not in ('<=', '>=', '=') for operador in operadores):
+        raise ValueError(f"cota inválida: {' '.join(tokens)}")
+    posicion = variables[0]
+    j = modelo.columna(partes[posicion])
+    for k in range(1, len(partes), 2):
+        operador = partes[k]
+        if k - 1 == posicion:  # x op valor se lee como valor op' x
+            operador, valor = {'<=': '>=', '>=': '<=', '=': '='}[operador], partes[k + 1]
+        else:
+            valor = partes[k - 1]
+        if operador in ('<=', '='):
+            modelo.cota_inferior[j] = valor
+        if operador in ('>=', '='):
+            modelo.cota_superior[j] = valor
+
+
+def escribir_lp(problema, ruta, terminos_por_linea=8):
+    """
+    Escribe un problema (ProblemaPL o diccionario, con A densa o dispersa) en
+    formato LP de CPLEX, con restricciones R1..Rm.
+    """
+    problema = ProblemaPL.desde(problema)
+    nombres = [_nombre_valido(nombre, lp=True) for nombre in problema.nombres_vars]
+    filas_A, columnas_A, valores_A = _coordenadas(problema.A)
+    orden = np.argsort(filas_A, kind='stable')
+    filas_A, columnas_A, valores_A = filas_A[orden], columnas_A[orden].tolist(), valores_A[orden].tolist()
+    inicios = np.searchsorted(filas_A, np.arange(problema.num_restricciones + 1)).tolist()
+
+    def expresion(indices, coeficientes):
+        terminos = [f"{'-' if v < 0 else '+'} {abs(v)!r} {nombres[j]}" for j, v in zip(indices, coeficientes)]
+        if not terminos:
+            terminos = [f"+ 0.0 {nombres[0]}"] if nombres else []
+        return "\n   ".join(" ".join(terminos[k:k + terminos_por_linea])
+                             for k in range(0, len(terminos), terminos_por_linea))
+
+    costos = problema.c.tolist()
+    with _abrir(ruta, 'wt') as archivo:
+        archivo.write(f"\\ Problema: {problema.nombre or _nombre_base(ruta)}\n")
+        archivo.write("Maximize\n" if problema.tipo == 'max' else "Minimize\n")
+        # Todas las variables van en el objetivo (aun con costo 0) para conservar su orden al leer
+        archivo.write(f" obj: {expresion(range(len(costos)), costos)}\nSubject To\n")
+        for i, (tipo, valor) in enumerate(zip(problema.tipos_restricciones, problema.b.tolist())):
+            inicio, fin = inicios[i], inicios[i + 1]
+            archivo.write(f" R{i + 1}: {expresion(columnas_A[inicio:fin], valores_A[inicio:fin])} {tipo} {valor!r}\n")
+        archivo.write("End\n")
+    return ruta
+
+
+# ==================================================================================
+# UTILIDADES DE ESCRITURA
+# ==================================================================================
+
+def _coordenadas(A):
+    """(filas, columnas, valores) de los no nulos de A, ordenados por columna."""
+    if isinstance(A, MatrizDispersa):
+        return np.asarray(A.filas, dtype=np.int64), A.columnas, A.datos
+    A = np.asarray(A, dtype=np.float64)
+    columnas, filas = np.nonzero(A.T)
+    return filas, columnas, A[filas, columnas]
+
+
+def _nombre_valido(nombre, lp=False):
+    """Nombre sin espacios (y, en LP, sin operadores ni un número al inicio)."""
+    nombre = re.sub(r"\s+", "_", str(nombre))
+    if lp:
+        nombre = re.sub(r"[<>=:+\-\[\]\\*^]", "_", nombre)
+        if nombre[:1].isdigit() or nombre[:1] == '.':
+            nombre = '_' + nombre
+    return nombre
@@ -0,0 +1,245 @@
+"""
+==================================================================================
+MÓDULO DE LÍNEA DE COMANDOS
+==================================================================================
+Modo no interactivo para resolver modelos guardados en archivos, pensado
+para tareas programadas y tuberías de la terminal:
+
+    python main.py resolver modelo.json --metodo gran_m --salida resultado.json --silencioso
+    python main.py resolver modelos/ "lote_*.json" --tiempo-maximo 30
+    python main.py flujo modelos.jsonl --salida resultados.jsonl --procesos 4
+    python main.py servir --puerto 8765 --procesos 4
+    python main.py convertir modelo.lp modelo.mps
+
+El código de salida indica el estado (ver CODIGOS_SALIDA).
+==================================================================================
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from flujo_jsonl import resolver_flujo
+from formato_json import leer_modelo, resultado_a_dict
+from formato_mps_lp import escribir_lp, escribir_mps
+from modelo_mapeado import guardar_modelo_npy
+from modelo_pl import LimitesResolucion
+from resolucion_simplex import resolver_problema_general
+
+
+# ==================================================================================
+# CÓDIGOS DE SALIDA
+# ==================================================================================
+
+# 2 lo reserva argparse para errores de uso
+CODIGOS_SALIDA = {
+    'optimo': 0,
+    'error': 1,
+    'infactible': 3,
+    'no_acotado': 4,
+    'limite': 5,
+}
+
+
+# ==================================================================================
+# ARGUMENTOS
+# ==================================================================================
+
+def _crear_parser():
+    parser = argparse.ArgumentParser(
+        prog='main.py', description='Solucionador de programación lineal (Simplex Revisado).',
+        epilog='Sin argumentos se abre el menú interactivo.')
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    resolver = subcomandos.add_parser(
+        'resolver', help='Resuelve uno o varios modelos JSON',
+        description='Resuelve modelos JSON. Códigos de salida: ' +
+                    ', '.join(f"{codigo} {estado}" for estado, codigo in CODIGOS_SALIDA.items()) +
+                    '. Con varios modelos, el código es el del primero que no terminó en óptimo.')
+    resolver.add_argument('modelos', nargs='+',
+                          help='Archivos (JSON, MPS o LP), directorios (se toman sus modelos) o patrones glob')
+    resolver.add_argument('--metodo', '--motor', choices=('dos_fases', 'gran_m'), default='dos_fases',
+                          help='Método para los problemas con artificiales (por defecto: dos_fases)')
+    resolver.add_argument('--salida', metavar='RUTA',
+                          help="Archivo JSON con los resultados ('-' para la salida estándar)")
+    resolver.add_argument('--silencioso', action='store_true',
+                          help='No imprime el resumen por archivo')
+    resolver.add_argument('--max-iteraciones', type=int, default=10000, metavar='N',
+                          help='Pivotes máximos por modelo (por defecto: 10000)')
+    resolver.add_argument('--tiempo-maximo', type=float, metavar='SEG',
+                          help='Segundos máximos por modelo')
+
+    flujo = subcomandos.add_parser(
+        'flujo', help='Resuelve un flujo JSONL (un modelo por línea)',
+        description='Lee un modelo JSON por línea y escribe un resultado JSON por línea, con memoria acotada. '
+                    'Código de salida 1 si alguna línea no se pudo leer.')
+    flujo.add_argument('entrada', nargs='?', default='-', help="Archivo JSONL ('-' o nada: entrada estándar)")
+    flujo.add_argument('--salida', default='-', metavar='RUTA', help="Archivo JSONL de resultados ('-': salida estándar)")
+    flujo.add_argument('--procesos', type=int, metavar='N', help='Procesos de trabajo (por defecto: uno por CPU; 0: ninguno)')
+    flujo.add_argument('--ventana', type=int, metavar='N', help='Lotes en vuelo como máximo (por defecto: 2 por proceso)')
+    flujo.add_argument('--lote', type=int, default=16, metavar='N', help='Líneas por lote (por defecto: 16)')
+    flujo.add_argument('--sin-orden', action='store_true', help='Escribe cada resultado apenas está listo')
+    flujo.add_argument('--metodo', '--motor', choices=('dos_fases', 'gran_m'), default='dos_fases')
+    flujo.add_argument('--max-iteraciones', type=int, default=10000, metavar='N')
+    flujo.add_argument('--tiempo-maximo', type=float, metavar='SEG')
+
+    servir = subcomandos.add_parser(
+        'servir', help='Servicio HTTP/JSON local (ver servicio_http.py)',
+        description='POST /resolver con el problema en JSON; GET /metricas y GET /salud.')
+    servir.add_argument('--host', default='127.0.0.1')
+    servir.add_argument('--puerto', type=int, default=8765)
+    servir.add_argument('--procesos', type=int, metavar='N', help='Procesos de trabajo (por defecto: uno por CPU)')
+    servir.add_argument('--max-cola', type=int, default=1000, metavar='N', help='Peticiones en espera como máximo')
+    servir.add_argument('--cache', type=int, default=1024, metavar='N', help='Resultados en caché (0: sin caché)')
+    servir.add_argument('--tiempo-maximo', type=float, metavar='SEG', help='Segundos por problema por defecto')
+
+    convertir = subcomandos.add_parser(
+        'convertir', help='Convierte un modelo entre JSON, MPS y LP',
+        description='Lee un modelo (JSON, MPS o LP) y lo escribe según la extensión de la salida: .mps o .lp '
+                    '(también .gz), o .json como manifiesto con A dispersa en archivos .npy (ver modelo_mapeado.py).')
+    convertir.add_argument('entrada', help='Modelo a convertir')
+    convertir.add_argument('salida', help='Archivo de salida (.mps, .lp, .mps.gz, .lp.gz o .json)')
+    return parser
+
+
+EXTENSIONES_MODELO = ('.json', '.mps', '.lp', '.mps.gz', '.lp.gz')
+
+
+def expandir_rutas(patrones):
+    """
+    Archivos de modelo de cada argumento: un directorio aporta sus modelos
+    (ver EXTENSIONES_MODELO), un patrón glob sus coincidencias y una ruta se
+    toma tal cual (todo en orden).
+
+    Raises:
+        FileNotFoundError: Si un argumento no corresponde a ningún archivo
+    """
+    rutas = []
+    for patron in patrones:
+        if os.path.isdir(patron):
+            encontradas = sorted(ruta for ruta in glob.glob(os.path.join(patron, '*'))
+                                 if ruta.lower().endswith(EXTENSIONES_MODELO) and os.path.isfile(ruta))
+        elif glob.has_magic(patron):
+            encontradas = sorted(r for r in glob.glob(patron) if os.path.isfile(r))
+        else:
+            encontradas = [patron] if os.path.isfile(patron) else []
+        if not encontradas:
+            raise FileNotFoundError(f"No se encontraron modelos en '{patron}'.")
+        rutas.extend(encontradas)
+    return rutas
+
+
+# ==================================================================================
+# EJECUCIÓN
+# ==================================================================================
+
+def resolver_archivo(ruta, metodo='dos_fases', limites=None):
+    """
+    Lee y resuelve un modelo en modo silencioso, midiendo el tiempo total.
+
+    Returns:
+        dict: Resultado serializable con 'archivo' y 'tiempo_ms'; si el archivo
+              no se pudo leer, estado 'error' y el mensaje
+    """
+    inicio = time.perf_counter()
+    try:
+        problema = leer_modelo(ruta)
+        resultado = resolver_problema_general(problema, silencioso=True, metodo=metodo, limites=limites)
+        datos = resultado_a_dict(resultado, problema)
+    except (OSError, TypeError, ValueError) as error:
+        datos = {'nombre': None, 'estado': 'error', 'mensaje': str(error)}
+    datos = {'archivo': ruta, **datos, 'tiempo_ms': (time.perf_counter() - inicio) * 1000}
+    return datos
+
+
+def _codigo_salida(estados):
+    for estado in estados:
+        if estado != 'optimo':
+            return CODIGOS_SALIDA.get(estado, CODIGOS_SALIDA['error'])
+    return CODIGOS_SALIDA['optimo']
+
+
+def _escribir_salida(ruta, resultados):
+    contenido = json.dumps(resultados[0] if len(resultados) == 1 else resultados, ensure_ascii=False, indent=2)
+    if ruta == '-':
+        sys.stdout.write(contenido + "\n")
+    else:
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(contenido + "\n")
+
+
+def ejecutar_linea_comandos(argumentos=None):
+    """
+    Punto de entrada del modo no interactivo.
+
+    Args:
+        argumentos: Lista de argumentos (por defecto sys.argv[1:])
+
+    Returns:
+        int: Código de salida (ver CODIGOS_SALIDA)
+    """
+    args = _crear_parser().parse_args(argumentos)
+    if args.comando == 'flujo':
+        return _ejecutar_flujo(args)
+    if args.comando == 'convertir':
+        return _ejecutar_convertir(args)
+    if args.comando == 'servir':
+        from servicio_http import servir
+        servir(args.host, args.puerto, procesos=args.procesos, max_cola=args.max_cola, tam_cache=args.cache,
+               tiempo_maximo=args.tiempo_maximo)
+        return CODIGOS_SALIDA['optimo']
+    try:
+        rutas = expandir_rutas(args.modelos)
+    except FileNotFoundError as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return CODIGOS_SALIDA['error']
+
+    limites = LimitesResolucion(args.max_iteraciones, args.tiempo_maximo)
+    resultados = []
+    for ruta in rutas:
+        datos = resolver_archivo(ruta, args.metodo, limites)
+        resultados.append(datos)
+        if datos['estado'] == 'error':
+            print(f"❌ {ruta}: {datos['mensaje']}", file=sys.stderr)
+        if not args.silencioso:
+            valor = f"{datos['valor']:.6g}" if datos.get('valor') is not None else "-"
+            print(f"{ruta}\t{datos['estado']}\t{valor}\t{datos['tiempo_ms']:.3f} ms",
+                  file=sys.stderr if args.salida == '-' else sys.stdout)
+
+    if args.salida is not None:
+        _escribir_salida(args.salida, resultados)
+    return _codigo_salida(d['estado'] for d in resultados)
+
+
+def _ejecutar_flujo(args):
+    entrada = sys.stdin if args.entrada == '-' else open(args.entrada, encoding='utf-8')
+    salida = sys.stdout if args.salida == '-' else open(args.salida, 'w', encoding='utf-8')
+    try:
+        conteo = resolver_flujo(entrada, salida, procesos=args.procesos, ventana=args.ventana, lote=args.lote,
+                                ordenado=not args.sin_orden, metodo=args.metodo,
+                                max_iteraciones=args.max_iteraciones, tiempo_maximo=args.tiempo_maximo)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    print("  ".join(f"{estado}: {cantidad}" for estado, cantidad in sorted(conteo.items())), file=sys.stderr)
+    return CODIGOS_SALIDA['error'] if conteo.get('error') else CODIGOS_SALIDA['optimo']
+
+
+def _ejecutar_convertir(args):
+    salida = args.salida.lower()
+    escritores = {'.mps': escribir_mps, '.mps.gz': escribir_mps, '.lp': escribir_lp, '.lp.gz': escribir_lp,
+                  '.json': lambda problema, ruta: guardar_modelo_npy(problema, ruta, dispersa=True)}
+    escritor = next((escritores[extension] for extension in escritores if salida.endswith(extension)), None)
+    if escritor is None:
+        print(f"❌ Extensión de salida no soportada: {args.salida}", file=sys.stderr)
+        return CODIGOS_SALIDA['error']
+    try:
+        escritor(leer_modelo(args.entrada), args.salida)
+    except (OSError, TypeError, ValueError) as error:
+        print(f"❌ {args.entrada}: {error}", file=sys.stderr)
+        return CODIGOS_SALIDA['error']
+    return CODIGOS_SALIDA['optimo']
@@ -8,6 +8,8 @@ Fecha: Noviembre 2025
 ==================================================================================
 """
 
+import sys
+from time import perf_counter_ns
 import numpy as np
 from manejo_consola import (
     mostrar_menu_principal,
@@ -15,11 +17,19 @@ from manejo_consola import (
     ingresar_problema_completo,
     generar_problema_ejemplo_2d,
     generar_problema_complejo,
-    confirmar_accion
+    confirmar_accion,
+    ingresar_ventana_tablero,
+    esperar_enter
 )
 from resolucion_simplex import (
     resolver_problema_general,
-    encontrar_siguiente_vertice_optimo
+    encontrar_siguiente_vertice_optimo,
+    resolver_parametrico_objetivo,
+    reoptimizar_con_nueva_restriccion,
+    reoptimizar_sin_restriccion,
+    reoptimizar_con_nueva_variable,
+    reoptimizar_con_coeficiente,
+    reoptimizar_con_nuevo_objetivo
 )
 from visualizacion_grafica import graficar_solucion_2d
 from exportacion_resultados import (
@@ -35,6 +45,14 @@ from problema_definido import (
     obtener_problema_no_acotado,
     obtener_problema_multiples_optimos
 )
+from matrices import (
+    mismas_matrices,
+    agregar_fila,
+    eliminar_fila,
+    agregar_columna,
+    cambiar_coeficiente
+)
+from modelo_pl import ProblemaPL
 from utilidades import mostrar_titulo, mostrar_caja, formatear_numero, Colores
 
 # ==================================================================================
@@ -48,10 +66,13 @@ class ProgramacionLineal:
     """
     
     def __init__(self):
-        self.problema_datos = {}
-        self.resultado_completo = {}
+        self.problema_datos = None
+        self.resultado_completo = None
         self.soluciones_optimas = []  # Almacena todos los vértices óptimos encontrados
         self.pivotes_optimos_usados = [] # Variables no básicas ya usadas para pivotar
+        self.objetivo_pendiente = False  # Solo cambió c: re-optimizar desde la base anterior
+        self.limites = None  # LimitesResolucion de cada resolución (None: límites por defecto)
+        self.ventana = None  # Columnas no básicas del tablero paso a paso (None: tablero completo)
         self.estado = None
 
     @property
@@ -60,33 +81,147 @@ class ProgramacionLineal:
 
     @property
     def valor_optimo(self):
-        return self.resultado_completo.get('valor')
+        return self.resultado_completo.valor if self.resultado_completo is not None else None
 
     def cargar_datos(self, datos):
-        """Carga los datos del problema y resetea el estado."""
+        """
+        Carga los datos del problema y resetea el estado.
+        Si solo cambia la función objetivo se conserva la base óptima anterior,
+        que sigue siendo primal factible, para re-optimizar en caliente.
+        """
+        datos = ProblemaPL.desde(datos)
+        conservar_base = self._hay_base_optima() and self._mismas_restricciones(datos)
         self.problema_datos = datos
-        self.resultado_completo = {}
         self.soluciones_optimas = []
         self.pivotes_optimos_usados = []
-        self.estado = None
+        self.objetivo_pendiente = conservar_base
+        if not conservar_base:
+            self.resultado_completo = None
+            self.estado = None
+
+    def _mismas_restricciones(self, datos):
+        """Indica si datos tiene las mismas restricciones que el problema actual."""
+        actuales = self.problema_datos
+        if actuales is None or datos.num_vars != actuales.num_vars:
+            return False
+        return (mismas_matrices(datos.A, actuales.A)
+                and np.array_equal(datos.b, actuales.b)
+                and datos.tipos_restricciones == actuales.tipos_restricciones)
+
+    def cambiar_objetivo(self, c_nuevo, tipo=None):
+        """
+        Cambia la función objetivo (y opcionalmente max/min) y re-optimiza con el
+        simplex primal desde la base óptima actual, sin repetir la Fase 1.
+        """
+        self.problema_datos.c = np.asarray(c_nuevo, dtype=float)
+        if tipo is not None:
+            self.problema_datos.tipo = tipo
+
+        if not self._hay_base_optima():
+            return self.resolver(silencioso=True)
+
+        self.objetivo_pendiente = False
+        return self._adoptar_resultado(reoptimizar_con_nuevo_objetivo(
+            self.resultado_completo, self.problema_datos.c, self.problema_datos.tipo))
     
-    def resolver(self):
+    def resolver(self, silencioso=False):
         """Resuelve el problema de programación lineal."""
-        if not self.problema_datos:
+        if self.problema_datos is None:
             print("\n❌ No hay datos de problema para resolver.")
             return
 
-        input("\n⏸️  Presione ENTER para iniciar la resolución por Método Simplex...")
+        if self.objetivo_pendiente and silencioso:
+            return self.cambiar_objetivo(self.problema_datos.c)
+        self.objetivo_pendiente = False
+
+        if not silencioso:
+            input("\n⏸️  Presione ENTER para iniciar la resolución por Método Simplex...")
         
-        self.resultado_completo = resolver_problema_general(self.problema_datos)
-        self.estado = self.resultado_completo.get('estado')
+        self.resultado_completo = resolver_problema_general(self.problema_datos, silencioso=silencioso,
+                                                            pausa=esperar_enter, limites=self.limites,
+                                                            ventana=self.ventana)
+        self.estado = self.resultado_completo.estado
+        self.soluciones_optimas = []
+        self.pivotes_optimos_usados = []
         
         if self.estado == 'optimo':
             # Guardar la primera solución encontrada
-            self.soluciones_optimas.append(self.resultado_completo['solucion'])
+            self.soluciones_optimas.append(self.resultado_completo.solucion)
             
             # Realizar análisis de sensibilidad para la primera solución
-            self.analisis_sensibilidad()
+            if not silencioso:
+                self.analisis_sensibilidad()
+        return self.estado
+
+    # ==============================================================================
+    # EDICIÓN INCREMENTAL DEL MODELO (RE-OPTIMIZACIÓN EN CALIENTE)
+    # ==============================================================================
+
+    def _hay_base_optima(self):
+        """Indica si existe una base óptima desde la cual re-optimizar."""
+        return self.estado == 'optimo' and self.resultado_completo.tiene_base
+
+    def _adoptar_resultado(self, nuevo_resultado):
+        """Adopta el resultado re-optimizado, o resuelve desde cero si no fue posible."""
+        if nuevo_resultado is None:
+            return self.resolver(silencioso=True)
+
+        self.resultado_completo = nuevo_resultado
+        self.estado = nuevo_resultado.estado
+        self.soluciones_optimas = [nuevo_resultado.solucion] if self.estado == 'optimo' else []
+        self.pivotes_optimos_usados = []
+        return self.estado
+
+    def agregar_restriccion(self, coeficientes, tipo, valor):
+        """Agrega la restricción coeficientes·x (tipo) valor y re-optimiza con el simplex dual."""
+        coeficientes = np.asarray(coeficientes, dtype=float)
+        datos = self.problema_datos
+        datos.A = agregar_fila(datos.A, coeficientes)
+        datos.b = np.append(datos.b, valor)
+        datos.tipos_restricciones = datos.tipos_restricciones + [tipo]
+
+        if not self._hay_base_optima():
+            return self.resolver(silencioso=True)
+
+        return self._adoptar_resultado(reoptimizar_con_nueva_restriccion(
+            self.resultado_completo, coeficientes, tipo, valor))
+
+    def eliminar_restriccion(self, fila):
+        """Elimina la restricción indicada (índice desde 0) y re-optimiza con el simplex primal."""
+        datos = self.problema_datos
+        datos.A = eliminar_fila(datos.A, fila)
+        datos.b = np.delete(datos.b, fila)
+        datos.tipos_restricciones = [t for i, t in enumerate(datos.tipos_restricciones) if i != fila]
+
+        if not self._hay_base_optima():
+            return self.resolver(silencioso=True)
+
+        return self._adoptar_resultado(reoptimizar_sin_restriccion(self.resultado_completo, fila))
+
+    def agregar_variable(self, costo, columna, nombre=None):
+        """Agrega una variable de decisión y re-optimiza con el simplex primal."""
+        columna = np.asarray(columna, dtype=float)
+        datos = self.problema_datos
+        datos.A = agregar_columna(datos.A, columna)
+        datos.nombres_vars = datos.nombres_vars + [nombre or f"x{datos.num_vars + 1}"]
+        datos.c = np.append(datos.c, costo)
+
+        if not self._hay_base_optima():
+            return self.resolver(silencioso=True)
+
+        return self._adoptar_resultado(reoptimizar_con_nueva_variable(
+            self.resultado_completo, costo, columna, datos.tipo))
+
+    def modificar_coeficiente(self, fila, columna, valor):
+        """Cambia el coeficiente A[fila, columna] y re-optimiza desde la base actual."""
+        datos = self.problema_datos
+        datos.A = cambiar_coeficiente(datos.A, fila, columna, valor)
+
+        if not self._hay_base_optima():
+            return self.resolver(silencioso=True)
+
+        return self._adoptar_resultado(reoptimizar_con_coeficiente(
+            self.resultado_completo, fila, columna, valor))
 
     def buscar_siguiente_optimo(self):
         """Busca y almacena un vértice óptimo adyacente."""
@@ -98,15 +233,15 @@ class ProgramacionLineal:
         if nuevo_resultado:
             self.resultado_completo = nuevo_resultado
             self.pivotes_optimos_usados = pivotes_usados
-            nueva_solucion = nuevo_resultado['solucion']
+            nueva_solucion = nuevo_resultado.solucion
             self.soluciones_optimas.append(nueva_solucion)
 
             # Mostrar la nueva solución encontrada
             mostrar_caja("NUEVA SOLUCIÓN ÓPTIMA ENCONTRADA")
             print("  Variables de decisión:")
-            for i, nombre in enumerate(self.problema_datos['nombres_vars']):
+            for i, nombre in enumerate(self.problema_datos.nombres_vars):
                 print(f"    {nombre} = {formatear_numero(nueva_solucion[i])}")
-            print(f"\n  Mismo valor {self.problema_datos['tipo']} de Z = {formatear_numero(self.valor_optimo)}")
+            print(f"\n  Mismo valor {self.problema_datos.tipo} de Z = {formatear_numero(self.valor_optimo)}")
             return True
         return False
 
@@ -121,25 +256,27 @@ class ProgramacionLineal:
         
         mostrar_caja("ANÁLISIS DE SENSIBILIDAD POST-ÓPTIMO")
         
-        # Extraer datos necesarios del resultado
-        base_optima = self.resultado_completo['base']
-        B_inv = self.resultado_completo['B_inv_optima']
-        A_ext = self.resultado_completo['A_ext']
-        c_ext = self.resultado_completo['c_ext']
-        b_preparado = self.resultado_completo['b_preparado']
-        nombres_ext = self.resultado_completo['nombres_ext']
+        # Extraer datos necesarios del resultado (la inversa y los precios sombra
+        # se calculan aquí si no se conservaron; el tiempo va a las métricas)
+        metricas = self.resultado_completo.metricas
+        inicio = perf_counter_ns()
+        base_optima = self.resultado_completo.base
+        B_inv = self.resultado_completo.B_inv_optima
+        precios_sombra = self.resultado_completo.precios_sombra
+        A_ext = self.resultado_completo.A_ext
+        c_ext = self.resultado_completo.c_ext
+        simbolos = self.resultado_completo.simbolos
+        if metricas is not None:
+            metricas.acumular('sensibilidad', inicio)
         
-        tipo = self.problema_datos['tipo']
-        num_restricciones = self.problema_datos['num_restricciones']
+        tipo = self.problema_datos.tipo
+        num_restricciones = self.problema_datos.num_restricciones
         
         # 1. PRECIOS SOMBRA (Variables Duales)
         print("┌" + "─"*78 + "┐")
         print("│" + " "*20 + "1. PRECIOS SOMBRA (π)" + " "*36 + "│")
         print("└" + "─"*78 + "┘\n")
         
-        c_B = c_ext[base_optima]
-        precios_sombra = c_B @ B_inv
-        
         if tipo == 'min':
             precios_sombra = -precios_sombra
         
@@ -166,10 +303,12 @@ class ProgramacionLineal:
         print("└" + "─"*78 + "┘\n")
         print("  Indica cuánto puede variar cada b_i sin cambiar la base óptima:\n")
 
-        solucion_basica = self.resultado_completo['solucion_completa'][base_optima]
+        solucion_basica = self.resultado_completo.solucion_completa[base_optima.indices]
 
+        signos_filas = self.resultado_completo.signos_filas
         for i in range(num_restricciones):
-            columna_b_inv = B_inv[:, i]
+            # Columna de B⁻¹ respecto del b_i original (la fila pudo invertirse)
+            columna_b_inv = B_inv[:, i] * signos_filas[i]
             aumentos = []
             disminuciones = []
 
@@ -182,7 +321,7 @@ class ProgramacionLineal:
             aumento_max = min(aumentos) if aumentos else float('inf')
             disminucion_max = min(disminuciones) if disminuciones else float('inf')
 
-            b_actual = self.problema_datos['b'][i]
+            b_actual = self.problema_datos.b[i]
             lim_inf = b_actual - disminucion_max
             lim_sup = b_actual + aumento_max
             
@@ -198,20 +337,22 @@ class ProgramacionLineal:
         print("└" + "─"*78 + "┘\n")
         print("  Indica cuánto puede variar cada c_j sin cambiar la base óptima:\n")
 
-        num_vars_decision = self.problema_datos['num_vars']
-        vars_no_basicas = [i for i in range(A_ext.shape[1]) if i not in base_optima]
+        num_vars_decision = self.problema_datos.num_vars
+        vars_no_basicas = base_optima.no_basicas()
         
         # Fila Z del tablero final (costos reducidos * -1)
-        c_B = c_ext[base_optima]
-        fila_z_final = c_B @ B_inv @ A_ext - c_ext
+        inicio = perf_counter_ns()
+        fila_z_final = c_ext[base_optima.indices] @ B_inv @ A_ext - c_ext
+        if metricas is not None:
+            metricas.acumular('sensibilidad', inicio)
 
         # Variables de decisión
         for j in range(num_vars_decision):
-            c_actual = self.problema_datos['c'][j]
-            nombre_var = self.problema_datos['nombres_vars'][j]
+            c_actual = self.problema_datos.c[j]
+            nombre_var = self.problema_datos.nombres_vars[j]
             
             if j in base_optima: # Variable básica
-                idx_en_base = list(base_optima).index(j)
+                idx_en_base = base_optima.posicion_de(j)
                 # La fila 'j' del tablero final es la fila de B_inv donde está la var 'j' por A_ext
                 fila_tablero_final = B_inv[idx_en_base, :] @ A_ext
                 
@@ -266,12 +407,13 @@ class ProgramacionLineal:
         print("│" + " "*20 + "4. ESTADO DE LAS RESTRICCIONES" + " "*27 + "│")
         print("└" + "─"*78 + "┘\n")
 
-        solucion_completa = self.resultado_completo['solucion_completa']
+        solucion_completa = self.resultado_completo.solucion_completa
         
-        for i in range(len(nombres_ext)):
-            nombre_var = nombres_ext[i]
-            if nombre_var.startswith('s') or nombre_var.startswith('e'):
-                valor_var = solucion_completa[i]
+        for fila in range(simbolos.num_filas):
+            j = simbolos.columna_logica(fila)
+            if j is not None:
+                nombre_var = simbolos[j]
+                valor_var = solucion_completa[j]
                 if abs(valor_var) > 1e-6:
                     print(f"    - Restricción asociada a {nombre_var}: " + Colores.azul("NO ACTIVA") + f", Holgura/Exceso = {formatear_numero(valor_var)}")
                 else:
@@ -285,21 +427,49 @@ class ProgramacionLineal:
         print("  • Precios sombra cero se asocian a restricciones no activas (recurso no es limitante).")
         print("="*80)
 
+    def analisis_parametrico(self, d, lambda_min=0.0, lambda_max=float('inf')):
+        """
+        Programación paramétrica del objetivo c + λ·d.
+        Muestra los vértices óptimos y el intervalo de λ en que cada uno lo es.
+        """
+        if self.problema_datos is None:
+            print("\n❌ No hay datos de problema para analizar.")
+            return None
+
+        resultado = resolver_parametrico_objetivo(self.problema_datos, d, lambda_min, lambda_max)
+        nombres_vars = self.problema_datos.nombres_vars
+
+        mostrar_caja("PROGRAMACIÓN PARAMÉTRICA DEL OBJETIVO (c + λ·d)")
+        for k, intervalo in enumerate(resultado['intervalos'], start=1):
+            lam_inf, lam_sup = intervalo['lambda_inf'], intervalo['lambda_sup']
+            lam_sup_str = formatear_numero(lam_sup) if lam_sup < float('inf') else '∞'
+            punto = ", ".join(f"{nombre}={formatear_numero(intervalo['solucion'][i])}" for i, nombre in enumerate(nombres_vars))
+            print(f"    Vértice {k}: λ ∈ [{formatear_numero(lam_inf)}, {lam_sup_str}]")
+            print(f"       Punto: ({punto})")
+            print(f"       Z(λ) = {formatear_numero(intervalo['valor_c'])} + λ·{formatear_numero(intervalo['valor_d'])}\n")
+
+        if resultado['estado'] == 'no_acotado':
+            print(f"    Para λ > {formatear_numero(resultado['lambda_no_acotado'])} el problema es " + Colores.rojo("NO ACOTADO") + ".")
+        elif resultado['estado'] != 'optimo':
+            print(f"    Estado: {resultado['estado']}")
+
+        return resultado
+
     def mostrar_grafica(self):
         """Muestra la gráfica de la solución (solo 2D)."""
         if self.estado != 'optimo':
             print("\n⚠️  No hay solución óptima para graficar")
             return
         
-        if self.problema_datos.get('num_vars') == 2:
+        if self.problema_datos.num_vars == 2:
             if confirmar_accion("¿Desea ver la solución gráfica?"):
                 graficar_solucion_2d(
-                    self.problema_datos['A'], self.problema_datos['b'], self.problema_datos['c'],
+                    self.problema_datos.A, self.problema_datos.b, self.problema_datos.c,
                     self.soluciones_optimas,  # Pasamos la lista de soluciones
                     self.valor_optimo,
-                    self.problema_datos['tipo'],
-                    self.problema_datos['num_vars'],
-                    self.problema_datos['num_restricciones']
+                    self.problema_datos.tipo,
+                    self.problema_datos.num_vars,
+                    self.problema_datos.num_restricciones
                 )
 
     def guardar_resultado(self):
@@ -313,11 +483,11 @@ class ProgramacionLineal:
             # Guardamos solo la primera solución encontrada en el txt por simplicidad
             guardar_resultado_txt(
                 nombre_archivo,
-                self.problema_datos['c'], self.problema_datos['A'], self.problema_datos['b'],
-                self.problema_datos['tipo'],
-                self.problema_datos['num_vars'],
-                self.problema_datos['num_restricciones'],
-                self.problema_datos['nombres_vars'],
+                self.problema_datos.c, self.problema_datos.A, self.problema_datos.b,
+                self.problema_datos.tipo,
+                self.problema_datos.num_vars,
+                self.problema_datos.num_restricciones,
+                self.problema_datos.nombres_vars,
                 self.solucion_optima,
                 self.valor_optimo,
                 self.estado
@@ -375,10 +545,11 @@ def main():
             continue
         
         pl.cargar_datos(datos)
+        pl.ventana = ingresar_ventana_tablero(pl.problema_datos.num_vars + pl.problema_datos.num_restricciones)
         pl.resolver()
         
         # Si se encontraron múltiples soluciones, preguntar al usuario si desea buscar más
-        if pl.estado == 'optimo' and pl.resultado_completo.get('multiples_optimos'):
+        if pl.estado == 'optimo' and pl.resultado_completo.multiples_optimos:
             while True:
                 if not confirmar_accion("\n❓ Existen múltiples soluciones óptimas. ¿Desea buscar otro vértice óptimo?"):
                     break
@@ -387,7 +558,7 @@ def main():
                 if not encontrado:
                     break
         
-        if pl.problema_datos and pl.problema_datos.get('num_vars') == 2 and pl.estado == 'optimo':
+        if pl.problema_datos is not None and pl.problema_datos.num_vars == 2 and pl.estado == 'optimo':
             print("\n" + "="*80)
             pl.mostrar_grafica()
         
@@ -406,6 +577,10 @@ def main():
 # ==================================================================================
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Modo no interactivo: python main.py resolver ...
+        from linea_comandos import ejecutar_linea_comandos
+        sys.exit(ejecutar_linea_comandos(sys.argv[1:]))
     try:
         main()
     except KeyboardInterrupt:
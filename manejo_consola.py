@@ -302,3 +302,30 @@ def confirmar_accion(mensaje):
         if resp in ['s', 'n']:
             return resp == 's'
         print("⚠️  Por favor ingrese 's' o 'n'")
+
+
+COLUMNAS_TABLERO_COMPLETO = 20  # Con más columnas se ofrece la vista reducida del tablero
+
+
+def ingresar_ventana_tablero(num_columnas):
+    """
+    En modelos anchos, pregunta si el modo paso a paso debe mostrar solo las
+    columnas básicas, la entrante y las k no básicas más atractivas.
+
+    Args:
+        num_columnas: Columnas del tablero (variables de decisión y lógicas)
+
+    Returns:
+        int | None: k elegido, o None para mostrar el tablero completo
+    """
+    if num_columnas <= COLUMNAS_TABLERO_COMPLETO:
+        return None
+    if not confirmar_accion(f"El tablero tiene {num_columnas} columnas. "
+                            "¿Mostrar solo las básicas, la entrante y las no básicas más atractivas?"):
+        return None
+    return validar_numero_positivo("Cantidad de columnas no básicas a mostrar: ")
+
+
+def esperar_enter():
+    """Pausa del modo paso a paso entre iteraciones del simplex."""
+    input("\n⏸️  Presione ENTER para la siguiente iteración...")
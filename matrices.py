@@ -0,0 +1,360 @@
+"""
+==================================================================================
+MÓDULO DE MATRICES SIN COPIA DENSA
+==================================================================================
+Representaciones de la matriz de restricciones para modelos grandes, que el
+simplex usa sin materializarlas como arreglos densos en memoria:
+
+- MatrizDispersa: formato CSC (columnas comprimidas) solo con NumPy; sus
+  arreglos pueden venir de np.load(..., mmap_mode='r') sin copiarse.
+- MatrizExtendida: [A con filas orientadas | holguras, excesos y artificiales]
+  descrita por A y las filas y signos de las columnas lógicas, en lugar de
+  copiar A dentro de una matriz extendida densa.
+
+Ambas responden a lo que pide el simplex revisado: forma, columnas
+(A[:, j], A[:, indices]) y productos por la izquierda (y @ A, B⁻¹ @ A).
+np.asarray las convierte en densas cuando hace falta (p. ej. para mostrar
+el tablero).
+==================================================================================
+"""
+
+import mmap
+import numpy as np
+
+
+def es_matriz_externa(A):
+    """
+    Indica si A no debe copiarse a una matriz densa en memoria: np.memmap
+    (p. ej. de np.load(..., mmap_mode='r')), MatrizDispersa o MatrizExtendida.
+    """
+    return isinstance(A, (np.memmap, MatrizDispersa, MatrizExtendida))
+
+
+def mismas_matrices(A, B):
+    """
+    Indica si A y B son la misma matriz sin convertirlas en densas: las
+    MatrizDispersa se comparan por sus arreglos CSC y los np.memmap por el
+    archivo mapeado (o por identidad si son vistas). Una comparación entre
+    tipos distintos retorna False aunque los valores coincidan.
+    """
+    if A is B:
+        return True
+    if isinstance(A, MatrizDispersa) and isinstance(B, MatrizDispersa):
+        return (A.shape == B.shape and np.array_equal(A.punteros, B.punteros)
+                and np.array_equal(A.filas, B.filas) and np.array_equal(A.datos, B.datos))
+    if isinstance(A, np.memmap) or isinstance(B, np.memmap):
+        return _mismo_archivo(A, B)
+    if type(A) is np.ndarray and type(B) is np.ndarray:
+        return A.shape == B.shape and np.array_equal(A, B)
+    return False
+
+
+def _mismo_archivo(A, B):
+    """Dos np.memmap completos (como los de np.load) del mismo archivo, desplazamiento y forma."""
+    completos = all(isinstance(X, np.memmap) and isinstance(X.base, mmap.mmap) for X in (A, B))
+    return completos and (A.filename, A.offset, A.shape, A.dtype, A.strides) == \
+        (B.filename, B.offset, B.shape, B.dtype, B.strides)
+
+
+def indices_de_rangos(inicios, largos):
+    """Concatenación de range(inicios[k], inicios[k] + largos[k]) para todo k, sin ciclos de Python."""
+    return np.arange(largos.sum()) + np.repeat(inicios - np.cumsum(largos) + largos, largos)
+
+
+def _indices_columnas(clave, total):
+    """Índices de columna de A[:, clave] (entero, lista, máscara o slice) y si es una sola."""
+    if not isinstance(clave, tuple) or len(clave) != 2 or clave[0] != slice(None):
+        raise TypeError("Solo se admite la selección de columnas A[:, columnas].")
+    columnas = clave[1]
+    if isinstance(columnas, (int, np.integer)):
+        return np.array([columnas if columnas >= 0 else total + columnas]), True
+    return np.arange(total)[columnas], False
+
+
+# ==================================================================================
+# MATRIZ DISPERSA (CSC)
+# ==================================================================================
+
+class MatrizDispersa:
+    """
+    Matriz dispersa en formato CSC: los no nulos de la columna j son
+    datos[punteros[j]:punteros[j+1]], en las filas filas[punteros[j]:punteros[j+1]].
+    """
+
+    __slots__ = ('datos', 'filas', 'punteros', 'shape', '_columnas')
+    __array_ufunc__ = None  # y @ A lo resuelve __rmatmul__ y no np.matmul
+    ndim = 2
+
+    def __init__(self, datos, filas, punteros, forma):
+        """
+        Args:
+            datos, filas, punteros: Arreglos CSC (no se copian si ya son
+                                    float64 y enteros, p. ej. mapeados en memoria)
+            forma: (filas, columnas)
+
+        Raises:
+            ValueError: Si los arreglos no son consistentes con la forma
+        """
+        self.datos = np.asarray(datos, dtype=np.float64)
+        self.filas = np.asarray(filas)
+        self.punteros = np.asarray(punteros)
+        self.shape = (int(forma[0]), int(forma[1]))
+        self._columnas = None
+        if self.filas.dtype.kind not in 'iu' or self.punteros.dtype.kind not in 'iu':
+            raise ValueError("Los índices y punteros de la matriz dispersa deben ser enteros.")
+        if len(self.punteros) != self.shape[1] + 1 or len(self.filas) != len(self.datos) \
+                or (len(self.punteros) and int(self.punteros[-1]) != len(self.datos)):
+            raise ValueError(f"Arreglos CSC inconsistentes con la forma {self.shape}.")
+
+    @classmethod
+    def desde_coo(cls, filas, columnas, datos, forma):
+        """Matriz a partir de triples (fila, columna, valor); los repetidos se suman."""
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        datos = np.asarray(datos, dtype=np.float64)
+        m, n = int(forma[0]), int(forma[1])
+        if len(filas) and (filas.min() < 0 or filas.max() >= m or columnas.min() < 0 or columnas.max() >= n):
+            raise ValueError(f"Hay índices fuera de la forma {(m, n)}.")
+        orden = np.lexsort((filas, columnas))
+        filas, columnas, datos = filas[orden], columnas[orden], datos[orden]
+        if len(filas):
+            nuevos = np.empty(len(filas), dtype=bool)
+            nuevos[0] = True
+            nuevos[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+            inicios = np.flatnonzero(nuevos)
+            datos = np.add.reduceat(datos, inicios)
+            filas, columnas = filas[inicios], columnas[inicios]
+        punteros = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columnas, minlength=n), out=punteros[1:])
+        return cls(datos, filas, punteros, (m, n))
+
+    @classmethod
+    def desde_csr(cls, datos, indices, punteros, forma):
+        """Matriz a partir de arreglos CSR (filas comprimidas), convertidos a CSC."""
+        punteros = np.asarray(punteros, dtype=np.int64)
+        filas = np.repeat(np.arange(len(punteros) - 1), np.diff(punteros))
+        return cls.desde_coo(filas, indices, datos, forma)
+
+    @classmethod
+    def desde_densa(cls, A):
+        """Matriz con los no nulos de un arreglo denso."""
+        A = np.asarray(A, dtype=np.float64)
+        columnas, filas = np.nonzero(A.T)
+        return cls.desde_coo(filas, columnas, A[filas, columnas], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.datos)
+
+    @property
+    def columnas(self):
+        """Columna de cada no nulo (se calcula una vez)."""
+        if self._columnas is None:
+            self._columnas = np.repeat(np.arange(self.shape[1]), np.diff(self.punteros))
+        return self._columnas
+
+    # --- Edición (retornan una matriz nueva; los arreglos pueden ser de solo lectura) ---
+
+    def con_fila(self, coeficientes):
+        """Matriz con una fila más al final, de coeficientes densos (largo n)."""
+        coeficientes = np.asarray(coeficientes, dtype=np.float64)
+        if coeficientes.shape != (self.shape[1],):
+            raise ValueError(f"La fila debe tener {self.shape[1]} coeficientes.")
+        no_nulos = np.flatnonzero(coeficientes)
+        # La fila nueva es la última: su valor va al final de cada columna
+        posiciones = self.punteros[no_nulos + 1]
+        agregados = np.zeros(self.shape[1] + 1, dtype=np.int64)
+        agregados[no_nulos + 1] = 1
+        return MatrizDispersa(np.insert(self.datos, posiciones, coeficientes[no_nulos]),
+                              np.insert(np.asarray(self.filas, dtype=np.int64), posiciones, self.shape[0]),
+                              self.punteros + np.cumsum(agregados), (self.shape[0] + 1, self.shape[1]))
+
+    def sin_fila(self, fila):
+        """Matriz sin la fila indicada (índice desde 0)."""
+        if not 0 <= fila < self.shape[0]:
+            raise IndexError(f"La fila {fila} no existe en una matriz de {self.shape[0]} filas.")
+        conservar = self.filas != fila
+        filas = np.asarray(self.filas[conservar], dtype=np.int64)
+        filas -= filas > fila
+        acumulados = np.zeros(self.nnz + 1, dtype=np.int64)
+        np.cumsum(conservar, out=acumulados[1:])
+        return MatrizDispersa(self.datos[conservar], filas, acumulados[self.punteros],
+                              (self.shape[0] - 1, self.shape[1]))
+
+    def con_columna(self, columna):
+        """Matriz con una columna más al final, de coeficientes densos (largo m)."""
+        columna = np.asarray(columna, dtype=np.float64)
+        if columna.shape != (self.shape[0],):
+            raise ValueError(f"La columna debe tener {self.shape[0]} coeficientes.")
+        no_nulos = np.flatnonzero(columna)
+        return MatrizDispersa(np.concatenate([self.datos, columna[no_nulos]]),
+                              np.concatenate([np.asarray(self.filas, dtype=np.int64), no_nulos]),
+                              np.append(self.punteros, self.nnz + len(no_nulos)),
+                              (self.shape[0], self.shape[1] + 1))
+
+    def con_valor(self, fila, columna, valor):
+        """Matriz con A[fila, columna] = valor (un cero elimina el no nulo)."""
+        if not (0 <= fila < self.shape[0] and 0 <= columna < self.shape[1]):
+            raise IndexError(f"({fila}, {columna}) está fuera de la forma {self.shape}.")
+        inicio, fin = int(self.punteros[columna]), int(self.punteros[columna + 1])
+        existentes = np.flatnonzero(self.filas[inicio:fin] == fila) + inicio
+        punteros = np.array(self.punteros, dtype=np.int64)
+        if len(existentes):
+            datos = np.delete(self.datos, existentes[1:])
+            filas = np.delete(np.asarray(self.filas, dtype=np.int64), existentes[1:])
+            punteros[columna + 1:] -= len(existentes) - 1
+            if valor != 0:
+                datos[existentes[0]] = valor
+                return MatrizDispersa(datos, filas, punteros, self.shape)
+            punteros[columna + 1:] -= 1
+            return MatrizDispersa(np.delete(datos, existentes[0]), np.delete(filas, existentes[0]), punteros,
+                                  self.shape)
+        if valor == 0:
+            return self
+        posicion = inicio + int(np.searchsorted(self.filas[inicio:fin], fila))
+        punteros[columna + 1:] += 1
+        return MatrizDispersa(np.insert(self.datos, posicion, valor),
+                              np.insert(np.asarray(self.filas, dtype=np.int64), posicion, fila), punteros, self.shape)
+
+    def __getitem__(self, clave):
+        """A[:, j] como vector denso; A[:, columnas] como matriz densa m x k."""
+        indices, una = _indices_columnas(clave, self.shape[1])
+        inicios = self.punteros[indices]
+        largos = self.punteros[indices + 1] - inicios
+        posiciones = indices_de_rangos(inicios, largos)
+        salida = np.zeros((self.shape[0], len(indices)))
+        np.add.at(salida, (self.filas[posiciones], np.repeat(np.arange(len(indices)), largos)),
+                  self.datos[posiciones])
+        return salida[:, 0] if una else salida
+
+    def __rmatmul__(self, y):
+        """y @ A para y de largo m (o una matriz de k x m)."""
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim == 2:
+            return np.array([self.__rmatmul__(fila) for fila in y]).reshape(len(y), self.shape[1])
+        return np.bincount(self.columnas, weights=self.datos * y[self.filas], minlength=self.shape[1])
+
+    def __matmul__(self, x):
+        """A @ x para x de largo n (o una matriz de n x k)."""
+        if getattr(type(x), '__array_ufunc__', True) is None:
+            return NotImplemented  # p. ej. modelador.Expresion, que resuelve A @ x
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 2:
+            return np.array([self @ columna for columna in x.T]).T.reshape(self.shape[0], x.shape[1])
+        return np.bincount(self.filas, weights=self.datos * x[self.columnas], minlength=self.shape[0])
+
+    def densa(self):
+        """Copia densa (solo para matrices pequeñas)."""
+        return self[:, :]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.densa() if dtype is None else self.densa().astype(dtype)
+
+    def __repr__(self):
+        return f"MatrizDispersa({self.shape[0]}x{self.shape[1]}, nnz={self.nnz})"
+
+
+# ==================================================================================
+# EDICIÓN DE LA MATRIZ DEL PROBLEMA
+# ==================================================================================
+# Una MatrizDispersa se edita con sus propias operaciones y un np.ndarray con
+# NumPy; un np.memmap no se edita, porque copiarlo lo cargaría entero en memoria.
+
+def _exigir_editable(A):
+    if isinstance(A, np.memmap) or not isinstance(A, (np.ndarray, MatrizDispersa)):
+        raise TypeError(f"No se puede editar una A de tipo {type(A).__name__} sin copiarla entera en memoria; "
+                        "conviértala antes con MatrizDispersa.desde_densa(A) o np.array(A).")
+    return isinstance(A, MatrizDispersa)
+
+
+def agregar_fila(A, coeficientes):
+    """A con la fila coeficientes al final."""
+    return A.con_fila(coeficientes) if _exigir_editable(A) else np.vstack([A, coeficientes])
+
+
+def eliminar_fila(A, fila):
+    """A sin la fila indicada (índice desde 0)."""
+    return A.sin_fila(fila) if _exigir_editable(A) else np.delete(A, fila, axis=0)
+
+
+def agregar_columna(A, columna):
+    """A con la columna al final."""
+    return A.con_columna(columna) if _exigir_editable(A) else np.column_stack([A, columna])
+
+
+def cambiar_coeficiente(A, fila, columna, valor):
+    """Copia de A con A[fila, columna] = valor."""
+    if _exigir_editable(A):
+        return A.con_valor(fila, columna, valor)
+    A = A.copy()
+    A[fila, columna] = valor
+    return A
+
+
+# ==================================================================================
+# MATRIZ EXTENDIDA DEL PROBLEMA ESTÁNDAR
+# ==================================================================================
+
+class MatrizExtendida:
+    """
+    Matriz [S·A | L] del problema estándar sin copiar A: S son los signos de
+    las filas (las filas con b < 0 se invierten) y L las columnas lógicas, cada
+    una con un único ±1 en su fila (+1 holgura o artificial, -1 exceso).
+    """
+
+    __slots__ = ('A', 'signos', 'filas_logicas', 'valores_logicos', 'shape')
+    __array_ufunc__ = None  # y @ A_ext lo resuelve __rmatmul__ y no np.matmul
+    ndim = 2
+
+    def __init__(self, A, signos, filas_logicas, valores_logicos):
+        """
+        Args:
+            A: Matriz del problema (np.ndarray, np.memmap o MatrizDispersa)
+            signos: ±1 por fila (None si ninguna se invierte)
+            filas_logicas: Fila de cada columna lógica
+            valores_logicos: Coeficiente (±1) de cada columna lógica
+        """
+        self.A = A
+        self.signos = None if signos is None or not (np.asarray(signos) < 0).any() else np.asarray(signos, dtype=np.float64)
+        self.filas_logicas = np.asarray(filas_logicas, dtype=np.int64)
+        self.valores_logicos = np.asarray(valores_logicos, dtype=np.float64)
+        self.shape = (A.shape[0], A.shape[1] + len(self.filas_logicas))
+
+    def __getitem__(self, clave):
+        """
+        A_ext[:, j] y A_ext[:, indices] son densos. Una máscara que conserva
+        todas las columnas de A retorna otra MatrizExtendida (sin copiar A).
+        """
+        n = self.A.shape[1]
+        columnas = clave[1] if isinstance(clave, tuple) and len(clave) == 2 else None
+        if columnas is not None and clave[0] == slice(None) and getattr(columnas, 'dtype', None) == bool \
+                and len(columnas) == self.shape[1] and columnas[:n].all():
+            logicas = columnas[n:]
+            return MatrizExtendida(self.A, self.signos, self.filas_logicas[logicas], self.valores_logicos[logicas])
+
+        indices, una = _indices_columnas(clave, self.shape[1])
+        salida = np.zeros((self.shape[0], len(indices)))
+        estructurales = indices < n
+        if estructurales.any():
+            bloque = np.asarray(self.A[:, indices[estructurales]], dtype=np.float64)
+            salida[:, estructurales] = bloque if self.signos is None else bloque * self.signos[:, None]
+        logicas = indices[~estructurales] - n
+        salida[self.filas_logicas[logicas], np.flatnonzero(~estructurales)] = self.valores_logicos[logicas]
+        return salida[:, 0] if una else salida
+
+    def __rmatmul__(self, y):
+        """y @ A_ext para y de largo m (o una matriz de k x m, como B⁻¹)."""
+        y = np.asarray(y, dtype=np.float64)
+        orientado = y if self.signos is None else y * self.signos
+        estructural = np.asarray(orientado @ self.A, dtype=np.float64)
+        return np.concatenate([estructural, y[..., self.filas_logicas] * self.valores_logicos], axis=-1)
+
+    def densa(self):
+        """Copia densa (solo para matrices pequeñas)."""
+        return self[:, :]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.densa() if dtype is None else self.densa().astype(dtype)
+
+    def __repr__(self):
+        return f"MatrizExtendida({self.shape[0]}x{self.shape[1]}, A={type(self.A).__name__})"
@@ -0,0 +1,114 @@
+"""
+==================================================================================
+MÓDULO DE MÉTRICAS DE LA RESOLUCIÓN
+==================================================================================
+Tiempos (en nanosegundos, con time.perf_counter_ns) y contadores de cada
+resolución, que se pueden sumar entre varias resoluciones de un lote.
+==================================================================================
+"""
+
+from time import perf_counter_ns
+
+
+# ==================================================================================
+# CAMPOS
+# ==================================================================================
+
+# Los tiempos de factorización, precios y prueba de razón están incluidos en
+# los de las fases; el método compuesto (Gran M) y la fase única cuentan como Fase 2.
+CAMPOS_TIEMPO = ('estandarizacion', 'fase_1', 'fase_2', 'factorizacion', 'precios', 'prueba_razon',
+                 'sensibilidad')
+CAMPOS_CONTADOR = ('iteraciones_fase_1', 'iteraciones_fase_2', 'pivotes_degenerados', 'refactorizaciones',
+                   'desempates_bland')
+
+
+# ==================================================================================
+# CLASE MÉTRICAS
+# ==================================================================================
+
+class MetricasResolucion:
+    """
+    Tiempos y contadores de una resolución (o de la suma de varias).
+
+    Uso dentro del simplex:
+
+        inicio = metricas.reloj()
+        ...
+        metricas.acumular('precios', inicio)
+        metricas.contar('pivotes_degenerados')
+    """
+
+    __slots__ = ('tiempos_ns', 'contadores', 'resoluciones')
+
+    def __init__(self):
+        self.tiempos_ns = dict.fromkeys(CAMPOS_TIEMPO, 0)
+        self.contadores = dict.fromkeys(CAMPOS_CONTADOR, 0)
+        self.resoluciones = 1
+
+    @staticmethod
+    def reloj():
+        return perf_counter_ns()
+
+    def acumular(self, campo, inicio):
+        """Suma al tiempo de campo lo transcurrido desde inicio (valor de reloj())."""
+        self.tiempos_ns[campo] += perf_counter_ns() - inicio
+
+    def contar(self, campo, cantidad=1):
+        self.contadores[campo] += cantidad
+
+    @property
+    def tiempo_total_ns(self):
+        """Estandarización más las fases (los demás tiempos están incluidos en estas)."""
+        return self.tiempos_ns['estandarizacion'] + self.tiempos_ns['fase_1'] + self.tiempos_ns['fase_2']
+
+    def __add__(self, otra):
+        suma = MetricasResolucion()
+        for campo in CAMPOS_TIEMPO:
+            suma.tiempos_ns[campo] = self.tiempos_ns[campo] + otra.tiempos_ns[campo]
+        for campo in CAMPOS_CONTADOR:
+            suma.contadores[campo] = self.contadores[campo] + otra.contadores[campo]
+        suma.resoluciones = self.resoluciones + otra.resoluciones
+        return suma
+
+    @classmethod
+    def sumar(cls, metricas):
+        """Suma las métricas de un lote de resoluciones (se omiten las None)."""
+        total = None
+        for m in metricas:
+            if m is not None:
+                total = m if total is None else total + m
+        return total if total is not None else cls()
+
+    def como_dict(self, por_resolucion=False):
+        """
+        Métricas en un diccionario plano, con los tiempos en milisegundos.
+        Con por_resolucion=True se promedian sobre las resoluciones sumadas.
+        """
+        divisor = self.resoluciones if por_resolucion else 1
+        datos = {f"{campo}_ms": self.tiempos_ns[campo] / 1e6 / divisor for campo in CAMPOS_TIEMPO}
+        datos.update({campo: valor / divisor if por_resolucion else valor for campo, valor in self.contadores.items()})
+        datos['resoluciones'] = self.resoluciones
+        return datos
+
+    def __repr__(self):
+        return (f"MetricasResolucion(total={self.tiempo_total_ns / 1e6:.3f} ms, "
+                f"iteraciones={self.contadores['iteraciones_fase_1']}+{self.contadores['iteraciones_fase_2']})")
+
+
+class _MetricasInactivas:
+    """Sustituto sin costo cuando la instrumentación está desactivada."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def reloj():
+        return 0
+
+    def acumular(self, campo, inicio):
+        pass
+
+    def contar(self, campo, cantidad=1):
+        pass
+
+
+SIN_METRICAS = _MetricasInactivas()
@@ -0,0 +1,349 @@
+"""
+==================================================================================
+MÓDULO MODELADOR ALGEBRAICO
+==================================================================================
+Capa de modelado para generar modelos grandes sin escribir A a mano: arreglos
+de variables con índices, expresiones lineales que se combinan con las reglas
+de difusión (broadcasting) de NumPy y bloques de restricciones que se agregan
+de a muchos. Cada expresión guarda sus términos en arreglos (elemento,
+columna, valor), así que A se arma al final en una sola pasada COO → CSC.
+
+    modelo = Modelo("transporte")
+    x = modelo.variables((origenes, destinos), 'x')
+    modelo.sujeto_a(x.suma(eje=1) <= oferta, x.suma(eje=0) >= demanda)
+    modelo.minimizar((costos * x).suma())
+    resultado = modelo.resolver()
+    envios = x.valor(resultado)
+==================================================================================
+"""
+
+import numpy as np
+from matrices import MatrizDispersa, indices_de_rangos
+from modelo_pl import ProblemaPL
+from resolucion_simplex import resolver_problema_general
+
+
+# ==================================================================================
+# EXPRESIONES LINEALES
+# ==================================================================================
+
+class Expresion:
+    """
+    Arreglo (de forma cualquiera) de expresiones lineales sobre las variables
+    de un Modelo. El término k suma valores[k]·x[columnas[k]] al elemento
+    elementos[k] (índice plano); constante tiene la forma del arreglo.
+
+    Admite +, -, * y / por escalares o arreglos (con difusión), indexado y
+    cortes, suma(eje), reshape, T y productos matriz @ expresión.
+    """
+
+    __slots__ = ('forma', 'elementos', 'columnas', 'valores', 'constante')
+    __array_ufunc__ = None  # arreglo (op) expresión lo resuelve la expresión
+
+    def __init__(self, forma, elementos, columnas, valores, constante=None):
+        self.forma = tuple(forma)
+        self.elementos = np.asarray(elementos, dtype=np.int64)
+        self.columnas = np.asarray(columnas, dtype=np.int64)
+        self.valores = np.asarray(valores, dtype=np.float64)
+        self.constante = np.zeros(self.forma) if constante is None else np.asarray(constante, dtype=np.float64)
+
+    @property
+    def tamano(self):
+        return int(np.prod(self.forma, dtype=np.int64))
+
+    def __len__(self):
+        return self.forma[0]
+
+    def __repr__(self):
+        return f"Expresion(forma={self.forma}, terminos={len(self.valores)})"
+
+    # --- Reorganización de elementos ---
+
+    def _reunir(self, mapa):
+        """
+        Expresión con la forma de mapa cuyo elemento e es el elemento mapa[e]
+        de esta (base del indexado, la difusión, reshape y T).
+        """
+        mapa = np.asarray(mapa, dtype=np.int64)
+        plano = mapa.ravel()
+        constante = self.constante.ravel()[plano].reshape(mapa.shape)
+        if len(plano) == self.tamano and np.array_equal(plano, np.arange(len(plano))):
+            return Expresion(mapa.shape, self.elementos, self.columnas, self.valores, constante)
+        orden = np.argsort(self.elementos, kind='stable')
+        cuenta = np.bincount(self.elementos, minlength=self.tamano)
+        inicios = np.cumsum(cuenta) - cuenta
+        largos = cuenta[plano]
+        terminos = orden[indices_de_rangos(inicios[plano], largos)]
+        return Expresion(mapa.shape, np.repeat(np.arange(len(plano)), largos), self.columnas[terminos],
+                         self.valores[terminos], constante)
+
+    def _indices(self):
+        return np.arange(self.tamano).reshape(self.forma)
+
+    def _difundir(self, forma):
+        forma = tuple(forma)
+        return self if forma == self.forma else self._reunir(np.broadcast_to(self._indices(), forma))
+
+    def __getitem__(self, clave):
+        return self._reunir(self._indices()[clave])
+
+    def reshape(self, *forma):
+        if len(forma) == 1 and isinstance(forma[0], (tuple, list)):
+            forma = forma[0]
+        return self._reunir(self._indices().reshape(forma))
+
+    @property
+    def T(self):
+        return self._reunir(self._indices().T)
+
+    def suma(self, eje=None):
+        """Suma de los elementos (todos, o a lo largo de eje, como np.sum)."""
+        if eje is None:
+            destino = np.zeros(self.forma, dtype=np.int64)
+        else:
+            reducida = np.delete(self.forma, eje)
+            destino = np.expand_dims(np.arange(int(np.prod(reducida))).reshape(reducida), eje)
+        destino = np.broadcast_to(destino, self.forma).ravel()
+        constante = self.constante.sum(axis=eje)
+        return Expresion(np.shape(constante), destino[self.elementos], self.columnas, self.valores, constante)
+
+    def sum(self, axis=None, **_):
+        """Alias de suma para np.sum(expresion, axis)."""
+        return self.suma(axis)
+
+    # --- Aritmética ---
+
+    def __add__(self, otro):
+        if isinstance(otro, Expresion):
+            forma = np.broadcast_shapes(self.forma, otro.forma)
+            a, b = self._difundir(forma), otro._difundir(forma)
+            return Expresion(forma, np.concatenate([a.elementos, b.elementos]),
+                             np.concatenate([a.columnas, b.columnas]),
+                             np.concatenate([a.valores, b.valores]), a.constante + b.constante)
+        otro = np.asarray(otro, dtype=np.float64)
+        forma = np.broadcast_shapes(self.forma, otro.shape)
+        a = self._difundir(forma)
+        return Expresion(forma, a.elementos, a.columnas, a.valores, a.constante + otro)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Expresion(self.forma, self.elementos, self.columnas, -self.valores, -self.constante)
+
+    def __sub__(self, otro):
+        return self + (-otro)
+
+    def __rsub__(self, otro):
+        return (-self) + otro
+
+    def __mul__(self, factor):
+        if isinstance(factor, Expresion):
+            raise TypeError("El producto de dos expresiones no es lineal.")
+        factor = np.asarray(factor, dtype=np.float64)
+        forma = np.broadcast_shapes(self.forma, factor.shape)
+        a = self._difundir(forma)
+        plano = np.broadcast_to(factor, forma).ravel()
+        return Expresion(forma, a.elementos, a.columnas, a.valores * plano[a.elementos], a.constante * factor)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor):
+        return self * (1.0 / np.asarray(divisor, dtype=np.float64))
+
+    def _producto(self, filas, indices, datos, forma):
+        """
+        M @ self para M de forma (m, n) dada por sus no nulos (filas, indices,
+        datos) y self de forma (n, ...): el elemento (i, ...) suma M[i, k]·self[k, ...].
+        """
+        m, n = forma
+        if not self.forma or self.forma[0] != n:
+            raise ValueError(f"Formas incompatibles para el producto: {tuple(forma)} y {self.forma}.")
+        filas = np.asarray(filas, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        datos = np.asarray(datos, dtype=np.float64)
+        resto = self.forma[1:]
+        p = max(int(np.prod(resto, dtype=np.int64)), 1)
+        reunida = self._reunir((indices[:, None] * p + np.arange(p)).reshape((len(datos),) + resto))
+        no_nulo = reunida.elementos // p
+        constante = np.zeros((m, p))
+        np.add.at(constante, filas, datos[:, None] * self.constante.reshape(n, -1)[indices])
+        return Expresion((m,) + resto, filas[no_nulo] * p + reunida.elementos % p, reunida.columnas,
+                         reunida.valores * datos[no_nulo], constante.reshape((m,) + resto))
+
+    def __rmatmul__(self, matriz):
+        """matriz @ expresión, con matriz densa (1-D o 2-D) o MatrizDispersa."""
+        if isinstance(matriz, MatrizDispersa):
+            return self._producto(matriz.filas, matriz.columnas, matriz.datos, matriz.shape)
+        matriz = np.asarray(matriz, dtype=np.float64)
+        vector = matriz.ndim == 1
+        matriz = np.atleast_2d(matriz)
+        filas, indices = np.nonzero(matriz)
+        resultado = self._producto(filas, indices, matriz[filas, indices], matriz.shape)
+        return resultado[0] if vector else resultado
+
+    def __matmul__(self, matriz):
+        """expresión @ matriz para una expresión 1-D: equivale a matriz.T @ expresión."""
+        if len(self.forma) != 1:
+            raise ValueError("expresión @ matriz requiere una expresión 1-D.")
+        if isinstance(matriz, MatrizDispersa):
+            return self._producto(matriz.columnas, matriz.filas, matriz.datos, matriz.shape[::-1])
+        return self.__rmatmul__(np.asarray(matriz, dtype=np.float64).T)
+
+    # --- Restricciones ---
+
+    def _bloque(self, sentido, otro):
+        if isinstance(otro, Expresion):
+            return BloqueRestricciones(self - otro, sentido, 0.0)
+        return BloqueRestricciones(self, sentido, otro)
+
+    def __le__(self, otro):
+        return self._bloque('<=', otro)
+
+    def __ge__(self, otro):
+        return self._bloque('>=', otro)
+
+    def __eq__(self, otro):
+        return self._bloque('=', otro)
+
+    __hash__ = None
+
+    # --- Evaluación ---
+
+    def valor(self, solucion):
+        """
+        Valor de la expresión para una solución (arreglo con un valor por
+        variable del modelo, o un ResultadoPL óptimo del modelo).
+        """
+        solucion = np.asarray(getattr(solucion, 'solucion', solucion), dtype=np.float64)
+        suma = np.bincount(self.elementos, weights=self.valores * solucion[self.columnas], minlength=self.tamano)
+        return suma.reshape(self.forma) + self.constante
+
+
+class BloqueRestricciones:
+    """Arreglo de restricciones expresión (sentido) lado_derecho, una por elemento."""
+
+    __slots__ = ('expresion', 'sentido', 'lado_derecho')
+
+    def __init__(self, expresion, sentido, lado_derecho):
+        lado_derecho = np.asarray(lado_derecho, dtype=np.float64)
+        forma = np.broadcast_shapes(expresion.forma, lado_derecho.shape)
+        self.expresion = expresion._difundir(forma)
+        self.sentido = sentido
+        # La constante de la expresión pasa al lado derecho
+        self.lado_derecho = np.broadcast_to(lado_derecho, forma) - self.expresion.constante
+
+    def __len__(self):
+        return self.expresion.tamano
+
+    def __repr__(self):
+        return f"BloqueRestricciones({self.sentido}, forma={self.expresion.forma})"
+
+
+# ==================================================================================
+# MODELO
+# ==================================================================================
+
+class Modelo:
+    """
+    Modelo de PL armado con variables indexadas y bloques de restricciones.
+    Todas las variables son >= 0 (como en el resto del solucionador); una
+    constante en el objetivo no se incluye en el valor óptimo.
+    """
+
+    def __init__(self, nombre=None):
+        self.nombre = nombre
+        self.nombres_vars = []
+        self.bloques = []
+        self.tipo = 'max'
+        self.objetivo = None
+
+    @property
+    def num_vars(self):
+        return len(self.nombres_vars)
+
+    @property
+    def num_restricciones(self):
+        return sum(len(bloque) for bloque in self.bloques)
+
+    def variables(self, forma, nombre='x'):
+        """
+        Agrega un arreglo de variables (>= 0) y lo retorna como Expresion.
+
+        Args:
+            forma: Entero o tupla con la forma del arreglo
+            nombre: Prefijo de los nombres (x[0,1], x[0,2], ...; x si es escalar)
+        """
+        forma = (forma,) if isinstance(forma, (int, np.integer)) else tuple(forma)
+        tamano = int(np.prod(forma, dtype=np.int64))
+        inicio = self.num_vars
+        if forma:
+            self.nombres_vars.extend(f"{nombre}[{','.join(map(str, indice))}]" for indice in np.ndindex(*forma))
+        else:
+            self.nombres_vars.append(nombre)
+        return Expresion(forma, np.arange(tamano), np.arange(inicio, inicio + tamano), np.ones(tamano))
+
+    def sujeto_a(self, *bloques):
+        """Agrega bloques de restricciones (expresión <= / >= / == lado derecho)."""
+        for bloque in bloques:
+            if not isinstance(bloque, BloqueRestricciones):
+                raise TypeError("Se esperaba una restricción (expresión <=, >= o == valor).")
+            self.bloques.append(bloque)
+        return self
+
+    def maximizar(self, expresion):
+        return self._objetivo('max', expresion)
+
+    def minimizar(self, expresion):
+        return self._objetivo('min', expresion)
+
+    def _objetivo(self, tipo, expresion):
+        if not isinstance(expresion, Expresion) or expresion.tamano != 1:
+            raise ValueError("El objetivo debe ser una expresión escalar (use .suma()).")
+        self.tipo, self.objetivo = tipo, expresion
+        return self
+
+    def como_dict(self, densa=False):
+        """
+        Diccionario del problema (la forma de problema_definido.py). A se arma
+        de una vez con todos los bloques (COO → CSC).
+
+        Args:
+            densa: Si es True, c, A y b son listas (serializable como JSON);
+                   si no, A es una MatrizDispersa y c y b arreglos
+
+        Returns:
+            dict: c, A, b, tipos_restricciones, tipo, nombres_vars y nombre
+        """
+        n = self.num_vars
+        c = np.zeros(n) if self.objetivo is None else \
+            np.bincount(self.objetivo.columnas, weights=self.objetivo.valores, minlength=n)
+        desplazamientos = np.cumsum([0] + [len(bloque) for bloque in self.bloques])
+        filas = [bloque.expresion.elementos + inicio for bloque, inicio in zip(self.bloques, desplazamientos)]
+        A = MatrizDispersa.desde_coo(
+            np.concatenate(filas) if filas else [],
+            np.concatenate([bloque.expresion.columnas for bloque in self.bloques]) if filas else [],
+            np.concatenate([bloque.expresion.valores for bloque in self.bloques]) if filas else [],
+            (int(desplazamientos[-1]), n))
+        b = np.concatenate([bloque.lado_derecho.ravel() for bloque in self.bloques]) if filas else np.zeros(0)
+        tipos = [bloque.sentido for bloque in self.bloques for _ in range(len(bloque))]
+        if densa:
+            c, A, b = c.tolist(), A.densa().tolist(), b.tolist()
+        return {'c': c, 'A': A, 'b': b, 'tipos_restricciones': tipos, 'tipo': self.tipo,
+                'nombres_vars': list(self.nombres_vars), 'nombre': self.nombre}
+
+    def como_problema(self):
+        """ProblemaPL del modelo (con A dispersa)."""
+        return ProblemaPL.desde(self.como_dict())
+
+    def resolver(self, **opciones):
+        """
+        Resuelve el modelo en modo silencioso.
+
+        Args:
+            **opciones: Argumentos de resolver_problema_general (metodo, limites, ...)
+
+        Returns:
+            ResultadoPL: Resultado; los valores de una Expresion se obtienen con valor(resultado)
+        """
+        opciones.setdefault('silencioso', True)
+        return resolver_problema_general(self.como_problema(), **opciones)
@@ -0,0 +1,124 @@
+"""
+==================================================================================
+MÓDULO DE MODELOS EN ARCHIVOS .npy
+==================================================================================
+Modelos grandes guardados como arreglos .npy junto a un JSON que los
+referencia (el manifiesto). Al leerlos, los arreglos se abren con
+np.load(..., mmap_mode='r'): el sistema operativo trae a memoria solo las
+páginas que el simplex recorre y A nunca se copia a una matriz densa.
+
+    {"tipo": "max", "tipos_restricciones": ["<=", ...],
+     "c": "modelo.c.npy", "b": "modelo.b.npy", "A": "modelo.A.npy"}
+
+Una A dispersa se da con sus tres arreglos CSC (o CSR, como los de
+scipy.sparse.csr_matrix: data, indices, indptr):
+
+    "A": {"formato": "csr", "forma": [m, n], "datos": "A.datos.npy",
+          "indices": "A.indices.npy", "punteros": "A.punteros.npy"}
+
+Las rutas son relativas al manifiesto. formato_json.leer_modelo resuelve
+las referencias, así que un manifiesto se usa como cualquier modelo JSON
+(también desde la línea de comandos).
+==================================================================================
+"""
+
+import json
+import os
+import numpy as np
+from matrices import MatrizDispersa
+from modelo_pl import ProblemaPL
+
+
+# ==================================================================================
+# LECTURA
+# ==================================================================================
+
+def cargar_arreglo(ruta):
+    """Abre un .npy mapeado en memoria (solo lectura); los vacíos, que no se pueden mapear, se leen."""
+    try:
+        return np.load(ruta, mmap_mode='r', allow_pickle=False)
+    except ValueError:
+        return np.load(ruta, allow_pickle=False)
+
+
+def resolver_referencias(datos, directorio):
+    """
+    Reemplaza en un diccionario de modelo las referencias a archivos .npy de
+    c, A y b por los arreglos mapeados en memoria.
+
+    Args:
+        datos: Diccionario del modelo (manifiesto o modelo JSON común)
+        directorio: Directorio respecto del cual se resuelven las rutas
+
+    Returns:
+        dict: Copia del diccionario con los arreglos ya abiertos
+
+    Raises:
+        ValueError: Si una referencia de A dispersa está incompleta
+    """
+    datos = dict(datos)
+    for clave in ('c', 'b', 'A'):
+        if isinstance(datos.get(clave), str):
+            datos[clave] = cargar_arreglo(os.path.join(directorio, datos[clave]))
+    if isinstance(datos.get('A'), dict):
+        datos['A'] = _matriz_dispersa(datos['A'], directorio)
+    return datos
+
+
+def _matriz_dispersa(referencia, directorio):
+    formato = referencia.get('formato', 'csc')
+    faltantes = [clave for clave in ('forma', 'datos', 'indices', 'punteros') if clave not in referencia]
+    if faltantes or formato not in ('csc', 'csr'):
+        raise ValueError(f"Referencia de A dispersa inválida (faltan {faltantes}, formato {formato!r}).")
+    datos, indices, punteros = (cargar_arreglo(os.path.join(directorio, referencia[clave]))
+                                for clave in ('datos', 'indices', 'punteros'))
+    if formato == 'csc':
+        return MatrizDispersa(datos, indices, punteros, referencia['forma'])
+    # CSR se pasa a CSC: cuesta una copia de los no nulos, nunca una matriz densa
+    return MatrizDispersa.desde_csr(datos, indices, punteros, referencia['forma'])
+
+
+# ==================================================================================
+# ESCRITURA
+# ==================================================================================
+
+def guardar_modelo_npy(problema, ruta, dispersa=False):
+    """
+    Guarda un problema como manifiesto JSON más arreglos .npy (A en CSC si es
+    una MatrizDispersa o si dispersa=True).
+
+    Args:
+        problema: ProblemaPL o diccionario del modelo
+        ruta: Archivo del manifiesto (p. ej. 'modelos/grande.json'); los .npy
+              se escriben al lado con el mismo prefijo
+        dispersa: Si es True, una A densa se guarda con sus no nulos
+
+    Returns:
+        str: Ruta del manifiesto
+    """
+    problema = ProblemaPL.desde(problema)
+    directorio = os.path.dirname(ruta)
+    prefijo = os.path.splitext(os.path.basename(ruta))[0]
+
+    def guardar(sufijo, arreglo):
+        nombre = f"{prefijo}.{sufijo}.npy"
+        np.save(os.path.join(directorio, nombre), arreglo, allow_pickle=False)
+        return nombre
+
+    A = problema.A
+    if dispersa and not isinstance(A, MatrizDispersa):
+        A = MatrizDispersa.desde_densa(A)
+    if isinstance(A, MatrizDispersa):
+        referencia_A = {'formato': 'csc', 'forma': list(A.shape), 'datos': guardar('A.datos', A.datos),
+                        'indices': guardar('A.indices', A.filas), 'punteros': guardar('A.punteros', A.punteros)}
+    else:
+        referencia_A = guardar('A', A)
+
+    manifiesto = {'nombre': problema.nombre, 'tipo': problema.tipo,
+                  'tipos_restricciones': problema.tipos_restricciones,
+                  'c': guardar('c', problema.c), 'b': guardar('b', problema.b), 'A': referencia_A}
+    if problema.nombres_vars != [f"x{i + 1}" for i in range(problema.num_vars)]:
+        manifiesto['nombres_vars'] = problema.nombres_vars
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(manifiesto, archivo, ensure_ascii=False)
+    return ruta
@@ -0,0 +1,248 @@
+"""
+==================================================================================
+MÓDULO DEL MODELO DE PROGRAMACIÓN LINEAL
+==================================================================================
+Estructuras compactas (con __slots__) para el problema de PL y para el
+resultado del simplex. Los arreglos son float64 contiguos y la matriz del
+modelo se comparte por referencia entre resultados; la inversa de la base y
+los precios sombra se calculan solo cuando se consultan.
+==================================================================================
+"""
+
+import time
+import numpy as np
+from matrices import es_matriz_externa
+
+
+# ==================================================================================
+# PROBLEMA DE PROGRAMACIÓN LINEAL
+# ==================================================================================
+
+class ProblemaPL:
+    """
+    Problema de PL: optimizar c·x sujeto a A·x (tipos) b, x >= 0.
+    """
+
+    __slots__ = ('nombre', 'tipo', 'c', 'A', 'b', 'tipos_restricciones', 'nombres_vars')
+
+    def __init__(self, c, A, b, tipos_restricciones=None, tipo='max', nombres_vars=None, nombre=None):
+        """
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de coeficientes de las restricciones; un np.memmap o una
+               matrices.MatrizDispersa se conservan sin copiar
+            b: Lados derechos
+            tipos_restricciones: '<=', '>=' o '=' por restricción (por defecto todas '<=')
+            tipo: 'max' o 'min'
+            nombres_vars: Nombres de las variables (por defecto x1, x2, ...)
+            nombre: Nombre descriptivo del problema
+
+        Raises:
+            ValueError: Si las dimensiones o los tipos son inconsistentes
+        """
+        self.c = np.ascontiguousarray(c, dtype=np.float64)
+        self.A = A if es_matriz_externa(A) else np.ascontiguousarray(A, dtype=np.float64)
+        self.b = np.ascontiguousarray(b, dtype=np.float64)
+        if self.A.ndim == 1 and self.A.size == 0:
+            self.A = self.A.reshape(0, len(self.c))
+        self.tipos_restricciones = list(tipos_restricciones) if tipos_restricciones is not None else ['<='] * len(self.b)
+        self.tipo = tipo
+        self.nombres_vars = list(nombres_vars) if nombres_vars is not None else [f"x{i + 1}" for i in range(len(self.c))]
+        self.nombre = nombre
+        self._validar()
+
+    @classmethod
+    def desde(cls, datos):
+        """Retorna datos tal cual si ya es un ProblemaPL; si es un diccionario, lo convierte."""
+        if isinstance(datos, cls):
+            return datos
+        return cls(datos['c'], datos['A'], datos['b'], datos.get('tipos_restricciones'),
+                   datos.get('tipo', 'max'), datos.get('nombres_vars'), datos.get('nombre'))
+
+    def _validar(self):
+        if self.A.ndim != 2 or self.A.shape != (len(self.b), len(self.c)):
+            raise ValueError(f"A debe ser de {len(self.b)}x{len(self.c)} y es de {self.A.shape}.")
+        if len(self.tipos_restricciones) != len(self.b):
+            raise ValueError("Debe haber un tipo por restricción.")
+        if any(t not in ('<=', '>=', '=') for t in self.tipos_restricciones):
+            raise ValueError("Los tipos de restricción válidos son '<=', '>=' y '='.")
+        if len(self.nombres_vars) != len(self.c):
+            raise ValueError("Debe haber un nombre por variable.")
+        if self.tipo not in ('max', 'min'):
+            raise ValueError("El tipo de optimización debe ser 'max' o 'min'.")
+
+    @property
+    def num_vars(self):
+        return len(self.c)
+
+    @property
+    def num_restricciones(self):
+        return len(self.b)
+
+    def copia(self, **cambios):
+        """Copia del problema con los campos indicados reemplazados."""
+        campos = {nombre: getattr(self, nombre) for nombre in ('c', 'A', 'b', 'tipos_restricciones',
+                                                              'tipo', 'nombres_vars', 'nombre')}
+        campos.update(cambios)
+        return ProblemaPL(**campos)
+
+    def __repr__(self):
+        return f"ProblemaPL({self.nombre!r}, {self.tipo}, {self.num_restricciones}x{self.num_vars})"
+
+
+# ==================================================================================
+# LÍMITES DE LA RESOLUCIÓN
+# ==================================================================================
+
+MENSAJES_LIMITE = {
+    'iteraciones': 'Se alcanzó el número máximo de iteraciones.',
+    'tiempo': 'Se agotó el tiempo máximo de resolución.',
+    'cancelado': 'La resolución fue cancelada.',
+}
+
+
+class LimitesResolucion:
+    """
+    Presupuesto de una resolución: número máximo de pivotes, tiempo máximo en
+    segundos y una señal de cancelación (cualquier objeto con is_set(), como
+    threading.Event) que se consulta entre pivotes. Un valor None desactiva
+    el límite correspondiente.
+
+    La misma configuración se puede pasar a varias resoluciones a la vez: cada
+    una lleva la cuenta en su propia copia iniciada (ver en_curso).
+    """
+
+    __slots__ = ('max_iteraciones', 'tiempo_maximo', 'cancelacion', 'iteraciones', '_inicio')
+
+    def __init__(self, max_iteraciones=10000, tiempo_maximo=None, cancelacion=None):
+        """
+        Args:
+            max_iteraciones: Número máximo de pivotes de la resolución
+            tiempo_maximo: Tiempo máximo de reloj, en segundos
+            cancelacion: Señal de cancelación cooperativa (p. ej. threading.Event)
+        """
+        self.max_iteraciones = max_iteraciones
+        self.tiempo_maximo = tiempo_maximo
+        self.cancelacion = cancelacion
+        self.iteraciones = 0
+        self._inicio = None
+
+    @classmethod
+    def en_curso(cls, limites):
+        """Retorna limites si ya fue iniciado; si no (o si es None), una copia iniciada."""
+        if limites is not None and limites._inicio is not None:
+            return limites
+        return (limites if limites is not None else cls()).iniciar()
+
+    def iniciar(self):
+        """Copia con los contadores en cero y el reloj en marcha."""
+        nuevo = LimitesResolucion(self.max_iteraciones, self.tiempo_maximo, self.cancelacion)
+        nuevo._inicio = time.perf_counter()
+        return nuevo
+
+    @property
+    def tiempo_transcurrido(self):
+        return time.perf_counter() - self._inicio if self._inicio is not None else 0.0
+
+    def registrar_pivote(self):
+        self.iteraciones += 1
+
+    def motivo_parada(self):
+        """'cancelado', 'iteraciones' o 'tiempo' si se agotó el presupuesto; None si no."""
+        if self.cancelacion is not None and self.cancelacion.is_set():
+            return 'cancelado'
+        if self.max_iteraciones is not None and self.iteraciones >= self.max_iteraciones:
+            return 'iteraciones'
+        if self.tiempo_maximo is not None and self.tiempo_transcurrido >= self.tiempo_maximo:
+            return 'tiempo'
+        return None
+
+
+# ==================================================================================
+# RESULTADO DEL SIMPLEX
+# ==================================================================================
+
+class ResultadoPL:
+    """
+    Resultado del simplex. Solo guarda lo que es O(m) por resultado (base,
+    valores básicos x_B y escalares); A_ext, c_ext, b y la tabla de símbolos
+    son referencias compartidas con el problema estandarizado. La inversa de
+    la base, la solución completa y los precios sombra se derivan al consultarlos.
+
+    Con estado 'limite' el resultado conserva la base alcanzada al agotarse el
+    presupuesto, junto con motivo_limite e infactibilidad (suma de artificiales
+    básicas y de valores básicos negativos), para reanudar o re-optimizar después.
+    """
+
+    __slots__ = ('estado', 'valor', 'base', 'x_B', 'A_ext', 'c_ext', 'b_preparado', 'simbolos',
+                 'c_original', 'multiples_optimos', 'mensaje', 'penalizacion_M', 'filas_redundantes',
+                 'signos_filas', 'motivo_limite', 'infactibilidad', 'metricas', '_B_inv', '_precios_sombra')
+
+    def __init__(self, estado, valor=None, base=None, x_B=None, A_ext=None, c_ext=None, b_preparado=None,
+                 simbolos=None, c_original=None, multiples_optimos=False, mensaje=None, B_inv=None,
+                 signos_filas=None):
+        self.estado = estado
+        self.valor = valor
+        self.base = base
+        self.x_B = x_B
+        self.A_ext = A_ext
+        self.c_ext = c_ext
+        self.b_preparado = b_preparado
+        self.simbolos = simbolos
+        self.c_original = c_original
+        self.multiples_optimos = multiples_optimos
+        self.mensaje = mensaje
+        self.penalizacion_M = None
+        self.filas_redundantes = []
+        self.signos_filas = signos_filas  # -1 en las filas invertidas por tener b < 0
+        self.motivo_limite = None
+        self.infactibilidad = None
+        self.metricas = None  # MetricasResolucion de resolver_problema_general
+        self._B_inv = B_inv
+        self._precios_sombra = None
+
+    def __repr__(self):
+        return f"ResultadoPL({self.estado!r}, valor={self.valor})"
+
+    @property
+    def tiene_base(self):
+        """Indica si el resultado trae una base desde la cual re-optimizar."""
+        return self.base is not None
+
+    @property
+    def B_inv_optima(self):
+        """Inversa de la base; se factoriza en la primera consulta si no se conservó."""
+        if self._B_inv is None:
+            self._B_inv = np.linalg.inv(self.A_ext[:, self.base.indices])
+        return self._B_inv
+
+    @property
+    def solucion_completa(self):
+        """Valores de todas las columnas del problema extendido."""
+        solucion = np.zeros(self.A_ext.shape[1])
+        solucion[self.base.indices] = self.x_B
+        return solucion
+
+    @property
+    def solucion(self):
+        """Valores de las variables de decisión."""
+        solucion = np.zeros(len(self.c_original))
+        en_base = self.base.indices < len(self.c_original)
+        solucion[self.base.indices[en_base]] = self.x_B[en_base]
+        return solucion
+
+    @property
+    def precios_sombra(self):
+        """
+        Variables duales c_B·B⁻¹ en la forma interna de maximización, referidas a
+        las filas del problema original (se deshace la inversión de signo de las
+        filas con b < 0).
+        """
+        if self._precios_sombra is None:
+            duales = self.c_ext[self.base.indices] @ self.B_inv_optima
+            self._precios_sombra = duales if self.signos_filas is None else duales * self.signos_filas
+        return self._precios_sombra
+
+    def liberar_inversa(self):
+        """Descarta la inversa (O(m²)); se vuelve a factorizar si se consulta."""
+        self._B_inv = None
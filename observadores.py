@@ -0,0 +1,271 @@
+"""
+==================================================================================
+MÓDULO DE OBSERVADORES DEL SIMPLEX
+==================================================================================
+Eventos livianos que emite el Simplex Revisado (inicio y fin de fase, cada
+iteración, cada pivote y el final de la resolución) y observadores que los
+presentan en consola: el tablero paso a paso y una línea de progreso.
+==================================================================================
+"""
+
+import sys
+import numpy as np
+from utilidades import Colores, formatear_numero
+
+
+# ==================================================================================
+# EVENTOS
+# ==================================================================================
+
+INICIO_FASE = 'inicio_fase'
+ITERACION = 'iteracion'
+PIVOTE = 'pivote'
+FIN_FASE = 'fin_fase'
+FIN = 'fin'
+
+
+class EventoSimplex:
+    """
+    Evento del simplex. Solo lleva índices y escalares:
+
+    - tipo: INICIO_FASE, ITERACION, PIVOTE, FIN_FASE o FIN;
+    - fase, iteracion;
+    - entrante, saliente, paso: pivote (paso es la razón mínima);
+    - objetivo: valor del objetivo de la fase en la forma interna de
+      maximización (en la Fase 1, la suma de artificiales con signo menos);
+      en FIN, el valor del resultado;
+    - infactibilidad: suma de las artificiales básicas;
+    - estado, multiples_optimos: en FIN_FASE y FIN.
+
+    contexto tiene referencias (sin copias) al estado del simplex para los
+    observadores que dibujan el tablero; solo es válido durante la notificación.
+    En INICIO_FASE trae la base inicial, A, b, c, n, nombres, es_fase_1 y las
+    columnas activas de la fase (ver traza.TrazaSimplex).
+    """
+
+    __slots__ = ('tipo', 'fase', 'iteracion', 'entrante', 'saliente', 'paso', 'objetivo',
+                 'infactibilidad', 'estado', 'multiples_optimos', 'contexto')
+
+    def __init__(self, tipo, fase=None, iteracion=0, entrante=None, saliente=None, paso=None, objetivo=None,
+                 infactibilidad=None, estado=None, multiples_optimos=False, contexto=None):
+        self.tipo = tipo
+        self.fase = fase
+        self.iteracion = iteracion
+        self.entrante = entrante
+        self.saliente = saliente
+        self.paso = paso
+        self.objetivo = objetivo
+        self.infactibilidad = infactibilidad
+        self.estado = estado
+        self.multiples_optimos = multiples_optimos
+        self.contexto = contexto
+
+    def __repr__(self):
+        return f"EventoSimplex({self.tipo!r}, {self.fase!r}, iteracion={self.iteracion})"
+
+    def sin_contexto(self):
+        """Copia sin contexto, que se puede conservar después de la notificación."""
+        return EventoSimplex(self.tipo, self.fase, self.iteracion, self.entrante, self.saliente, self.paso,
+                             self.objetivo, self.infactibilidad, self.estado, self.multiples_optimos)
+
+
+def notificar(observadores, evento):
+    """Entrega el evento a cada observador (cualquier función de un argumento)."""
+    for observador in observadores:
+        observador(evento)
+
+
+# ==================================================================================
+# OBSERVADOR: TABLERO PASO A PASO
+# ==================================================================================
+
+class ObservadorTablero:
+    """
+    Vista de consola del modo paso a paso: encabezado de cada iteración, tablero
+    con la variable entrante y la saliente, y avisos de fin de fase. Si se da
+    pausa, se llama después de mostrar cada pivote. Con ventana=k, en modelos
+    anchos solo se muestran las columnas básicas, la entrante y las k no
+    básicas más atractivas (ver columnas_ventana).
+    """
+
+    def __init__(self, pausa=None, ventana=None):
+        self.pausa = pausa
+        self.ventana = ventana
+
+    def __call__(self, evento):
+        if evento.tipo == ITERACION:
+            print(f"\n{'─'*80}\n  {evento.fase} - ITERACIÓN {evento.iteracion}\n{'─'*80}\n")
+        elif evento.tipo == PIVOTE:
+            ctx = evento.contexto
+            base_futura = ctx['base'].copia()
+            base_futura.reemplazar(ctx['base'].posicion_de(evento.saliente), evento.entrante)
+            self._tablero(evento, evento.entrante, evento.saliente, ctx['costo_entrante'], evento.paso,
+                          [ctx['nombres'][i] for i in base_futura])
+            if self.pausa is not None:
+                self.pausa()
+        elif evento.tipo == FIN_FASE and evento.estado == 'optimo':
+            print("✅ Condición de optimalidad alcanzada.")
+            if evento.multiples_optimos:
+                print(f"  {Colores.verde('ℹ️  NOTA:')} Se ha encontrado una solución óptima, pero existen múltiples soluciones.")
+                print(f"     El tablero final muestra un costo reducido de 0 para al menos una variable no básica.")
+            self._tablero(evento)
+        elif evento.tipo == FIN_FASE and evento.estado == 'no_acotado':
+            self._tablero(evento, evento.entrante)
+            print(f"\n🔵 Entra: {evento.contexto['nombres'][evento.entrante]}, pero no hay variable saliente.")
+        elif evento.tipo == FIN_FASE and evento.estado == 'limite':
+            print(f"⏹️  {evento.contexto['mensaje']}")
+
+    def _tablero(self, evento, *resaltado):
+        ctx = evento.contexto
+        columnas = ctx['columnas']
+        if self.ventana is not None:
+            columnas = columnas_ventana(ctx['base'], ctx['B_inv'], ctx['A'], ctx['c_B'], ctx['c'], self.ventana,
+                                        columnas, evento.entrante)
+        mostrar_tablero_revisado(evento.iteracion, evento.fase, ctx['es_fase_1'], ctx['base'], ctx['B_inv'], ctx['A'],
+                                 ctx['c_B'], ctx['c'], ctx['x_B'], evento.objetivo, ctx['n'], ctx['nombres'],
+                                 *resaltado, columnas=columnas)
+
+
+# ==================================================================================
+# OBSERVADOR: LÍNEA DE PROGRESO
+# ==================================================================================
+
+class ObservadorProgreso:
+    """
+    Línea de progreso que se reescribe en el mismo renglón cada cada pivotes,
+    con la fase, la iteración, el objetivo y la infactibilidad.
+    """
+
+    def __init__(self, cada=10, salida=None):
+        self.cada = cada
+        self.salida = salida if salida is not None else sys.stdout
+
+    def __call__(self, evento):
+        if evento.tipo == PIVOTE and evento.iteracion % self.cada == 0:
+            self.salida.write(f"\r  {evento.fase} │ iteración {evento.iteracion} │ "
+                              f"objetivo {formatear_numero(evento.objetivo, 4)} │ "
+                              f"infactibilidad {formatear_numero(evento.infactibilidad or 0.0, 4)}")
+            self.salida.flush()
+        elif evento.tipo == FIN_FASE:
+            self.salida.write(f"\r  {evento.fase} │ iteración {evento.iteracion} │ {evento.estado}\n")
+            self.salida.flush()
+
+
+# ==================================================================================
+# TABLERO DEL SIMPLEX REVISADO
+# ==================================================================================
+
+def columnas_ventana(base, B_inv, A, c_B, c, k, columnas=None, var_entrante=None):
+    """
+    Columnas de la vista reducida del tablero: las básicas, la entrante y las
+    k no básicas más atractivas (menor z_j - c_j). Para elegirlas solo se
+    calcula la fila de precios π·A - c, no las columnas de B⁻¹·A.
+
+    Returns:
+        np.ndarray: Índices de las columnas, en orden creciente
+    """
+    columnas = np.arange(len(c)) if columnas is None else np.asarray(columnas, dtype=np.intp)
+    candidatas = columnas[base.mascara_no_basicas()[columnas]]
+    costos = (c_B @ B_inv) @ A[:, candidatas] - c[candidatas]
+    mejores = candidatas[np.argsort(costos, kind='stable')[:k]]
+    seleccion = np.union1d(base.indices, mejores)
+    if var_entrante is not None:
+        seleccion = np.union1d(seleccion, [var_entrante])
+    return seleccion
+
+
+def _celda(texto, ancho, color=None):
+    """Texto alineado a la derecha en ancho caracteres; el color no cuenta en el ancho."""
+    relleno = " " * (ancho - len(texto)) if len(texto) < ancho else ""
+    return relleno + (color(texto) if color is not None else texto) + " "
+
+
+def mostrar_tablero_revisado(iteracion, nombre_fase, es_fase_1, base, B_inv, A, c_B, c, x_B, Z, n, nombres_vars_ext, 
+                             var_entrante=None, var_saliente=None, costo_reducido_entrante=None, ratio_min=None, nueva_base_nombres=None,
+                             columnas=None):
+    """
+    Muestra el tablero simplex revisado con formato de 2 decimales y colores.
+    Con columnas se muestran (y se calculan) solo esas columnas de A (ver
+    columnas_ventana). El tablero se arma en un solo texto y se escribe una vez.
+    """
+    m = len(base)
+    columnas = list(range(len(c))) if columnas is None else [int(j) for j in columnas]
+    # Posición de la variable entrante entre las columnas mostradas
+    col_entrante = columnas.index(var_entrante) if var_entrante in columnas else None
+    
+    salida = [f"┌{'─'*78}┐\n│ {f'TABLERO SIMPLEX ({nombre_fase}) - ITERACIÓN {iteracion}':^76} │\n└{'─'*78}┘\n\n"]
+    
+    headers = ['Z'] + [nombres_vars_ext[j] for j in columnas] + ['π'] + ['LD']
+    if es_fase_1: headers[0] = 'W'
+
+    B_inv_A = B_inv @ A[:, columnas]
+    pi = c_B @ B_inv
+    
+    # Mostramos c_j - z_j (negativo del costo reducido) para que coincida con el output deseado
+    fila_Z = [1.0]
+    fila_Z.extend(-(c_B @ B_inv_A - c[columnas]))
+    fila_Z.append(0.0) # Pi
+    fila_Z.append(Z) 
+
+    # Encabezados con colores
+    salida.append("  Var. Base │ ")
+    for j, h in enumerate(headers):
+        salida.append(_celda(h, 8, Colores.azul if col_entrante is not None and j > 0 and (j-1) == col_entrante else None))
+    salida.append("\n  " + "─"*10 + "┼" + "─"*(9 * len(headers)) + "\n")
+
+    # Fila Z/W
+    nombre_obj = 'W' if es_fase_1 else 'Z'
+    salida.append(f"  {nombre_obj:^10}│ ")
+    for j, val in enumerate(fila_Z):
+        salida.append(_celda(formatear_numero(val), 8,
+                             Colores.azul if col_entrante is not None and j == col_entrante + 1 else None))
+    salida.append("\n")
+
+    # Filas de restricciones
+    for i in range(m):
+        var_base_nombre = nombres_vars_ext[base[i]]
+        es_fila_saliente = var_saliente is not None and base[i] == var_saliente
+        
+        nombre_celda = f"{var_base_nombre:^10}"
+        if es_fila_saliente:
+            nombre_celda = nombre_celda.replace(var_base_nombre, Colores.rojo(var_base_nombre), 1)
+        salida.append(f"  {nombre_celda}│ ")
+
+        fila = [0.0]; fila.extend(B_inv_A[i, :]); fila.append(pi[i]); fila.append(x_B[i])
+        for j, val in enumerate(fila):
+            es_col_entrante = col_entrante is not None and j == col_entrante + 1
+            
+            if es_fila_saliente and es_col_entrante: color = Colores.morado
+            elif es_fila_saliente: color = Colores.rojo
+            elif es_col_entrante: color = Colores.azul
+            else: color = None
+            salida.append(_celda(formatear_numero(val), 8, color))
+        salida.append("\n")
+    
+    # --- LEYENDA DETALLADA ---
+    salida.append("\n  Leyenda:\n")
+    if es_fase_1:
+        salida.append(f"    W: Función objetivo (Suma de Artificiales) = {formatear_numero(Z)}\n")
+    else:
+        salida.append(f"    Z: Función objetivo = {formatear_numero(Z)}\n")
+    salida.append(f"    π: Variables duales (precios sombra)\n")
+    salida.append(f"    LD: Lado derecho (valores de variables básicas)\n")
+    salida.append(f"    Base actual: {[nombres_vars_ext[i] for i in base]}\n")
+
+    if var_entrante is not None and costo_reducido_entrante is not None:
+        salida.append(f"\n🔵 Variable entrante: {nombres_vars_ext[var_entrante]}\n")
+        # Se muestra el valor del tablero (c_j - z_j), que es el negativo del costo reducido (z_j - c_j)
+        salida.append(f"   Costo reducido: {formatear_numero(-costo_reducido_entrante)}\n")
+    
+    if var_saliente is not None and ratio_min is not None:
+        try:
+            pos_en_base = base.posicion_de(var_saliente)
+            salida.append(f"🔴 Variable saliente: {nombres_vars_ext[var_saliente]} (posición {pos_en_base} en base)\n")
+        except (ValueError, IndexError):
+            salida.append(f"🔴 Variable saliente: {nombres_vars_ext[var_saliente]}\n")
+        salida.append(f"   Ratio mínimo: {formatear_numero(ratio_min)}\n")
+
+    if nueva_base_nombres:
+        salida.append(f"\n📊 Nueva base: {nueva_base_nombres}\n")
+
+    sys.stdout.write("".join(salida))
@@ -1,4 +1,5 @@
 import numpy as np
+from modelo_pl import ProblemaPL
 from utilidades import formatear_numero
 
 def _mostrar_problema(problema: dict, nombre_problema: str):
@@ -40,21 +41,14 @@ def _mostrar_problema(problema: dict, nombre_problema: str):
     print(f"  {', '.join(nombres)} ≥ 0")
 
 
-def _validar_y_preparar(problema: dict, nombre_problema: str) -> dict:
+def _validar_y_preparar(problema: dict, nombre_problema: str) -> ProblemaPL:
     """
     Función interna para validar las dimensiones de un problema y
-    calcular num_vars y num_restricciones automáticamente.
+    convertirlo en un ProblemaPL (num_vars y num_restricciones se derivan).
     """
     try:
-        problema['num_vars'] = len(problema['c'])
-        problema['num_restricciones'] = len(problema['b'])
-        assert len(problema['A']) == problema['num_restricciones']
-        assert all(len(row) == problema['num_vars'] for row in problema['A'])
-        assert len(problema['tipos_restricciones']) == problema['num_restricciones']
-        assert len(problema['nombres_vars']) == problema['num_vars']
-        # print(f"\n✅ Problema '{nombre_problema}' cargado correctamente.")
-        return problema
-    except (AssertionError, IndexError, TypeError) as e:
+        return ProblemaPL.desde(dict(problema, nombre=nombre_problema))
+    except (ValueError, KeyError, TypeError) as e:
         print(f"\n❌ Error: Las dimensiones del '{nombre_problema}' en 'problema_definido.py' son inconsistentes.")
         print(f"   Detalle del error: {e}")
         return None
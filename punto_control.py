@@ -0,0 +1,155 @@
+"""
+==================================================================================
+MÓDULO DE PUNTOS DE CONTROL
+==================================================================================
+Guarda periódicamente el estado del Simplex Revisado (fase, base, estado de
+las variables e iteración) en un archivo .npz compacto, para poder reanudar
+una resolución larga sin repetir la Fase 1.
+==================================================================================
+"""
+
+import os
+import tempfile
+import time
+import zlib
+import numpy as np
+
+
+# ==================================================================================
+# CLASE PUNTO DE CONTROL
+# ==================================================================================
+
+class PuntoControl:
+    """
+    Configuración y contabilidad de los puntos de control de una resolución.
+
+    Se escribe cada cada_iteraciones pivotes o cada cada_segundos segundos (lo
+    que ocurra primero). El tiempo gastado en escribir se mide y, si supera la
+    fracción sobrecosto_maximo del tiempo de resolución, la escritura se
+    pospone. Como LimitesResolucion, la configuración se puede compartir y
+    cada resolución trabaja sobre su propia copia iniciada (ver en_curso).
+    """
+
+    __slots__ = ('ruta', 'cada_iteraciones', 'cada_segundos', 'sobrecosto_maximo', 'crash', 'huella',
+                 'escrituras', 'tiempo_escritura', '_inicio', '_ultima_iteracion', '_ultimo_instante')
+
+    def __init__(self, ruta, cada_iteraciones=100, cada_segundos=None, sobrecosto_maximo=0.05):
+        """
+        Args:
+            ruta: Archivo .npz donde se guarda el último punto de control
+            cada_iteraciones: Pivotes entre escrituras (None: sin criterio por iteraciones)
+            cada_segundos: Segundos entre escrituras (None: sin criterio por tiempo)
+            sobrecosto_maximo: Fracción máxima del tiempo de resolución dedicada a escribir
+        """
+        self.ruta = os.fspath(ruta)
+        self.cada_iteraciones = cada_iteraciones
+        self.cada_segundos = cada_segundos
+        self.sobrecosto_maximo = sobrecosto_maximo
+        self.crash = False
+        self.huella = 0
+        self.escrituras = 0
+        self.tiempo_escritura = 0.0
+        self._inicio = None
+        self._ultima_iteracion = 0
+        self._ultimo_instante = 0.0
+
+    @classmethod
+    def en_curso(cls, punto_control, A_ext=None, b=None, crash=False):
+        """
+        Retorna punto_control si ya fue iniciado; si no, una copia iniciada para
+        el problema extendido (A_ext, b). Retorna None si no se pidieron puntos
+        de control.
+        """
+        if punto_control is None or punto_control._inicio is not None:
+            return punto_control
+        nuevo = PuntoControl(punto_control.ruta, punto_control.cada_iteraciones,
+                             punto_control.cada_segundos, punto_control.sobrecosto_maximo)
+        nuevo.crash = crash
+        nuevo.huella = huella_problema(A_ext, b) if A_ext is not None else 0
+        nuevo._inicio = nuevo._ultimo_instante = time.perf_counter()
+        return nuevo
+
+    @property
+    def sobrecosto(self):
+        """Fracción del tiempo de resolución gastada en escribir puntos de control."""
+        transcurrido = time.perf_counter() - self._inicio if self._inicio is not None else 0.0
+        return self.tiempo_escritura / transcurrido if transcurrido > 0 else 0.0
+
+    def debe_guardar(self, iteracion):
+        """Indica si toca escribir un punto de control en esta iteración."""
+        if iteracion < self._ultima_iteracion:
+            self._ultima_iteracion = 0  # Empezó otra fase y la numeración volvió a 1
+        por_iteraciones = (self.cada_iteraciones is not None
+                           and iteracion - self._ultima_iteracion >= self.cada_iteraciones)
+        por_tiempo = (self.cada_segundos is not None
+                      and time.perf_counter() - self._ultimo_instante >= self.cada_segundos)
+        return (por_iteraciones or por_tiempo) and self.sobrecosto <= self.sobrecosto_maximo
+
+    def guardar(self, fase, base, iteracion):
+        """
+        Escribe el punto de control de forma atómica: primero a un archivo
+        temporal en el mismo directorio y luego se reemplaza el anterior.
+
+        Args:
+            fase: 'FASE 1', 'FASE 2' o 'FASE ÚNICA'
+            base: BaseSimplex actual
+            iteracion: Número de iteración de la fase
+        """
+        inicio = time.perf_counter()
+        directorio = os.path.dirname(os.path.abspath(self.ruta))
+        descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix='.npz.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                np.savez(archivo, fase=np.str_(fase), base=base.indices, estado=base.estado,
+                         iteracion=np.int64(iteracion), crash=np.bool_(self.crash),
+                         num_columnas=np.int64(base.num_columnas), huella=np.int64(self.huella))
+            os.replace(temporal, self.ruta)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+
+        fin = time.perf_counter()
+        self.escrituras += 1
+        self.tiempo_escritura += fin - inicio
+        self._ultima_iteracion = iteracion
+        self._ultimo_instante = fin
+
+
+# ==================================================================================
+# LECTURA
+# ==================================================================================
+
+def huella_problema(A_ext, b, columnas_por_bloque=4096):
+    """
+    Huella (CRC32) del problema extendido, para validar un punto de control.
+    Una matriz externa (ver matrices.py) se recorre por bloques de columnas
+    sin copiarla entera, así que su huella es distinta de la de A_ext densa.
+    """
+    if isinstance(A_ext, np.ndarray) and not isinstance(A_ext, np.memmap):
+        huella = zlib.crc32(np.ascontiguousarray(A_ext).tobytes())
+    else:
+        huella = 0
+        for inicio in range(0, A_ext.shape[1], columnas_por_bloque):
+            bloque = A_ext[:, inicio:inicio + columnas_por_bloque]
+            huella = zlib.crc32(np.ascontiguousarray(bloque).tobytes(), huella)
+    return zlib.crc32(np.ascontiguousarray(b).tobytes(), huella)
+
+
+def cargar_punto_control(ruta):
+    """
+    Lee un punto de control guardado con PuntoControl.guardar.
+
+    Returns:
+        dict: fase, base, estado, iteracion, crash, num_columnas y huella
+    """
+    with np.load(ruta, allow_pickle=False) as datos:
+        return {
+            'fase': str(datos['fase']),
+            'base': datos['base'].copy(),
+            'estado': datos['estado'].copy(),
+            'iteracion': int(datos['iteracion']),
+            'crash': bool(datos['crash']),
+            'num_columnas': int(datos['num_columnas']),
+            'huella': int(datos['huella']),
+        }
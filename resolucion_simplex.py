@@ -8,329 +8,626 @@ resolver problemas de programación lineal con cualquier tipo de restricción.
 """
 
 import numpy as np
+from base_simplex import BaseSimplex
+from matrices import MatrizExtendida, es_matriz_externa
+from metricas import MetricasResolucion, SIN_METRICAS
+from modelo_pl import ProblemaPL, ResultadoPL, LimitesResolucion, MENSAJES_LIMITE
+from observadores import (
+    EventoSimplex,
+    ObservadorTablero,
+    notificar,
+    INICIO_FASE,
+    ITERACION,
+    PIVOTE,
+    FIN_FASE,
+    FIN
+)
+from punto_control import PuntoControl, cargar_punto_control, huella_problema
+from tabla_simbolos import TablaSimbolos, HOLGURA, EXCESO, ARTIFICIAL, CLASE_POR_TIPO
 from utilidades import (
     Colores,
     formatear_numero,
-    obtener_nombre_variable,
     mostrar_titulo,
     mostrar_caja
 )
 
+METODOS = ('dos_fases', 'gran_m')
+
+
+def construir_base_crash(A, b, tipos_restricciones, n_vars):
+    """
+    Crash triangular (al estilo de Bixby) para reducir el trabajo de la Fase 1.
+
+    Recorre las filas '>=' y '=' (las que necesitarían artificial), de la más
+    dispersa a la más densa, y busca una columna estructural que la cubra. La
+    columna debe ser nula en las filas ya cubiertas, para que la base resultante
+    sea triangular, y debe mantener la solución básica no negativa:
+
+    - las holguras de las filas '<=' deben seguir >= 0;
+    - las filas '=' no cubiertas no pueden quedar con residuo negativo;
+    - una fila '>=' cuyo residuo queda <= 0 se cubre con su variable de exceso.
+
+    Args:
+        A: Matriz de restricciones (con b >= 0)
+        b: Vector de lado derecho
+        tipos_restricciones: Lista de tipos '<=', '>=' o '='
+        n_vars: Número de variables de decisión
+
+    Returns:
+        tuple: (columnas_crash, filas_con_exceso), donde columnas_crash mapea
+               fila -> variable estructural básica y filas_con_exceso es el
+               conjunto de filas '>=' cuya variable de exceso inicia en la base.
+    """
+    m = len(b)
+    residuo = np.array(b, dtype=float)
+    no_nulos = np.abs(A) > 1e-12
+    filas_cubiertas = np.zeros(m, dtype=bool)
+    columnas_usadas = np.zeros(n_vars, dtype=bool)
+    columnas_crash = {}
+    es_menor_igual = np.array([tipo == '<=' for tipo in tipos_restricciones])
+    es_igual = np.array([tipo == '=' for tipo in tipos_restricciones])
+
+    filas = [i for i, tipo in enumerate(tipos_restricciones) if tipo != '<=']
+    for i in sorted(filas, key=lambda i: (no_nulos[i].sum(), i)):
+        if tipos_restricciones[i] == '>=' and residuo[i] <= 1e-9:
+            continue
+
+        candidatas = np.flatnonzero((A[i] > 1e-9) & ~columnas_usadas & ~no_nulos[filas_cubiertas].any(axis=0))
+        for j in sorted(candidatas, key=lambda j: (no_nulos[:, j].sum(), -abs(A[i, j]), j)):
+            paso = residuo[i] / A[i, j]
+            residuo_nuevo = residuo - paso * A[:, j]
+            residuo_nuevo[i] = 0.0
+            bloqueadas = (es_menor_igual | (es_igual & ~filas_cubiertas)) & (residuo_nuevo < -1e-9)
+            if not bloqueadas.any():
+                residuo = residuo_nuevo
+                columnas_crash[i] = j
+                filas_cubiertas[i] = columnas_usadas[j] = True
+                break
+
+    filas_con_exceso = {i for i, tipo in enumerate(tipos_restricciones)
+                        if tipo == '>=' and i not in columnas_crash and residuo[i] <= 1e-9}
+    return columnas_crash, filas_con_exceso
+
+
+def normalizar_signos(A, b, tipos_restricciones, orientar_A=True):
+    """
+    Orienta las filas para que b >= 0 sin modificar los argumentos: una fila con
+    b_i < 0 se multiplica por -1 y su tipo '<=' / '>=' se invierte ('=' se
+    conserva). Solo se copian A, b y los tipos si alguna fila se invierte.
+    Con orientar_A=False, A se retorna tal cual (la orientación queda en signos_filas).
+
+    Returns:
+        tuple: (A, b, tipos_restricciones, signos_filas), donde signos_filas
+               tiene -1.0 en las filas invertidas y 1.0 en las demás.
+    """
+    signos_filas = np.where(b < 0, -1.0, 1.0)
+    if not (signos_filas < 0).any():
+        return A, b, tipos_restricciones, signos_filas
+
+    invertido = {'<=': '>=', '>=': '<=', '=': '='}
+    tipos = [invertido[t] if signo < 0 else t for t, signo in zip(tipos_restricciones, signos_filas)]
+    return A * signos_filas[:, None] if orientar_A else A, b * signos_filas, tipos, signos_filas
 
-def preparar_problema_estandar(c, A, b, tipos_restricciones, tipo_optimizacion, n_vars):
+
+def preparar_problema_estandar(c, A, b, tipos_restricciones, tipo_optimizacion, n_vars, crash=False):
     """
     Convierte un problema de PL a la forma estándar, agregando variables de
-    holgura, exceso y artificiales según sea necesario.
+    holgura, exceso y artificiales según sea necesario. Los argumentos no se
+    modifican; las filas con b < 0 se orientan con normalizar_signos.
+
+    Con crash=True la base inicial se construye con construir_base_crash y solo
+    se agregan artificiales en las filas que quedaron sin cubrir.
+
+    Si A es una matriz externa (np.memmap o MatrizDispersa, ver matrices.py),
+    A_ext es una MatrizExtendida que la usa sin copiarla y no se aplica el
+    crash, que necesita el patrón denso de no nulos de A.
+
+    Returns:
+        tuple: (A_ext, b, base_inicial, simbolos, signos_filas)
     """
     num_restricciones = len(b)
-    
-    # Asegurar que todos los b son positivos
-    for i in range(num_restricciones):
-        if b[i] < 0:
-            b[i] *= -1
-            A[i, :] *= -1
-            tipos_restricciones[i] = '>=' if tipos_restricciones[i] == '<=' else '<='
-
-    holgura_idx, exceso_idx, artificial_idx = [], [], []
-    A_list = [A[:, i] for i in range(A.shape[1])]
+    externa = es_matriz_externa(A)
+    A, b, tipos_restricciones, signos_filas = normalizar_signos(A, b, tipos_restricciones, orientar_A=not externa)
+
+    if crash and not externa:
+        columnas_crash, filas_con_exceso = construir_base_crash(A, b, tipos_restricciones, n_vars)
+    else:
+        columnas_crash, filas_con_exceso = {}, set()
+
+    # Cada columna lógica es unitaria: basta su fila y su coeficiente
+    clases_logicas, filas_logicas, valores_logicos = [], [], []
     base_inicial = [-1] * num_restricciones
     var_idx = n_vars
 
     for i, tipo in enumerate(tipos_restricciones):
         if tipo == '<=':
-            col = np.zeros(num_restricciones); col[i] = 1
-            A_list.append(col); holgura_idx.append(var_idx)
+            clases_logicas.append(HOLGURA); filas_logicas.append(i); valores_logicos.append(1.0)
             base_inicial[i] = var_idx; var_idx += 1
         elif tipo == '>=':
-            col_ex = np.zeros(num_restricciones); col_ex[i] = -1
-            A_list.append(col_ex); exceso_idx.append(var_idx); var_idx += 1
+            clases_logicas.append(EXCESO); filas_logicas.append(i); valores_logicos.append(-1.0)
+            if i in filas_con_exceso:
+                base_inicial[i] = var_idx
+            var_idx += 1
             
-            col_art = np.zeros(num_restricciones); col_art[i] = 1
-            A_list.append(col_art); artificial_idx.append(var_idx)
-            base_inicial[i] = var_idx; var_idx += 1
+            if i in columnas_crash:
+                base_inicial[i] = columnas_crash[i]
+            elif i not in filas_con_exceso:
+                clases_logicas.append(ARTIFICIAL); filas_logicas.append(i); valores_logicos.append(1.0)
+                base_inicial[i] = var_idx; var_idx += 1
         elif tipo == '=':
-            col_art = np.zeros(num_restricciones); col_art[i] = 1
-            A_list.append(col_art); artificial_idx.append(var_idx)
-            base_inicial[i] = var_idx; var_idx += 1
+            if i in columnas_crash:
+                base_inicial[i] = columnas_crash[i]
+            else:
+                clases_logicas.append(ARTIFICIAL); filas_logicas.append(i); valores_logicos.append(1.0)
+                base_inicial[i] = var_idx; var_idx += 1
 
-    A_ext = np.array(A_list).T
-    nombres_ext = [obtener_nombre_variable(i, n_vars, holgura_idx, exceso_idx, artificial_idx) for i in range(A_ext.shape[1])]
+    if externa:
+        A_ext = MatrizExtendida(A, signos_filas, filas_logicas, valores_logicos)
+    else:
+        # Se arma por columnas (orden Fortran): el simplex extrae columnas de A_ext
+        A_ext = np.zeros((var_idx, num_restricciones)).T
+        A_ext[:, :n_vars] = A
+        A_ext[filas_logicas, np.arange(n_vars, var_idx)] = valores_logicos
+    simbolos = TablaSimbolos.construir(n_vars, clases_logicas, filas_logicas, num_restricciones)
     
-    return A_ext, b, base_inicial, holgura_idx, exceso_idx, artificial_idx, nombres_ext
+    return A_ext, b, base_inicial, simbolos, signos_filas
 
 
-def resolver_problema_general(problema):
+def resolver_problema_general(problema, silencioso=False, crash=None, metodo='dos_fases', pausa=None,
+                              limites=None, punto_control=None, reanudar_desde=None, observadores=None,
+                              instrumentar=True, ventana=None):
     """
     Punto de entrada que orquesta la resolución del problema de PL
-    utilizando el método de dos fases si es necesario.
+    utilizando el método de dos fases si es necesario, o el método
+    compuesto de una sola fase (Gran M) con metodo='gran_m'.
+
+    Todo el estado de la resolución es local a la llamada y el problema no se
+    modifica, por lo que se pueden resolver varios problemas en hilos a la vez.
+    Con silencioso=True no se imprime ningún tablero (uso programático); en
+    modo paso a paso, pausa (p. ej. esperar ENTER) se llama entre iteraciones
+    y ventana=k muestra en cada tablero solo las columnas básicas, la entrante
+    y las k no básicas más atractivas (ver ObservadorTablero).
+    La base inicial por crash se usa por defecto solo en modo silencioso, para
+    que el modo paso a paso conserve la Fase 1 de los libros de texto.
+
+    limites (LimitesResolucion) acota los pivotes de todas las fases juntas, el
+    tiempo y permite cancelar; al agotarse se retorna un resultado 'limite'
+    que se puede continuar con reanudar_resolucion.
+
+    punto_control (PuntoControl) guarda periódicamente la fase y la base del
+    simplex revisado; reanudar_desde recibe un punto de control ya leído (ver
+    reanudar_desde_punto_control) y continúa en su fase, sin repetir la Fase 1
+    si ya había terminado. El método de la Gran M no guarda puntos de control.
+
+    observadores recibe los eventos de cada fase y, al terminar, un evento FIN
+    con el estado y el valor del resultado (ver observadores.EventoSimplex).
+
+    Con instrumentar=True (por defecto) el resultado trae en metricas los
+    tiempos y contadores de la resolución (ver metricas.MetricasResolucion);
+    con instrumentar=False no se mide nada y metricas queda en None.
+
+    Raises:
+        ValueError: Si metodo no es 'dos_fases' ni 'gran_m'
     """
-    c_np = np.array(problema['c'], dtype=float)
-    A_np = np.array(problema['A'], dtype=float)
-    b_np = np.array(problema['b'], dtype=float)
-    tipo, n = problema['tipo'], problema['num_vars']
-    tipos_rest = problema.get('tipos_restricciones', ['<='] * len(b_np))
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido {metodo!r}; use 'dos_fases' o 'gran_m'.")
+    metricas = MetricasResolucion() if instrumentar else SIN_METRICAS
+    if reanudar_desde is not None:
+        crash = reanudar_desde['crash']
+    elif crash is None:
+        crash = silencioso
+    problema = ProblemaPL.desde(problema)
+    limites = LimitesResolucion.en_curso(limites)
+    c_np, tipo, n = problema.c, problema.tipo, problema.num_vars
     
-    A_ext, b_prep, base, holgura, exceso, artificiales, nombres_ext = preparar_problema_estandar(
-        c_np, A_np, b_np, tipos_rest, tipo, n)
+    inicio = metricas.reloj()
+    A_ext, b_prep, base, simbolos, signos_filas = preparar_problema_estandar(
+        c_np, problema.A, problema.b, problema.tipos_restricciones, tipo, n, crash=crash)
+    base = BaseSimplex(base, A_ext.shape[1])
+    metricas.acumular('estandarizacion', inicio)
+    es_artificial = simbolos.mascara(ARTIFICIAL)
+    artificiales = np.flatnonzero(es_artificial)
+    punto_control = PuntoControl.en_curso(punto_control, A_ext, b_prep, crash)
+
+    fase_inicial, iteracion_inicial = None, 0
+    if reanudar_desde is not None:
+        _validar_punto_control(reanudar_desde, A_ext, b_prep)
+        base = BaseSimplex(reanudar_desde['base'], A_ext.shape[1])
+        fase_inicial, iteracion_inicial = reanudar_desde['fase'], reanudar_desde['iteracion']
 
-    if not artificiales:
-        mostrar_titulo("FASE ÚNICA (PROBLEMA ESTÁNDAR)")
+    if not es_artificial.any():
+        if not silencioso:
+            mostrar_titulo("FASE ÚNICA (PROBLEMA ESTÁNDAR)")
         c_fase2 = np.hstack([c_np if tipo == 'max' else -c_np, np.zeros(A_ext.shape[1] - n)])
-        resultado = resolver_simplex_revisado("FASE ÚNICA", c_np, A_ext, b_prep, tipo, n, c_fase2, base, artificiales, nombres_ext)
+        inicio = metricas.reloj()
+        resultado = resolver_simplex_revisado("FASE ÚNICA", c_np, A_ext, b_prep, tipo, n, c_fase2, base, artificiales, simbolos,
+                                              silencioso=silencioso, pausa=pausa, ventana=ventana, limites=limites,
+                                              punto_control=punto_control, iteracion_inicial=iteracion_inicial,
+                                              observadores=observadores, metricas=metricas)
+        metricas.acumular('fase_2', inicio)
+    elif metodo == 'gran_m':
+        if not silencioso:
+            mostrar_titulo("MÉTODO DE LA GRAN M (FASE ÚNICA)")
+            print("Objetivo: Optimizar la función objetivo penalizando las variables artificiales.\n")
+        c_ext = np.hstack([c_np if tipo == 'max' else -c_np, np.zeros(A_ext.shape[1] - n)])
+        inicio = metricas.reloj()
+        resultado = resolver_gran_m(A_ext, b_prep, c_ext, c_np, base, simbolos, limites=limites,
+                                    observadores=observadores, metricas=metricas)
+        metricas.acumular('fase_2', inicio)
+
+        if resultado.estado == 'infactible':
+            if not silencioso:
+                print("\n❌ PROBLEMA INFACTIBLE: Las variables artificiales no pueden anularse para ninguna penalización M.")
+            return _terminar(resultado, observadores, metricas)
+        if not silencioso and resultado.estado == 'optimo':
+            print(f"Penalización final: M = {formatear_numero(resultado.penalizacion_M)}")
     else:
-        # --- FASE 1 ---
-        mostrar_titulo("INICIO DE LA FASE 1")
-        print("Objetivo: Minimizar la suma de variables artificiales.\n")
-        c_fase1 = np.array([-1.0 if i in artificiales else 0.0 for i in range(A_ext.shape[1])])
-        
-        fase1_resultado = resolver_simplex_revisado("FASE 1", np.zeros(n), A_ext, b_prep, 'max', n, c_fase1, base, artificiales, nombres_ext, es_fase_1=True)
+        c_orig_fase2 = np.hstack([c_np if tipo == 'max' else -c_np, np.zeros(A_ext.shape[1] - n)])
+        if fase_inicial == 'FASE 2':
+            # La Fase 1 ya había terminado: la base guardada es factible
+            B_inv = None
+            filas_redundantes = [k for k in range(len(base)) if es_artificial[base[k]]]
+        else:
+            # --- FASE 1 ---
+            if not silencioso:
+                mostrar_titulo("INICIO DE LA FASE 1")
+                print("Objetivo: Minimizar la suma de variables artificiales.\n")
+            c_fase1 = -es_artificial.astype(float)
 
-        if fase1_resultado.get('estado') != 'optimo' or abs(fase1_resultado.get('valor', 0)) > 1e-6:
-            print("\n❌ PROBLEMA INFACTIBLE: No se pudo eliminar las variables artificiales en la Fase 1.")
-            return {'estado': 'infactible'}
-        
-        mostrar_titulo("FIN DE LA FASE 1: Solución Factible Encontrada")
-        base = fase1_resultado['base']
+            inicio = metricas.reloj()
+            fase1_resultado = resolver_simplex_revisado("FASE 1", np.zeros(n), A_ext, b_prep, 'max', n, c_fase1, base, artificiales, simbolos,
+                                                        es_fase_1=True, silencioso=silencioso, pausa=pausa, ventana=ventana,
+                                                        limites=limites,
+                                                        punto_control=punto_control, iteracion_inicial=iteracion_inicial,
+                                                        observadores=observadores, metricas=metricas)
+            metricas.acumular('fase_1', inicio)
+            iteracion_inicial = 0
+
+            if fase1_resultado.estado == 'limite':
+                # Se reporta respecto del objetivo original para poder reanudar
+                fase1_resultado.c_ext, fase1_resultado.c_original = c_orig_fase2, c_np
+                fase1_resultado.valor = c_np @ fase1_resultado.solucion
+                fase1_resultado.signos_filas = signos_filas
+                return _terminar(_mostrar_limite(fase1_resultado, silencioso), observadores, metricas)
+
+            if fase1_resultado.estado != 'optimo' or abs(fase1_resultado.valor) > 1e-6:
+                if not silencioso:
+                    print("\n❌ PROBLEMA INFACTIBLE: No se pudo eliminar las variables artificiales en la Fase 1.")
+                return _terminar(ResultadoPL('infactible'), observadores, metricas)
+
+            # Las artificiales básicas en nivel cero salen con pivotes degenerados;
+            # si su fila es redundante se quedan en la base (valen cero siempre)
+            inicio = metricas.reloj()
+            base, B_inv, filas_redundantes = _expulsar_artificiales(
+                A_ext, fase1_resultado.base, fase1_resultado.B_inv_optima, es_artificial)
+            metricas.acumular('fase_1', inicio)
+
+            if not silencioso:
+                mostrar_titulo("FIN DE LA FASE 1: Solución Factible Encontrada")
+                if filas_redundantes:
+                    print(f"Filas redundantes detectadas (posiciones de la base): {filas_redundantes}\n")
 
         # --- FASE 2 ---
-        mostrar_titulo("INICIO DE LA FASE 2")
-        print("Objetivo: Optimizar la función objetivo original.\n")
-        
-        # Eliminar columnas de variables artificiales
-        vars_no_artificiales = sorted(list(set(range(A_ext.shape[1])) - set(artificiales)))
-        A_fase2 = A_ext[:, vars_no_artificiales]
-        nombres_fase2 = [nombres_ext[i] for i in vars_no_artificiales]
+        if not silencioso:
+            mostrar_titulo("INICIO DE LA FASE 2")
+            print("Objetivo: Optimizar la función objetivo original.\n")
         
-        mapa_indices_f2 = {original: nuevo for nuevo, original in enumerate(vars_no_artificiales)}
-        base_fase2 = [mapa_indices_f2[i] for i in base if i in mapa_indices_f2]
+        # Misma matriz y misma inversa: las artificiales solo se excluyen de entrar
+        inicio = metricas.reloj()
+        resultado = resolver_simplex_revisado("FASE 2", c_np, A_ext, b_prep, tipo, n, c_orig_fase2, base, artificiales, simbolos,
+                                              silencioso=silencioso, B_inv=B_inv, columnas_activas=~es_artificial,
+                                              pausa=pausa, ventana=ventana, limites=limites,
+                                              punto_control=punto_control, iteracion_inicial=iteracion_inicial,
+                                              observadores=observadores, metricas=metricas)
+        metricas.acumular('fase_2', inicio)
 
-        c_orig_fase2 = np.hstack([c_np if tipo == 'max' else -c_np, np.zeros(len(holgura) + len(exceso))])
-        
-        resultado = resolver_simplex_revisado("FASE 2", c_np, A_fase2, b_prep, tipo, n, c_orig_fase2, base_fase2, [], nombres_fase2)
+        if resultado.estado == 'optimo':
+            resultado = _descartar_artificiales(resultado, es_artificial)
+            resultado.filas_redundantes = filas_redundantes
 
     # Finalización
-    if resultado.get('estado') == 'optimo':
+    resultado.signos_filas = signos_filas
+    _terminar(resultado, observadores, metricas)
+    if silencioso:
+        return resultado
+
+    if resultado.estado == 'optimo':
         mostrar_solucion_final(
-            resultado['solucion'],
-            resultado['valor'],
+            resultado.solucion,
+            resultado.valor,
             tipo,
-            problema['nombres_vars'],
-            resultado.get('multiples_optimos', False)
+            problema.nombres_vars,
+            resultado.multiples_optimos
         )
-    elif resultado.get('estado') == 'no_acotado':
+    elif resultado.estado == 'no_acotado':
         mostrar_caja("\033[1;31mSOLUCIÓN NO ACOTADA\033[0m")
         print("El problema no tiene una solución finita porque el valor de la función objetivo puede aumentar (o disminuir) indefinidamente.")
+    elif resultado.estado == 'limite':
+        _mostrar_limite(resultado, silencioso)
     
     return resultado
 
 
-def seleccionar_variable_entrante(costos_reducidos, base, nombres_vars):
+def _terminar(resultado, observadores, metricas=SIN_METRICAS):
+    """Adjunta las métricas al resultado y notifica el evento FIN con su estado y valor."""
+    resultado.metricas = metricas if isinstance(metricas, MetricasResolucion) else None
+    if observadores:
+        notificar(observadores, EventoSimplex(FIN, estado=resultado.estado, objetivo=resultado.valor,
+                                              infactibilidad=resultado.infactibilidad,
+                                              multiples_optimos=resultado.multiples_optimos))
+    return resultado
+
+
+def _validar_punto_control(datos, A_ext, b):
+    """Verifica que un punto de control corresponda al problema extendido (A_ext, b)."""
+    if datos['num_columnas'] != A_ext.shape[1] or datos['huella'] != huella_problema(A_ext, b):
+        raise ValueError("El punto de control no corresponde a este problema.")
+    if len(datos['base']) != A_ext.shape[0]:
+        raise ValueError("La base del punto de control no tiene una variable por restricción.")
+
+
+def reanudar_desde_punto_control(problema, ruta, **opciones):
+    """
+    Continúa una resolución desde el último punto de control guardado en ruta.
+
+    Args:
+        problema: El mismo problema (dict o ProblemaPL) que se estaba resolviendo
+        ruta: Archivo .npz del punto de control
+        **opciones: Se pasan a resolver_problema_general (silencioso, limites,
+                    punto_control, ...)
+
+    Returns:
+        ResultadoPL: Resultado de la resolución continuada
+
+    Raises:
+        ValueError: Si el punto de control no corresponde al problema
+    """
+    return resolver_problema_general(problema, reanudar_desde=cargar_punto_control(ruta), **opciones)
+
+
+def _mostrar_limite(resultado, silencioso):
+    """Informa en consola que la resolución se detuvo por un límite."""
+    if not silencioso:
+        mostrar_caja("LÍMITE DE RESOLUCIÓN ALCANZADO")
+        print(f"  {resultado.mensaje}")
+        print(f"  Valor actual de Z = {formatear_numero(resultado.valor)}"
+              f"   Infactibilidad = {formatear_numero(resultado.infactibilidad, 6)}")
+    return resultado
+
+
+def _resultado_limite(motivo, A_ext, b, c_ext, c_original, base, B_inv, simbolos):
+    """
+    Resultado 'limite' con la base alcanzada y su inversa, el valor del
+    objetivo original en la solución básica actual y su infactibilidad.
+    """
+    x_B = B_inv @ b
+    resultado = ResultadoPL('limite', base=base, x_B=x_B, A_ext=A_ext, c_ext=c_ext, b_preparado=b,
+                            simbolos=simbolos, c_original=c_original, mensaje=MENSAJES_LIMITE[motivo],
+                            B_inv=B_inv)
+    resultado.motivo_limite = motivo
+    resultado.valor = c_original @ resultado.solucion
+    artificial_basica = simbolos.mascara(ARTIFICIAL)[base.indices]
+    resultado.infactibilidad = float(x_B[artificial_basica].sum() + np.maximum(-x_B, 0.0).sum())
+    return resultado
+
+
+def reanudar_resolucion(resultado, limites=None):
+    """
+    Continúa desde la base de un resultado 'limite'. Si la base es primal
+    factible se sigue con el método compuesto, que saca las artificiales que
+    queden y optimiza; si no (límite del simplex dual), con el simplex dual.
+
+    Args:
+        resultado: Resultado con estado 'limite' (otro estado se retorna tal cual)
+        limites: Nuevo presupuesto (LimitesResolucion)
+
+    Returns:
+        ResultadoPL: Resultado de la resolución continuada
+    """
+    if resultado.estado != 'limite':
+        return resultado
+    A_ext, b, c_ext, c_original = resultado.A_ext, resultado.b_preparado, resultado.c_ext, resultado.c_original
+    if np.all(resultado.x_B >= -1e-9):
+        nuevo = resolver_gran_m(A_ext, b, c_ext, c_original, resultado.base, resultado.simbolos, limites=limites,
+                                penalizacion_inicial=resultado.penalizacion_M)
+    else:
+        nuevo = reoptimizar_dual(A_ext, b, c_ext, c_original, resultado.base, resultado.B_inv_optima,
+                                 resultado.simbolos, limites=limites)
+    return _con_signos(nuevo, resultado.signos_filas)
+
+
+def seleccionar_variable_entrante(costos_reducidos, base, nombres_vars, silencioso=False, metricas=SIN_METRICAS):
     """Selecciona la variable entrante usando la regla de Bland para empates."""
     min_costo = np.min(costos_reducidos[costos_reducidos < -1e-9])
-    candidatas = [i for i, costo in enumerate(costos_reducidos) if abs(costo - min_costo) < 1e-9 and i not in base]
+    candidatas = np.flatnonzero((np.abs(costos_reducidos - min_costo) < 1e-9) & base.mascara_no_basicas()).tolist()
     
     if len(candidatas) > 1:
+        metricas.contar('desempates_bland')
+    if len(candidatas) > 1 and not silencioso:
         print(f"  {Colores.amarillo('CASO ESPECIAL:')} Empate para la variable entrante. Candidatas: {[nombres_vars[i] for i in candidatas]}.")
         print(f"  Usando la Regla de Bland, se elige la de menor índice: {nombres_vars[min(candidatas)]}")
     
     return min(candidatas)
 
-def seleccionar_variable_saliente(x_B, y, base, nombres_vars):
+def seleccionar_variable_saliente(x_B, y, base, nombres_vars, silencioso=False):
     """
     Selecciona la variable saliente. Detecta casos de degeneración y solución no acotada.
     Retorna la variable saliente, su índice, el estado y el ratio mínimo.
     """
     if np.all(y <= 1e-9):
-        print(f"  {Colores.rojo('CASO ESPECIAL:')} Solución no acotada. Todas las 'y' son <= 0.")
+        if not silencioso:
+            print(f"  {Colores.rojo('CASO ESPECIAL:')} Solución no acotada. Todas las 'y' son <= 0.")
         return None, None, 'no_acotado', None
 
-    ratios = [(x_B[i] / y[i]) if y[i] > 1e-9 else float('inf') for i in range(len(base))]
-    min_ratio = min(ratios)
+    ratios = np.full(len(base), float('inf'))
+    positivas = y > 1e-9
+    ratios[positivas] = x_B[positivas] / y[positivas]
+    min_ratio = ratios.min()
 
     if min_ratio == float('inf'):
         return None, None, 'no_acotado', None
 
-    candidatas_idx = [i for i, ratio in enumerate(ratios) if abs(ratio - min_ratio) < 1e-9]
+    candidatas_idx = np.flatnonzero(np.abs(ratios - min_ratio) < 1e-9).tolist()
 
     if len(candidatas_idx) > 1:
-        vars_candidatas = [nombres_vars[base[i]] for i in candidatas_idx]
-        print(f"  {Colores.amarillo('CASO ESPECIAL:')} Empate para la variable saliente (Degeneración). Candidatas: {vars_candidatas}.")
-        
         # Regla de Bland: Elegir la variable con el menor índice original.
         idx_elegido = min(candidatas_idx, key=lambda i: base[i])
+        if silencioso:
+            return base[idx_elegido], idx_elegido, 'degenerado', min_ratio
+
+        vars_candidatas = [nombres_vars[base[i]] for i in candidatas_idx]
+        print(f"  {Colores.amarillo('CASO ESPECIAL:')} Empate para la variable saliente (Degeneración). Candidatas: {vars_candidatas}.")
         print(f"  Usando la Regla de Bland, se elige la de menor índice: {nombres_vars[base[idx_elegido]]}")
         
         return base[idx_elegido], idx_elegido, 'degenerado', min_ratio
 
-    idx_saliente_en_base = ratios.index(min_ratio)
+    idx_saliente_en_base = int(np.argmin(ratios))
     var_saliente = base[idx_saliente_en_base]
     
     return var_saliente, idx_saliente_en_base, 'normal', min_ratio
 
 
 def resolver_simplex_revisado(nombre_fase, c_original, A_extended, b, tipo, n, c_extended, base, 
-                              vars_artificiales, nombres_vars_ext, es_fase_1=False):
-    """Motor del algoritmo Simplex Revisado."""
-    iteracion = 0
+                              vars_artificiales, nombres_vars_ext, es_fase_1=False, silencioso=False,
+                              B_inv=None, columnas_activas=None, frecuencia_refactorizacion=50, pausa=None,
+                              limites=None, punto_control=None, iteracion_inicial=0, observadores=None,
+                              metricas=SIN_METRICAS, ventana=None):
+    """
+    Motor del algoritmo Simplex Revisado.
+
+    Si base es una BaseSimplex se pivota sobre ella; el resto del estado es
+    local. El progreso se informa con eventos (ver observadores.EventoSimplex)
+    a cada observador; si no hay ninguno, los eventos ni siquiera se crean.
+    Con silencioso=False se agrega el tablero paso a paso (ObservadorTablero),
+    que llama a pausa() después de cada pivote y, con ventana=k, muestra solo
+    las columnas básicas, la entrante y las k no básicas más atractivas.
+    Antes de cada pivote se consulta limites; si se agotó se retorna un
+    resultado 'limite' con la base actual. Después de cada pivote se escribe
+    un punto de control si punto_control lo indica; iteracion_inicial continúa
+    la numeración de una fase reanudada.
+
+    La inversa de la base se actualiza en cada pivote (forma producto) y se
+    recalcula desde cero cada frecuencia_refactorizacion iteraciones. Se puede
+    partir de una inversa ya conocida (B_inv) y restringir las columnas que
+    pueden entrar a la base con la máscara columnas_activas, sin copiar A.
+    Los tiempos de factorización, precios y prueba de razón y los contadores
+    de la fase se acumulan en metricas (ver metricas.MetricasResolucion).
+    """
+    base = BaseSimplex.desde(base, len(c_extended))
+    campo_iteraciones = 'iteraciones_fase_1' if es_fase_1 else 'iteraciones_fase_2'
+    limites = LimitesResolucion.en_curso(limites)
+    es_artificial = np.zeros(len(c_extended), dtype=bool); es_artificial[vars_artificiales] = True
+    if columnas_activas is None:
+        columnas_activas = np.ones(len(c_extended), dtype=bool)
+    columnas_activas = np.asarray(columnas_activas, dtype=bool)
+    pivotes_desde_refactorizacion = 0
+
+    observadores = list(observadores) if observadores else []
+    if not silencioso:
+        observadores.append(ObservadorTablero(pausa, ventana))
+    if observadores:
+        columnas_visibles = np.flatnonzero(columnas_activas)
+        notificar(observadores, EventoSimplex(INICIO_FASE, nombre_fase, iteracion_inicial, contexto=dict(
+            base=base, A=A_extended, b=b, c=c_extended, n=n, nombres=nombres_vars_ext, es_fase_1=es_fase_1,
+            columnas=columnas_visibles)))
+
+    def contexto(**extra):
+        return dict(base=base, B_inv=B_inv, A=A_extended, c_B=c_B, c=c_extended, x_B=x_B, n=n,
+                    nombres=nombres_vars_ext, es_fase_1=es_fase_1, columnas=columnas_visibles, **extra)
+
+    iteracion = iteracion_inicial
     while True:
         iteracion += 1
-        print(f"\n{'─'*80}\n  {nombre_fase} - ITERACIÓN {iteracion}\n{'─'*80}\n")
+        if observadores:
+            notificar(observadores, EventoSimplex(ITERACION, nombre_fase, iteracion))
         
-        try:
-            B_matrix = A_extended[:, base]
-            B_inv = np.linalg.inv(B_matrix)
-        except np.linalg.LinAlgError:
-            return {'estado': 'error', 'mensaje': 'Matriz básica singular.'}
+        if B_inv is None or pivotes_desde_refactorizacion >= frecuencia_refactorizacion:
+            inicio = metricas.reloj()
+            try:
+                B_inv = np.linalg.inv(A_extended[:, base.indices])
+            except np.linalg.LinAlgError:
+                if observadores:
+                    notificar(observadores, EventoSimplex(FIN_FASE, nombre_fase, iteracion, estado='error'))
+                return ResultadoPL('error', mensaje='Matriz básica singular.')
+            metricas.acumular('factorizacion', inicio)
+            metricas.contar('refactorizaciones')
+            pivotes_desde_refactorizacion = 0
         
-        c_B = c_extended[base]
+        c_B = c_extended[base.indices]
         x_B = B_inv @ b
         Z = c_B @ x_B
         
-        costos_reducidos = np.zeros(len(c_extended))
-        for j in range(len(c_extended)):
-            if j not in base:
-                # Costo reducido z_j - c_j
-                costos_reducidos[j] = c_B @ B_inv @ A_extended[:, j] - c_extended[j]
+        # Costo reducido z_j - c_j (cero en las básicas y en las columnas inactivas)
+        inicio = metricas.reloj()
+        costos_reducidos = _calcular_costos_reducidos(A_extended, c_extended, base, B_inv)
+        costos_reducidos[~columnas_activas] = 0.0
         
         if np.all(costos_reducidos >= -1e-9):
-            print("✅ Condición de optimalidad alcanzada.")
-            
+            metricas.acumular('precios', inicio)
             # Comprobar si hay múltiples soluciones óptimas
             multiples_optimos = False
-            vars_no_basicas = [i for i in range(len(c_extended)) if i not in base]
-            for j in vars_no_basicas:
+            for j in base.no_basicas():
                 # Solo consideramos variables de decisión y de holgura/exceso, no artificiales
-                if j not in vars_artificiales and abs(costos_reducidos[j]) < 1e-9:
+                if columnas_activas[j] and not es_artificial[j] and abs(costos_reducidos[j]) < 1e-9:
                     multiples_optimos = True
                     break
             
-            if multiples_optimos:
-                print(f"  {Colores.verde('ℹ️  NOTA:')} Se ha encontrado una solución óptima, pero existen múltiples soluciones.")
-                print(f"     El tablero final muestra un costo reducido de 0 para al menos una variable no básica.")
+            if observadores:
+                notificar(observadores, EventoSimplex(
+                    FIN_FASE, nombre_fase, iteracion, objetivo=Z, infactibilidad=_suma_artificiales(x_B, base, es_artificial),
+                    estado='optimo', multiples_optimos=multiples_optimos, contexto=contexto()))
 
-            mostrar_tablero_revisado(iteracion, nombre_fase, es_fase_1, base, B_inv, A_extended, c_B, c_extended, x_B, Z, n, nombres_vars_ext)
+            resultado = ResultadoPL('optimo', base=base, x_B=x_B, A_ext=A_extended, c_ext=c_extended,
+                                    b_preparado=b, simbolos=nombres_vars_ext, c_original=c_original,
+                                    multiples_optimos=multiples_optimos, B_inv=B_inv)
+            resultado.valor = Z if es_fase_1 else c_original @ resultado.solucion
+            return resultado
 
-            solucion_completa = np.zeros(len(c_extended)); solucion_completa[base] = x_B
-            valor_final = (c_original @ solucion_completa[:n])
-            
-            return {'estado': 'optimo', 'solucion': solucion_completa[:n], 'valor': Z if es_fase_1 else valor_final,
-                    'base': base, 'solucion_completa': solucion_completa, 'A_ext': A_extended,
-                    'c_ext': c_extended, 'b_preparado': b, 'nombres_ext': nombres_vars_ext,
-                    'B_inv_optima': B_inv, 'multiples_optimos': multiples_optimos,
-                    'c_original': c_original}
+        motivo = limites.motivo_parada()
+        if motivo is not None:
+            if observadores:
+                notificar(observadores, EventoSimplex(
+                    FIN_FASE, nombre_fase, iteracion, objetivo=Z, infactibilidad=_suma_artificiales(x_B, base, es_artificial),
+                    estado='limite', contexto=contexto(mensaje=MENSAJES_LIMITE[motivo])))
+            return _resultado_limite(motivo, A_extended, b, c_extended, c_original, base, B_inv, nombres_vars_ext)
         
-        var_entrante = seleccionar_variable_entrante(costos_reducidos, base, nombres_vars_ext)
+        var_entrante = seleccionar_variable_entrante(costos_reducidos, base, nombres_vars_ext, silencioso, metricas)
         costo_entrante = costos_reducidos[var_entrante]
+        metricas.acumular('precios', inicio)
+
+        inicio = metricas.reloj()
         y = B_inv @ A_extended[:, var_entrante]
-        
-        var_saliente, idx_saliente_en_base, estado_salida, min_ratio = seleccionar_variable_saliente(x_B, y, base, nombres_vars_ext)
+        var_saliente, idx_saliente_en_base, estado_salida, min_ratio = seleccionar_variable_saliente(x_B, y, base, nombres_vars_ext, silencioso)
+        metricas.acumular('prueba_razon', inicio)
 
         if estado_salida == 'no_acotado':
-            mostrar_tablero_revisado(iteracion, nombre_fase, es_fase_1, base, B_inv, A_extended, c_B, c_extended, x_B, Z, n, nombres_vars_ext, var_entrante)
-            print(f"\n🔵 Entra: {nombres_vars_ext[var_entrante]}, pero no hay variable saliente.")
-            return {'estado': 'no_acotado'}
-        
-        # Preparar nueva base para mostrarla
-        base_futura = base.copy()
-        base_futura[idx_saliente_en_base] = var_entrante
-        nombres_base_futura = [nombres_vars_ext[i] for i in base_futura]
-
-        mostrar_tablero_revisado(iteracion, nombre_fase, es_fase_1, base, B_inv, A_extended, c_B, c_extended, x_B, Z, n, nombres_vars_ext, 
-                                 var_entrante, var_saliente, costo_entrante, min_ratio, nombres_base_futura)
+            if observadores:
+                notificar(observadores, EventoSimplex(
+                    FIN_FASE, nombre_fase, iteracion, entrante=var_entrante, objetivo=Z,
+                    infactibilidad=_suma_artificiales(x_B, base, es_artificial), estado='no_acotado', contexto=contexto()))
+            return ResultadoPL('no_acotado')
         
-        base[idx_saliente_en_base] = var_entrante
-        input("\n⏸️  Presione ENTER para la siguiente iteración...")
+        if observadores:
+            notificar(observadores, EventoSimplex(
+                PIVOTE, nombre_fase, iteracion, var_entrante, var_saliente, min_ratio, Z,
+                _suma_artificiales(x_B, base, es_artificial), contexto=contexto(costo_entrante=costo_entrante)))
         
-        if iteracion > 50: return {'estado': 'error', 'mensaje': 'Límite de iteraciones.'}
+        B_inv = _actualizar_inversa(B_inv, y, idx_saliente_en_base)
+        pivotes_desde_refactorizacion += 1
+        base.reemplazar(idx_saliente_en_base, var_entrante)
+        limites.registrar_pivote()
+        metricas.contar(campo_iteraciones)
+        if estado_salida == 'degenerado':
+            metricas.contar('desempates_bland')
+        if min_ratio <= 1e-9:
+            metricas.contar('pivotes_degenerados')
+        if punto_control is not None and punto_control.debe_guardar(iteracion):
+            punto_control.guardar(nombre_fase, base, iteracion)
 
 
-def mostrar_tablero_revisado(iteracion, nombre_fase, es_fase_1, base, B_inv, A, c_B, c, x_B, Z, n, nombres_vars_ext, 
-                             var_entrante=None, var_saliente=None, costo_reducido_entrante=None, ratio_min=None, nueva_base_nombres=None):
-    """Muestra el tablero simplex revisado con formato de 2 decimales y colores."""
-    m = len(base)
-    total_vars = len(c)
-    
-    mostrar_caja(f"TABLERO SIMPLEX ({nombre_fase}) - ITERACIÓN {iteracion}")
-    
-    headers = ['Z'] + nombres_vars_ext + ['π'] + ['LD']
-    if es_fase_1: headers[0] = 'W'
-
-    B_inv_A = B_inv @ A
-    pi = c_B @ B_inv
-    
-    fila_Z = [1.0]
-    for j in range(total_vars):
-        # Mostramos c_j - z_j (negativo del costo reducido) para que coincida con el output deseado
-        valor = -(c_B @ (B_inv @ A[:, j]) - c[j])
-        fila_Z.append(valor)
-    fila_Z.append(0.0) # Pi
-    fila_Z.append(Z) 
-    
-    filas_rest = []
-    for i in range(m):
-        fila = [0.0]; fila.extend(B_inv_A[i, :]); fila.append(pi[i]); fila.append(x_B[i])
-        filas_rest.append(fila)
-
-    # Encabezados con colores
-    print("  Var. Base │ ", end="")
-    for j, h in enumerate(headers):
-        h_coloreado = Colores.azul(h) if var_entrante is not None and j > 0 and (j-1) == var_entrante else h
-        print(f"{h_coloreado:>{8 + (len(h_coloreado) - len(h))}}", end=" ")
-    print("\n  " + "─"*10 + "┼" + "─"*(9 * len(headers)))
-
-    # Fila Z/W
-    nombre_obj = 'W' if es_fase_1 else 'Z'
-    print(f"  {nombre_obj:^10}│ ", end="")
-    for j, val in enumerate(fila_Z):
-        val_f = formatear_numero(val)
-        val_c = Colores.azul(val_f) if var_entrante is not None and j == var_entrante + 1 else val_f
-        print(f"{val_c:>{8 + (len(val_c) - len(val_f))}}", end=" ")
-    print()
-
-    # Filas de restricciones
-    for i, fila in enumerate(filas_rest):
-        var_base_nombre = nombres_vars_ext[base[i]]
-        es_fila_saliente = var_saliente is not None and base[i] == var_saliente
-        
-        var_b_most = Colores.rojo(var_base_nombre) if es_fila_saliente else var_base_nombre
-        print(f"  {var_b_most:^{10 + (len(var_b_most) - len(var_base_nombre))}}│ ", end="")
-
-        for j, val in enumerate(fila):
-            val_f = formatear_numero(val)
-            es_col_entrante = var_entrante is not None and j == var_entrante + 1
-            
-            if es_fila_saliente and es_col_entrante: val_c = Colores.morado(val_f)
-            elif es_fila_saliente: val_c = Colores.rojo(val_f)
-            elif es_col_entrante: val_c = Colores.azul(val_f)
-            else: val_c = val_f
-            print(f"{val_c:>{8+(len(val_c)-len(val_f))}}", end=" ")
-        print()
-    
-    # --- LEYENDA DETALLADA ---
-    print("\n  Leyenda:")
-    if es_fase_1:
-        print(f"    W: Función objetivo (Suma de Artificiales) = {formatear_numero(Z)}")
-    else:
-        print(f"    Z: Función objetivo = {formatear_numero(Z)}")
-    print(f"    π: Variables duales (precios sombra)")
-    print(f"    LD: Lado derecho (valores de variables básicas)")
-    print(f"    Base actual: {[nombres_vars_ext[i] for i in base]}")
-
-    if var_entrante is not None and costo_reducido_entrante is not None:
-        print(f"\n🔵 Variable entrante: {nombres_vars_ext[var_entrante]}")
-        # Se muestra el valor del tablero (c_j - z_j), que es el negativo del costo reducido (z_j - c_j)
-        print(f"   Costo reducido: {formatear_numero(-costo_reducido_entrante)}")
-    
-    if var_saliente is not None and ratio_min is not None:
-        try:
-            pos_en_base = list(base).index(var_saliente)
-            print(f"🔴 Variable saliente: {nombres_vars_ext[var_saliente]} (posición {pos_en_base} en base)")
-        except ValueError:
-            print(f"🔴 Variable saliente: {nombres_vars_ext[var_saliente]}")
-        print(f"   Ratio mínimo: {formatear_numero(ratio_min)}")
-
-    if nueva_base_nombres:
-        print(f"\n📊 Nueva base: {nueva_base_nombres}")
+def _suma_artificiales(x_B, base, es_artificial):
+    """Suma de las variables artificiales básicas (infactibilidad de la base)."""
+    return float(x_B[es_artificial[base.indices]].sum())
 
 
 def mostrar_solucion_final(solucion, valor, tipo, nombres_vars, multiples_optimos=False):
@@ -357,37 +654,43 @@ def mostrar_solucion_final(solucion, valor, tipo, nombres_vars, multiples_optimo
     if multiples_optimos:
         print(f"\n  {Colores.verde('ℹ️  NOTA:')} Existen otras soluciones que también producen este mismo valor óptimo.")
 
-def encontrar_siguiente_vertice_optimo(resultado_anterior, pivotes_usados=[]):
+def encontrar_siguiente_vertice_optimo(resultado_anterior, pivotes_usados=(), silencioso=False):
     """
     A partir de una solución óptima, realiza un pivote en una variable no básica
     con costo reducido cero para encontrar otra solución óptima.
+
+    Args:
+        resultado_anterior: Resultado óptimo (no se modifica)
+        pivotes_usados: Variables ya usadas para pivotar (no se modifica)
+        silencioso: Si es True no se imprime nada
+
+    Returns:
+        tuple: (nuevo resultado o None, lista nueva de pivotes usados)
     """
+    pivotes_usados = list(pivotes_usados)
     # 1. Desempacar datos del resultado anterior
-    base = resultado_anterior['base'][:] # Copia para no modificar el original
-    A_ext = resultado_anterior['A_ext']
-    c_ext = resultado_anterior['c_ext']
-    b = resultado_anterior['b_preparado']
-    nombres_ext = resultado_anterior['nombres_ext']
-    n = resultado_anterior['solucion'].shape[0]
-    c_original = resultado_anterior['c_original']
-    tipo = 'max' if np.array_equal(c_original, c_ext[:n]) else 'min'
-
-    # 2. Recalcular B_inv y costos reducidos para asegurar consistencia
+    base = resultado_anterior.base.copia() # Copia para no modificar el original
+    A_ext = resultado_anterior.A_ext
+    c_ext = resultado_anterior.c_ext
+    b = resultado_anterior.b_preparado
+    simbolos = resultado_anterior.simbolos
+    c_original = resultado_anterior.c_original
+
+    # 2. Inversa de la base actual (se factoriza solo si el resultado no la conserva)
     try:
-        B_matrix = A_ext[:, base]
-        B_inv = np.linalg.inv(B_matrix)
-        c_B = c_ext[base]
+        B_inv = resultado_anterior.B_inv_optima
+        c_B = c_ext[base.indices]
     except np.linalg.LinAlgError:
-        print("❌ Error: La matriz básica se volvió singular.")
+        if not silencioso:
+            print("❌ Error: La matriz básica se volvió singular.")
         return None, pivotes_usados
 
     # 3. Encontrar variable entrante
     costos_reducidos = np.zeros(len(c_ext))
-    vars_no_basicas = [i for i in range(len(c_ext)) if i not in base]
     var_entrante = -1
 
-    # Ordenar por índice para consistencia (similar a Bland)
-    vars_no_basicas.sort()
+    # Recorrer por índice creciente para consistencia (similar a Bland)
+    vars_no_basicas = base.no_basicas()
 
     for j in vars_no_basicas:
         costo_j = c_B @ B_inv @ A_ext[:, j] - c_ext[j]
@@ -398,54 +701,603 @@ def encontrar_siguiente_vertice_optimo(resultado_anterior, pivotes_usados=[]):
             break
 
     if var_entrante == -1:
-        print("\nℹ️ No se encontraron más vértices óptimos alternativos.")
+        if not silencioso:
+            print("\nℹ️ No se encontraron más vértices óptimos alternativos.")
         return None, pivotes_usados
 
-    print(f"\n*️⃣  Buscando siguiente solución óptima pivotando sobre '{nombres_ext[var_entrante]}'.")
+    if not silencioso:
+        print(f"\n*️⃣  Buscando siguiente solución óptima pivotando sobre '{simbolos[var_entrante]}'.")
     pivotes_usados.append(var_entrante)
 
     # 4. Realizar el pivote
     y = B_inv @ A_ext[:, var_entrante]
     x_B_actual = B_inv @ b
     
-    var_saliente, idx_saliente_en_base, _, min_ratio = seleccionar_variable_saliente(x_B_actual, y, base, nombres_ext)
+    var_saliente, idx_saliente_en_base, _, min_ratio = seleccionar_variable_saliente(x_B_actual, y, base, simbolos, silencioso)
 
     if var_saliente is None:
-        print("  ⚠️ No se pudo realizar el pivote (posiblemente una arista no acotada del poliedro óptimo).")
+        if not silencioso:
+            print("  ⚠️ No se pudo realizar el pivote (posiblemente una arista no acotada del poliedro óptimo).")
         return None, pivotes_usados
 
-    print(f"   -> Entra: {nombres_ext[var_entrante]}, Sale: {nombres_ext[var_saliente]}")
+    if not silencioso:
+        print(f"   -> Entra: {simbolos[var_entrante]}, Sale: {simbolos[var_saliente]}")
 
-    # 5. Actualizar base y recalcular la solución
-    base[idx_saliente_en_base] = var_entrante
-    
-    try:
-        B_matrix_nueva = A_ext[:, base]
-        B_inv_nueva = np.linalg.inv(B_matrix_nueva)
-    except np.linalg.LinAlgError:
-        print("❌ Error: La nueva matriz básica es singular.")
-        return None, pivotes_usados
+    # 5. Actualizar base e inversa (un pivote, sin volver a factorizar)
+    base.reemplazar(idx_saliente_en_base, var_entrante)
+    B_inv_nueva = _actualizar_inversa(B_inv, y, idx_saliente_en_base)
 
-    x_B_nuevo = B_inv_nueva @ b
-    
-    # 6. Empaquetar y devolver el nuevo resultado
-    solucion_completa = np.zeros(len(c_ext))
-    solucion_completa[base] = x_B_nuevo
-    valor_final = c_original @ solucion_completa[:n]
-
-    nuevo_resultado = {
-        'estado': 'optimo',
-        'solucion': solucion_completa[:n],
-        'valor': valor_final,
-        'base': base,
-        'solucion_completa': solucion_completa,
-        'A_ext': A_ext,
-        'c_ext': c_ext,
-        'b_preparado': b,
-        'nombres_ext': nombres_ext,
-        'B_inv_optima': B_inv_nueva,
-        'multiples_optimos': True, # Sigue habiendo múltiples óptimos
-        'c_original': c_original
-    }
+    # 6. Empaquetar y devolver el nuevo resultado (comparte A_ext, c_ext y b con el anterior)
+    nuevo_resultado = ResultadoPL('optimo', base=base, x_B=B_inv_nueva @ b, A_ext=A_ext, c_ext=c_ext,
+                                  b_preparado=b, simbolos=simbolos, c_original=c_original,
+                                  multiples_optimos=True, # Sigue habiendo múltiples óptimos
+                                  B_inv=B_inv_nueva, signos_filas=resultado_anterior.signos_filas)
+    nuevo_resultado.valor = c_original @ nuevo_resultado.solucion
     
-    return nuevo_resultado, pivotes_usados
\ No newline at end of file
+    return nuevo_resultado, pivotes_usados
+
+# ==================================================================================
+# PROGRAMACIÓN PARAMÉTRICA DEL OBJETIVO
+# ==================================================================================
+
+def _calcular_costos_reducidos(A_ext, c_ext, base, B_inv):
+    """Costos reducidos z_j - c_j de todas las columnas (cero en las básicas)."""
+    costos = (c_ext[base.indices] @ B_inv) @ A_ext - c_ext
+    costos[base.indices] = 0.0
+    return costos
+
+
+def _actualizar_inversa(B_inv, y, idx_pivote):
+    """
+    Actualiza B⁻¹ tras un pivote (forma producto de la inversa): la columna
+    entrante, con y = B⁻¹·a_j, reemplaza a la básica en la posición idx_pivote.
+    """
+    B_inv = B_inv.copy()
+    fila_pivote = B_inv[idx_pivote, :] / y[idx_pivote]
+    B_inv -= np.outer(y, fila_pivote)
+    B_inv[idx_pivote, :] = fila_pivote
+    return B_inv
+
+
+def resolver_parametrico_objetivo(problema, d, lambda_min=0.0, lambda_max=float('inf'), max_pivotes=1000):
+    """
+    Programación paramétrica del objetivo c + λ·d para λ en [lambda_min, lambda_max].
+
+    Resuelve una sola vez en λ = lambda_min y luego avanza con el simplex primal:
+    en cada punto de quiebre entra la variable cuyo costo reducido se anula y se
+    realiza un único pivote, en lugar de resolver el problema desde cero.
+
+    Args:
+        problema: ProblemaPL (o diccionario con la misma forma que en problema_definido.py)
+        d: Dirección de variación de los coeficientes objetivo
+        lambda_min: Valor inicial del parámetro
+        lambda_max: Valor final del parámetro (puede ser infinito)
+        max_pivotes: Límite de seguridad de pivotes entre puntos de quiebre
+
+    Returns:
+        dict: {'estado', 'intervalos', 'lambda_no_acotado'}. Cada intervalo contiene
+              'lambda_inf', 'lambda_sup', 'base', 'solucion', 'valor_c' y 'valor_d';
+              el valor óptimo en el intervalo es Z(λ) = valor_c + λ·valor_d.
+    """
+    problema = ProblemaPL.desde(problema)
+    c = problema.c
+    d = np.array(d, dtype=float)
+    n = problema.num_vars
+
+    resultado = resolver_problema_general(problema.copia(c=c + lambda_min * d), silencioso=True)
+
+    if resultado.estado != 'optimo':
+        return {'estado': resultado.estado, 'intervalos': [], 'lambda_no_acotado': None}
+
+    A_ext = resultado.A_ext
+    b = resultado.b_preparado
+    base = resultado.base.copia()
+    simbolos = resultado.simbolos
+
+    # Forma interna de maximización, con ceros para holguras y excesos
+    signo = 1.0 if problema.tipo == 'max' else -1.0
+    c_ext = np.zeros(A_ext.shape[1]); c_ext[:n] = signo * c
+    d_ext = np.zeros(A_ext.shape[1]); d_ext[:n] = signo * d
+
+    B_inv = resultado.B_inv_optima
+    intervalos = []
+    lam = lambda_min
+    estado, lambda_no_acotado = 'optimo', None
+
+    for _ in range(max_pivotes):
+        x_B = B_inv @ b
+        costos_c = _calcular_costos_reducidos(A_ext, c_ext, base, B_inv)
+        costos_d = _calcular_costos_reducidos(A_ext, d_ext, base, B_inv)
+
+        # La base sigue siendo óptima mientras costos_c + λ·costos_d >= 0
+        candidatas = np.flatnonzero(base.mascara_no_basicas() & (costos_d < -1e-9)).tolist()
+        ratios = {j: -costos_c[j] / costos_d[j] for j in candidatas}
+        lam_sup = max(min(ratios.values()), lam) if ratios else float('inf')
+
+        solucion_completa = np.zeros(A_ext.shape[1]); solucion_completa[base.indices] = x_B
+        solucion = solucion_completa[:n]
+        intervalo = {'lambda_inf': lam, 'lambda_sup': min(lam_sup, lambda_max), 'base': base.indices.copy(),
+                     'solucion': solucion, 'valor_c': c @ solucion, 'valor_d': d @ solucion}
+
+        # Los pivotes degenerados o los quiebres repetidos no cambian el vértice
+        if intervalos and np.allclose(intervalos[-1]['solucion'], solucion, atol=1e-9):
+            intervalos[-1]['lambda_sup'] = intervalo['lambda_sup']
+            intervalos[-1]['base'] = intervalo['base']
+        else:
+            intervalos.append(intervalo)
+
+        if lam_sup >= lambda_max:
+            break
+
+        # Regla de Bland: entre los empates en el punto de quiebre, el menor índice
+        var_entrante = min(j for j in candidatas if abs(ratios[j] - lam_sup) < 1e-9)
+        y = B_inv @ A_ext[:, var_entrante]
+        _, idx_saliente, estado_salida, _ = seleccionar_variable_saliente(x_B, y, base, simbolos, silencioso=True)
+
+        if estado_salida == 'no_acotado':
+            estado, lambda_no_acotado = 'no_acotado', lam_sup
+            break
+
+        B_inv = _actualizar_inversa(B_inv, y, idx_saliente)
+        base.reemplazar(idx_saliente, var_entrante)
+        lam = lam_sup
+    else:
+        estado = 'error'
+
+    return {'estado': estado, 'intervalos': intervalos, 'lambda_no_acotado': lambda_no_acotado}
+
+
+# ==================================================================================
+# RE-OPTIMIZACIÓN EN CALIENTE (EDICIÓN INCREMENTAL DEL MODELO)
+# ==================================================================================
+
+def _empaquetar_resultado(A_ext, b, c_ext, c_original, base, B_inv, simbolos):
+    """Construye el resultado óptimo a partir de una base y su inversa."""
+    costos = _calcular_costos_reducidos(A_ext, c_ext, base, B_inv)
+    no_basicas = base.mascara_no_basicas()
+
+    resultado = ResultadoPL('optimo', base=base, x_B=B_inv @ b, A_ext=A_ext, c_ext=c_ext, b_preparado=b,
+                            simbolos=simbolos, c_original=c_original,
+                            multiples_optimos=bool(np.any(np.abs(costos[no_basicas]) < 1e-9)), B_inv=B_inv)
+    resultado.valor = c_original @ resultado.solucion
+    return resultado
+
+
+def reoptimizar_primal(A_ext, b, c_ext, c_original, base, B_inv, simbolos, limites=None):
+    """
+    Simplex primal silencioso a partir de una base primal factible conocida.
+    La inversa se actualiza con cada pivote en lugar de recalcularse.
+    """
+    base = BaseSimplex(list(base), A_ext.shape[1])
+    limites = LimitesResolucion.en_curso(limites)
+    while True:
+        x_B = B_inv @ b
+        costos = _calcular_costos_reducidos(A_ext, c_ext, base, B_inv)
+        if np.all(costos >= -1e-9):
+            return _empaquetar_resultado(A_ext, b, c_ext, c_original, base, B_inv, simbolos)
+
+        motivo = limites.motivo_parada()
+        if motivo is not None:
+            return _resultado_limite(motivo, A_ext, b, c_ext, c_original, base, B_inv, simbolos)
+
+        var_entrante = seleccionar_variable_entrante(costos, base, simbolos, silencioso=True)
+        y = B_inv @ A_ext[:, var_entrante]
+        _, idx_saliente, estado_salida, _ = seleccionar_variable_saliente(x_B, y, base, simbolos, silencioso=True)
+        if estado_salida == 'no_acotado':
+            return ResultadoPL('no_acotado')
+
+        B_inv = _actualizar_inversa(B_inv, y, idx_saliente)
+        base.reemplazar(idx_saliente, var_entrante)
+        limites.registrar_pivote()
+
+
+def reoptimizar_dual(A_ext, b, c_ext, c_original, base, B_inv, simbolos, limites=None):
+    """
+    Simplex dual silencioso a partir de una base dual factible (costos reducidos >= 0)
+    cuya solución básica puede tener componentes negativas.
+    """
+    base = BaseSimplex(list(base), A_ext.shape[1])
+    limites = LimitesResolucion.en_curso(limites)
+    while True:
+        x_B = B_inv @ b
+        idx_saliente = int(np.argmin(x_B))
+        if x_B[idx_saliente] >= -1e-9:
+            return _empaquetar_resultado(A_ext, b, c_ext, c_original, base, B_inv, simbolos)
+
+        motivo = limites.motivo_parada()
+        if motivo is not None:
+            return _resultado_limite(motivo, A_ext, b, c_ext, c_original, base, B_inv, simbolos)
+
+        fila_alfa = B_inv[idx_saliente, :] @ A_ext
+        costos = _calcular_costos_reducidos(A_ext, c_ext, base, B_inv)
+        candidatas = np.flatnonzero(base.mascara_no_basicas() & (fila_alfa < -1e-9)).tolist()
+        if not candidatas:
+            return ResultadoPL('infactible')
+
+        # Prueba de razón dual, con la regla de Bland para los empates
+        var_entrante = min(candidatas, key=lambda j: (round(costos[j] / -fila_alfa[j], 9), j))
+        y = B_inv @ A_ext[:, var_entrante]
+        B_inv = _actualizar_inversa(B_inv, y, idx_saliente)
+        base.reemplazar(idx_saliente, var_entrante)
+        limites.registrar_pivote()
+
+
+def _con_signos(resultado, signos_filas):
+    """Pasa el vector de signos de las filas al resultado re-optimizado."""
+    if resultado is not None:
+        resultado.signos_filas = signos_filas
+    return resultado
+
+
+def reoptimizar_con_nueva_restriccion(resultado, coeficientes, tipo, valor):
+    """
+    Agrega la fila coeficientes·x (tipo) valor a un resultado óptimo y re-optimiza
+    con el simplex dual. Si valor < 0 la fila se orienta como en normalizar_signos.
+    La inversa de la base se extiende por bloques:
+
+        B' = [[B, 0], [a_B, σ]]   =>   B'⁻¹ = [[B⁻¹, 0], [-a_B·B⁻¹/σ, 1/σ]]
+
+    donde σ es el coeficiente de la nueva variable lógica (holgura, exceso o una
+    artificial temporal para '=' que se expulsa con un pivote dual forzado).
+
+    Args:
+        resultado: Resultado óptimo previo (con base e inversa)
+        coeficientes: Coeficientes de la fila
+        tipo: '<=', '>=' o '='
+        valor: Lado derecho
+
+    Returns:
+        ResultadoPL: Nuevo resultado, o None si no es posible re-optimizar en caliente
+                     (también si A_ext no es densa, p. ej. de una A dispersa).
+    """
+    if es_matriz_externa(resultado.A_ext):
+        return None  # Se resuelve desde cero: editar A_ext la volvería densa
+    A_ext, b, c_ext = resultado.A_ext, resultado.b_preparado, resultado.c_ext
+    base, B_inv, simbolos = resultado.base, resultado.B_inv_optima, resultado.simbolos
+    c_original = resultado.c_original
+    n = len(c_original)
+    m, total = A_ext.shape
+
+    coeficientes, valor, (tipo,), signo = normalizar_signos(
+        np.asarray(coeficientes, dtype=float)[None, :], np.array([valor], dtype=float), [tipo])
+    signos_filas = np.append(resultado.signos_filas, signo)
+
+    sigma = -1.0 if tipo == '>=' else 1.0
+    fila = np.zeros(total + 1); fila[:n] = coeficientes; fila[total] = sigma
+
+    A_nueva = np.zeros((m + 1, total + 1))
+    A_nueva[:m, :total] = A_ext
+    A_nueva[m, :] = fila
+    b_nuevo = np.append(b, valor)
+    c_nuevo = np.append(c_ext, 0.0)
+
+    simbolos_nuevos = simbolos.con_fila(CLASE_POR_TIPO[tipo])
+
+    B_inv_nueva = np.zeros((m + 1, m + 1))
+    B_inv_nueva[:m, :m] = B_inv
+    B_inv_nueva[m, :m] = -(fila[base.indices] @ B_inv) / sigma
+    B_inv_nueva[m, m] = 1.0 / sigma
+    base_nueva = BaseSimplex(list(base) + [total], total + 1)
+
+    if tipo == '=':
+        # Pivote dual forzado: la artificial sale de la base en la fila m
+        valor_artificial = (B_inv_nueva @ b_nuevo)[m]
+        fila_alfa = B_inv_nueva[m, :] @ A_nueva
+        costos = _calcular_costos_reducidos(A_nueva, c_nuevo, base_nueva, B_inv_nueva)
+        no_basicas = base_nueva.mascara_no_basicas()[:total]
+        if valor_artificial > 1e-9:
+            candidatas = np.flatnonzero(no_basicas & (fila_alfa[:total] > 1e-9)).tolist()
+        elif valor_artificial < -1e-9:
+            candidatas = np.flatnonzero(no_basicas & (fila_alfa[:total] < -1e-9)).tolist()
+        else:
+            candidatas = np.flatnonzero(no_basicas & (np.abs(fila_alfa[:total]) > 1e-9)).tolist()
+
+        if not candidatas:
+            # Infactible si la artificial no puede anularse; fila redundante si ya vale cero
+            return _con_signos(ResultadoPL('infactible'), signos_filas) if abs(valor_artificial) > 1e-9 else None
+
+        var_entrante = min(candidatas, key=lambda j: (round(costos[j] / abs(fila_alfa[j]), 9), j))
+        y = B_inv_nueva @ A_nueva[:, var_entrante]
+        B_inv_nueva = _actualizar_inversa(B_inv_nueva, y, m)
+        base_nueva.reemplazar(m, var_entrante)
+
+        # La artificial ya no es básica: se elimina su columna
+        A_nueva, c_nuevo = A_nueva[:, :total], c_nuevo[:total]
+        simbolos_nuevos = simbolos_nuevos.filtrar(np.arange(total))
+        base_nueva = BaseSimplex(base_nueva.indices, total)
+
+    return _con_signos(reoptimizar_dual(A_nueva, b_nuevo, c_nuevo, c_original, base_nueva, B_inv_nueva, simbolos_nuevos),
+                       signos_filas)
+
+
+def reoptimizar_sin_restriccion(resultado, fila):
+    """
+    Elimina una restricción de un resultado óptimo y re-optimiza con el simplex primal.
+
+    Eliminar la fila equivale a darle una holgura libre. Esa columna unitaria entra
+    a la base con una prueba de razón en ambos sentidos (la solución sigue siendo
+    factible); luego se quitan la fila y la posición de la base que ocupa, con lo
+    que la nueva inversa es la anterior sin esa fila y esa columna.
+
+    Retorna None si A_ext no es densa (MatrizExtendida de una A dispersa o
+    mapeada en memoria): quitarle una fila la copiaría entera.
+    """
+    if es_matriz_externa(resultado.A_ext):
+        return None  # Se resuelve desde cero: editar A_ext la volvería densa
+    A_ext, b, c_ext = resultado.A_ext, resultado.b_preparado, resultado.c_ext
+    base, B_inv, simbolos = resultado.base.indices.tolist(), resultado.B_inv_optima, resultado.simbolos
+    c_original = resultado.c_original
+
+    x_B = B_inv @ b
+    y = B_inv[:, fila]
+
+    opciones = []
+    positivas = np.flatnonzero(y > 1e-9)
+    if len(positivas):
+        opciones.append(positivas[np.argmin(x_B[positivas] / y[positivas])])
+    negativas = np.flatnonzero(y < -1e-9)
+    if len(negativas):
+        opciones.append(negativas[np.argmax(x_B[negativas] / y[negativas])])
+    idx_pivote = max(opciones, key=lambda k: abs(y[k]))
+
+    B_inv = _actualizar_inversa(B_inv, y, idx_pivote)
+    B_inv = np.delete(np.delete(B_inv, idx_pivote, axis=0), fila, axis=1)
+    del base[idx_pivote]
+
+    A_nueva = np.delete(A_ext, fila, axis=0)
+    b_nuevo = np.delete(b, fila)
+    c_nuevo = c_ext
+
+    columna_logica = simbolos.columna_logica(fila)
+    if columna_logica is not None:
+        A_nueva = np.delete(A_nueva, columna_logica, axis=1)
+        c_nuevo = np.delete(c_nuevo, columna_logica)
+        base = [j - 1 if j > columna_logica else j for j in base]
+
+    return _con_signos(reoptimizar_primal(A_nueva, b_nuevo, c_nuevo, c_original, base, B_inv, simbolos.sin_fila(fila)),
+                       np.delete(resultado.signos_filas, fila))
+
+
+def reoptimizar_con_nueva_variable(resultado, costo, columna, tipo):
+    """
+    Agrega una variable de decisión y re-optimiza con el simplex primal. La
+    columna se orienta con los signos de las filas; la base no cambia, por lo
+    que B⁻¹ se conserva.
+
+    Retorna None si A_ext no es densa (MatrizExtendida de una A dispersa o
+    mapeada en memoria): agregarle una columna la copiaría entera.
+    """
+    if es_matriz_externa(resultado.A_ext):
+        return None  # Se resuelve desde cero: editar A_ext la volvería densa
+    A_ext, b, c_ext = resultado.A_ext, resultado.b_preparado, resultado.c_ext
+    base, B_inv, simbolos = resultado.base, resultado.B_inv_optima, resultado.simbolos
+    n = len(resultado.c_original)
+
+    A_nueva = np.insert(A_ext, n, resultado.signos_filas * np.asarray(columna, dtype=float), axis=1)
+    c_nuevo = np.insert(c_ext, n, costo if tipo == 'max' else -costo)
+    c_original = np.append(resultado.c_original, costo)
+    base = [j + 1 if j >= n else j for j in base]
+
+    return _con_signos(reoptimizar_primal(A_nueva, b, c_nuevo, c_original, base, B_inv, simbolos.con_decision()),
+                       resultado.signos_filas)
+
+
+def reoptimizar_con_coeficiente(resultado, fila, columna, valor):
+    """
+    Cambia A[fila, columna] de una variable de decisión y re-optimiza.
+
+    Si la variable es básica, B⁻¹ se actualiza con Sherman-Morrison; después se usa
+    el simplex primal si la base sigue siendo factible o el dual si sigue siendo
+    óptima. Retorna None cuando no queda ninguna de las dos (o la base se vuelve
+    singular) y hay que resolver desde cero, y también si A_ext no es densa
+    (MatrizExtendida de una A dispersa o mapeada en memoria).
+    """
+    if es_matriz_externa(resultado.A_ext):
+        return None  # Se resuelve desde cero: editar A_ext la volvería densa
+    A_ext, b, c_ext = resultado.A_ext, resultado.b_preparado, resultado.c_ext
+    base, B_inv, simbolos = resultado.base, resultado.B_inv_optima, resultado.simbolos
+    c_original = resultado.c_original
+
+    valor = resultado.signos_filas[fila] * valor
+    A_nueva = A_ext.copy()
+    delta = valor - A_nueva[fila, columna]
+    A_nueva[fila, columna] = valor
+
+    if columna in base:
+        k = base.posicion_de(columna)
+        denominador = 1.0 + delta * B_inv[k, fila]
+        if abs(denominador) < 1e-9:
+            return None
+        B_inv = B_inv - delta * np.outer(B_inv[:, fila], B_inv[k, :]) / denominador
+
+    if np.all(B_inv @ b >= -1e-9):
+        return _con_signos(reoptimizar_primal(A_nueva, b, c_ext, c_original, base, B_inv, simbolos),
+                           resultado.signos_filas)
+    if np.all(_calcular_costos_reducidos(A_nueva, c_ext, base, B_inv) >= -1e-9):
+        return _con_signos(reoptimizar_dual(A_nueva, b, c_ext, c_original, base, B_inv, simbolos),
+                           resultado.signos_filas)
+    return None
+
+
+def reoptimizar_con_nuevo_objetivo(resultado, c_nuevo, tipo):
+    """
+    Re-optimiza tras cambiar solo la función objetivo. La base óptima anterior
+    sigue siendo primal factible, así que el simplex primal continúa desde ella
+    sin volver a estandarizar el problema ni pasar por la Fase 1.
+    """
+    A_ext = resultado.A_ext
+    c_original = np.array(c_nuevo, dtype=float)
+    c_ext = np.zeros(A_ext.shape[1])
+    c_ext[:len(c_original)] = c_original if tipo == 'max' else -c_original
+
+    return _con_signos(reoptimizar_primal(A_ext, resultado.b_preparado, c_ext, c_original, resultado.base,
+                                          resultado.B_inv_optima, resultado.simbolos),
+                       resultado.signos_filas)
+
+
+# ==================================================================================
+# MÉTODO COMPUESTO DE UNA FASE (GRAN M CON PENALIZACIÓN ADAPTATIVA)
+# ==================================================================================
+
+def _expulsar_artificiales(A_ext, base, B_inv, es_artificial):
+    """
+    Saca de la base las artificiales que quedaron básicas en nivel cero con
+    pivotes degenerados (no cambian la solución). Si la fila de la artificial
+    no tiene ningún coeficiente no nulo fuera de las artificiales, la fila es
+    redundante y la artificial se queda en la base con valor cero.
+
+    Returns:
+        tuple: (base, B_inv, filas_redundantes)
+    """
+    base = BaseSimplex(list(base), A_ext.shape[1])
+    filas_redundantes = []
+    for k in range(len(base)):
+        if not es_artificial[base[k]]:
+            continue
+        fila_alfa = B_inv[k, :] @ A_ext
+        candidatas = ~es_artificial & (np.abs(fila_alfa) > 1e-9) & base.mascara_no_basicas()
+        if not candidatas.any():
+            filas_redundantes.append(k)
+            continue
+        var_entrante = int(np.argmax(np.where(candidatas, np.abs(fila_alfa), 0.0)))
+        B_inv = _actualizar_inversa(B_inv, B_inv @ A_ext[:, var_entrante], k)
+        base.reemplazar(k, var_entrante)
+    return base, B_inv, filas_redundantes
+
+
+def _descartar_artificiales(resultado, es_artificial):
+    """
+    Quita del resultado final las columnas artificiales no básicas, de modo que
+    'A_ext' solo tenga variables de decisión, holguras y excesos (más las
+    artificiales de filas redundantes). La base conserva sus columnas, así que
+    B⁻¹ no cambia.
+    """
+    base = resultado.base
+    conservar = ~es_artificial
+    conservar[base.indices] = True
+    nuevo_indice = np.cumsum(conservar) - 1
+
+    resultado.base = base.reindexar(nuevo_indice, int(conservar.sum()))
+    resultado.A_ext = resultado.A_ext[:, conservar]
+    resultado.c_ext = resultado.c_ext[conservar]
+    resultado.simbolos = resultado.simbolos.filtrar(conservar)
+    return resultado
+
+
+def resolver_gran_m(A_ext, b, c_ext, c_original, base, simbolos, limites=None, penalizacion_inicial=None,
+                    observadores=None, metricas=SIN_METRICAS):
+    """
+    Método compuesto de una sola fase: maximiza c·x - M·(suma de artificiales)
+    de modo que la factibilidad y la optimalidad avanzan en las mismas iteraciones.
+
+    Los costos reducidos se llevan separados (objetivo e infactibilidad), así que
+    cambiar M no requiere recalcular nada. M se elige de forma adaptativa: parte
+    de 10·max|c| y, si el óptimo compuesto todavía tiene artificiales positivas
+    pero la infactibilidad aún puede reducirse, crece lo justo para que una
+    columna que la reduce vuelva a ser atractiva. Si no hay columnas así, el
+    problema es infactible. Un rayo no acotado con artificiales positivas se
+    resuelve minimizando solo la infactibilidad desde la base actual.
+
+    Sirve también para continuar desde cualquier base primal factible, con o
+    sin artificiales básicas (ver reanudar_resolucion); penalizacion_inicial
+    permite retomar con la M a la que se había llegado. Los pivotes se
+    informan a observadores como eventos de la fase 'GRAN M' y sus tiempos y
+    contadores se acumulan en metricas como los de la Fase 2.
+
+    Returns:
+        ResultadoPL: Resultado como el de resolver_simplex_revisado; si es óptimo
+                     trae además penalizacion_M y filas_redundantes, y si se
+                     alcanzó un límite, penalizacion_M (para reanudar).
+    """
+    total = A_ext.shape[1]
+    base = BaseSimplex(list(base), total)
+    es_artificial = simbolos.mascara(ARTIFICIAL)
+    c_infactibilidad = -es_artificial.astype(float)
+    M = penalizacion_inicial or 10.0 * max(1.0, np.max(np.abs(c_ext)))
+    solo_factibilidad = False
+    inicio = metricas.reloj()
+    B_inv = np.linalg.inv(A_ext[:, base.indices])
+    metricas.acumular('factorizacion', inicio)
+    metricas.contar('refactorizaciones')
+    limites = LimitesResolucion.en_curso(limites)
+    if observadores:
+        notificar(observadores, EventoSimplex(INICIO_FASE, 'GRAN M'))
+
+    def terminar(resultado):
+        if observadores:
+            notificar(observadores, EventoSimplex(FIN_FASE, 'GRAN M', limites.iteraciones, objetivo=resultado.valor,
+                                                  infactibilidad=resultado.infactibilidad, estado=resultado.estado))
+        return resultado
+
+    while True:
+        x_B = B_inv @ b
+        infactibilidad = x_B[es_artificial[base.indices]].sum()
+        if solo_factibilidad and infactibilidad <= 1e-9:
+            # Hay un punto factible y un rayo que mejora el objetivo sin límite
+            return terminar(ResultadoPL('no_acotado'))
+
+        inicio = metricas.reloj()
+        costos_obj = _calcular_costos_reducidos(A_ext, c_ext, base, B_inv)
+        costos_inf = _calcular_costos_reducidos(A_ext, c_infactibilidad, base, B_inv)
+        costos = costos_inf if solo_factibilidad else costos_obj + M * costos_inf
+
+        # Las artificiales que salen de la base no vuelven a entrar
+        elegibles = ~es_artificial & base.mascara_no_basicas()
+        costos = np.where(elegibles, costos, 0.0)
+        metricas.acumular('precios', inicio)
+
+        if np.all(costos >= -1e-9):
+            if infactibilidad <= 1e-9:
+                break
+            reducen_infactibilidad = elegibles & (costos_inf < -1e-9)
+            if solo_factibilidad or not reducen_infactibilidad.any():
+                return terminar(ResultadoPL('infactible'))
+            M = max(10.0 * M, 2.0 * np.max(costos_obj[reducen_infactibilidad] / -costos_inf[reducen_infactibilidad]))
+            continue
+
+        motivo = limites.motivo_parada()
+        if motivo is not None:
+            resultado = _resultado_limite(motivo, A_ext, b, c_ext, c_original, base, B_inv, simbolos)
+            resultado.penalizacion_M = M
+            return terminar(resultado)
+
+        var_entrante = seleccionar_variable_entrante(costos, base, simbolos, silencioso=True, metricas=metricas)
+        inicio = metricas.reloj()
+        y = B_inv @ A_ext[:, var_entrante]
+        var_saliente, idx_saliente, estado_salida, paso = seleccionar_variable_saliente(x_B, y, base, simbolos, silencioso=True)
+        metricas.acumular('prueba_razon', inicio)
+
+        if estado_salida == 'no_acotado':
+            if infactibilidad <= 1e-9:
+                return terminar(ResultadoPL('no_acotado'))
+            if costos_inf[var_entrante] > 1e-9:
+                # El rayo empeora la factibilidad: basta con una M mayor
+                M = max(10.0 * M, 2.0 * -costos_obj[var_entrante] / costos_inf[var_entrante])
+            else:
+                solo_factibilidad = True
+            continue
+
+        if observadores:
+            notificar(observadores, EventoSimplex(PIVOTE, 'GRAN M', limites.iteraciones + 1, var_entrante, var_saliente,
+                                                  paso, c_ext[base.indices] @ x_B, float(infactibilidad)))
+        B_inv = _actualizar_inversa(B_inv, y, idx_saliente)
+        base.reemplazar(idx_saliente, var_entrante)
+        limites.registrar_pivote()
+        metricas.contar('iteraciones_fase_2')
+        if estado_salida == 'degenerado':
+            metricas.contar('desempates_bland')
+        if paso <= 1e-9:
+            metricas.contar('pivotes_degenerados')
+
+    # Artificiales en nivel cero: fuera de la base; las no básicas se eliminan
+    base, B_inv, filas_redundantes = _expulsar_artificiales(A_ext, base, B_inv, es_artificial)
+    conservar = ~es_artificial
+    conservar[base.indices] = True
+    nuevo_indice = np.cumsum(conservar) - 1
+    base = base.reindexar(nuevo_indice, int(conservar.sum()))
+    resultado = reoptimizar_primal(A_ext[:, conservar], b, c_ext[conservar], c_original, base, B_inv,
+                                   simbolos.filtrar(conservar), limites=limites)
+    if resultado.estado == 'optimo':
+        resultado.penalizacion_M = M
+        resultado.filas_redundantes = filas_redundantes
+    return terminar(resultado)
@@ -0,0 +1,347 @@
+"""
+==================================================================================
+MÓDULO DEL SERVICIO HTTP
+==================================================================================
+Servicio local de larga duración (asyncio, solo biblioteca estándar) que
+recibe problemas en JSON, los encola y los reparte entre un grupo de procesos
+que se mantiene caliente, con NumPy y el simplex ya importados.
+
+    python main.py servir --puerto 8765 --procesos 4
+
+    POST /resolver   problema (forma de problema_definido.py) y, opcionalmente,
+                     'metodo', 'tiempo_maximo' y 'max_iteraciones'
+    GET  /metricas   profundidad de la cola, percentiles de latencia y caché
+    GET  /salud      estado del servicio
+==================================================================================
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from formato_json import problema_desde_dict, resultado_a_dict
+from modelo_pl import LimitesResolucion
+from resolucion_simplex import resolver_problema_general
+
+
+# ==================================================================================
+# TRABAJO DE CADA PROCESO
+# ==================================================================================
+
+def _iniciar_proceso():
+    """
+    Inicializador de los procesos: Ctrl+C lo atiende solo el proceso principal
+    (que apaga el grupo ordenadamente) y una resolución mínima deja todo cargado.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _calentar()
+
+
+def _calentar():
+    resolver_problema_general({'c': [1.0], 'A': [[1.0]], 'b': [1.0]}, silencioso=True)
+
+
+def _resolver_peticion(modelo, metodo, max_iteraciones, tiempo_maximo):
+    """Resuelve un modelo ya validado y retorna el resultado serializable."""
+    problema = problema_desde_dict(modelo)
+    resultado = resolver_problema_general(problema, silencioso=True, metodo=metodo,
+                                          limites=LimitesResolucion(max_iteraciones, tiempo_maximo))
+    return resultado_a_dict(resultado, problema)
+
+
+# ==================================================================================
+# ERRORES
+# ==================================================================================
+
+class ErrorPeticion(Exception):
+    """Petición que no se puede atender; lleva el código HTTP de la respuesta."""
+
+    def __init__(self, codigo, mensaje):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+
+def _validar_limites(tiempo_maximo, max_iteraciones):
+    """
+    Valida los límites que trae una petición (None usa los del servicio).
+
+    Raises:
+        ErrorPeticion: 400 si tiempo_maximo no es un número >= 0 o
+                       max_iteraciones no es un entero >= 0
+    """
+    if tiempo_maximo is not None and (isinstance(tiempo_maximo, bool) or not isinstance(tiempo_maximo, (int, float))
+                                      or not tiempo_maximo >= 0):
+        raise ErrorPeticion(400, "tiempo_maximo debe ser un número no negativo.")
+    if max_iteraciones is not None and (isinstance(max_iteraciones, bool) or not isinstance(max_iteraciones, int)
+                                        or max_iteraciones < 0):
+        raise ErrorPeticion(400, "max_iteraciones debe ser un entero no negativo.")
+
+
+MENSAJES_HTTP = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                 413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+# ==================================================================================
+# CLASE SERVICIO
+# ==================================================================================
+
+class ServicioSimplex:
+    """
+    Cola de peticiones atendida por despachadores asyncio que envían cada
+    problema al grupo de procesos. Los resultados de problemas ya resueltos
+    (mismo modelo y método, sin límite alcanzado) se sirven desde una caché LRU,
+    y un problema idéntico que ya está en la cola se espera en lugar de repetirse.
+
+    Se puede usar sin HTTP (await servicio.resolver(datos)) o exponer con
+    iniciar(), que retorna el puerto real (con puerto=0 el sistema elige uno libre).
+    """
+
+    def __init__(self, procesos=None, max_cola=1000, tam_cache=1024, tiempo_maximo=None,
+                 max_iteraciones=10000, max_cuerpo=16 * 1024 * 1024):
+        """
+        Args:
+            procesos: Procesos del grupo (por defecto, uno por CPU)
+            max_cola: Peticiones en espera como máximo; con la cola llena se responde 503
+            tam_cache: Resultados guardados en la caché (0 la desactiva)
+            tiempo_maximo: Segundos por problema si la petición no indica otro
+            max_iteraciones: Pivotes por problema si la petición no indica otro
+            max_cuerpo: Tamaño máximo del cuerpo de una petición, en bytes
+        """
+        self.procesos = procesos or os.cpu_count() or 1
+        self.max_cola = max_cola
+        self.tam_cache = tam_cache
+        self.tiempo_maximo = tiempo_maximo
+        self.max_iteraciones = max_iteraciones
+        self.max_cuerpo = max_cuerpo
+        self._cola = None
+        self._grupo = None
+        self._despachadores = []
+        self._servidor = None
+        self._cache = OrderedDict()
+        self._pendientes = {}
+        self._latencias = deque(maxlen=10000)
+        self.contadores = {'atendidas': 0, 'rechazadas': 0, 'errores': 0, 'aciertos_cache': 0,
+                           'fallos_cache': 0, 'en_proceso': 0}
+
+    # ------------------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------------------
+
+    async def iniciar(self, host='127.0.0.1', puerto=8765):
+        """Arranca el grupo de procesos, los despachadores y el servidor HTTP; retorna el puerto."""
+        loop = asyncio.get_running_loop()
+        self._cola = asyncio.Queue(self.max_cola)
+        self._grupo = ProcessPoolExecutor(max_workers=self.procesos, initializer=_iniciar_proceso)
+        # Se arrancan los procesos ya, para que la primera petición no pague las importaciones
+        await asyncio.gather(*(loop.run_in_executor(self._grupo, _calentar) for _ in range(self.procesos)))
+        self._despachadores = [asyncio.ensure_future(self._despachar()) for _ in range(self.procesos)]
+        self._servidor = await asyncio.start_server(self._atender, host, puerto)
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def detener(self):
+        """Cierra el servidor, cancela los despachadores y apaga el grupo de procesos."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        for despachador in self._despachadores:
+            despachador.cancel()
+        await asyncio.gather(*self._despachadores, return_exceptions=True)
+        if self._grupo is not None:
+            self._grupo.shutdown(wait=True)
+
+    async def servir_por_siempre(self, host='127.0.0.1', puerto=8765):
+        puerto = await self.iniciar(host, puerto)
+        print(f"Servicio simplex en http://{host}:{puerto} ({self.procesos} procesos)")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.detener()
+
+    # ------------------------------------------------------------------------------
+    # Resolución
+    # ------------------------------------------------------------------------------
+
+    async def resolver(self, datos):
+        """
+        Encola un problema y espera su resultado.
+
+        Args:
+            datos: Diccionario del problema, más 'metodo', 'tiempo_maximo' y
+                   'max_iteraciones' opcionales
+
+        Returns:
+            dict: Resultado serializable, con 'cache' indicando si vino de la caché
+
+        Raises:
+            ErrorPeticion: 400 si el problema es inválido, 503 si la cola está llena
+        """
+        inicio = time.perf_counter()
+        if not isinstance(datos, dict):
+            raise ErrorPeticion(400, "El cuerpo debe ser un objeto JSON.")
+        opciones = {clave: datos.get(clave) for clave in ('metodo', 'tiempo_maximo', 'max_iteraciones')}
+        modelo = {clave: valor for clave, valor in datos.items() if clave not in opciones}
+        metodo = opciones['metodo'] or 'dos_fases'
+        if metodo not in ('dos_fases', 'gran_m'):
+            raise ErrorPeticion(400, "metodo debe ser 'dos_fases' o 'gran_m'.")
+        _validar_limites(opciones['tiempo_maximo'], opciones['max_iteraciones'])
+        try:
+            problema_desde_dict(modelo)
+        except (TypeError, ValueError) as error:
+            raise ErrorPeticion(400, str(error)) from error
+
+        clave = hashlib.blake2b(json.dumps([modelo, metodo], sort_keys=True).encode(), digest_size=16).digest()
+        if clave in self._cache:
+            self._cache.move_to_end(clave)
+            self.contadores['aciertos_cache'] += 1
+            return self._registrar(inicio, {**self._cache[clave], 'cache': True})
+        tiempo_maximo = opciones['tiempo_maximo'] if opciones['tiempo_maximo'] is not None else self.tiempo_maximo
+        max_iteraciones = (opciones['max_iteraciones'] if opciones['max_iteraciones'] is not None
+                           else self.max_iteraciones)
+
+        # Un problema idéntico ya en la cola (con el mismo presupuesto) se espera en vez de repetirlo
+        pendiente = (clave, max_iteraciones, tiempo_maximo)
+        if pendiente in self._pendientes:
+            self.contadores['aciertos_cache'] += 1
+            try:
+                resultado = await asyncio.shield(self._pendientes[pendiente])
+            except Exception as error:
+                raise ErrorPeticion(500, f"Falló la resolución: {error}") from error
+            return self._registrar(inicio, {**resultado, 'cache': True})
+        self.contadores['fallos_cache'] += 1
+
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self._cola.put_nowait((futuro, modelo, metodo, max_iteraciones, tiempo_maximo))
+        except asyncio.QueueFull:
+            self.contadores['rechazadas'] += 1
+            raise ErrorPeticion(503, "La cola de peticiones está llena.") from None
+        self._pendientes[pendiente] = futuro
+
+        try:
+            resultado = await asyncio.shield(futuro)
+        except Exception as error:
+            raise ErrorPeticion(500, f"Falló la resolución: {error}") from error
+        finally:
+            self._pendientes.pop(pendiente, None)
+        if resultado['estado'] != 'limite' and self.tam_cache > 0:
+            self._cache[clave] = resultado
+            if len(self._cache) > self.tam_cache:
+                self._cache.popitem(last=False)
+        return self._registrar(inicio, {**resultado, 'cache': False})
+
+    def _registrar(self, inicio, resultado):
+        self._latencias.append((time.perf_counter() - inicio) * 1000)
+        self.contadores['atendidas'] += 1
+        return resultado
+
+    async def _despachar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            futuro, *argumentos = await self._cola.get()
+            self.contadores['en_proceso'] += 1
+            try:
+                resultado = await loop.run_in_executor(self._grupo, _resolver_peticion, *argumentos)
+            except Exception as error:  # El proceso falló: se informa a quien espera
+                if not futuro.done():
+                    futuro.set_exception(error)
+            else:
+                if not futuro.done():
+                    futuro.set_result(resultado)
+            finally:
+                self.contadores['en_proceso'] -= 1
+                self._cola.task_done()
+
+    def metricas(self):
+        """Profundidad de la cola, contadores, percentiles de latencia (ms) y tasa de aciertos de la caché."""
+        latencias = np.fromiter(self._latencias, dtype=float)
+        percentiles = (np.percentile(latencias, [50, 90, 99]).tolist() if latencias.size
+                       else [None, None, None])
+        consultas = self.contadores['aciertos_cache'] + self.contadores['fallos_cache']
+        return {
+            'en_cola': self._cola.qsize() if self._cola is not None else 0,
+            **self.contadores,
+            'procesos': self.procesos,
+            'latencia_ms': dict(zip(('p50', 'p90', 'p99'), percentiles)),
+            'tasa_aciertos_cache': self.contadores['aciertos_cache'] / consultas if consultas else 0.0,
+            'tam_cache': len(self._cache),
+        }
+
+    # ------------------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------------------
+
+    async def _atender(self, reader, writer):
+        """Atiende una petición HTTP/1.1 por conexión y responde JSON."""
+        try:
+            try:
+                metodo, ruta, cuerpo = await self._leer_peticion(reader)
+                codigo, respuesta = 200, await self._enrutar(metodo, ruta, cuerpo)
+            except ErrorPeticion as error:
+                codigo, respuesta = error.codigo, {'estado': 'error', 'mensaje': str(error)}
+                self.contadores['errores'] += 1
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as error:  # Último recurso: toda conexión aceptada recibe respuesta
+                codigo, respuesta = 500, {'estado': 'error', 'mensaje': f"Error interno: {error}"}
+                self.contadores['errores'] += 1
+            contenido = json.dumps(respuesta, ensure_ascii=False).encode('utf-8')
+            writer.write(f"HTTP/1.1 {codigo} {MENSAJES_HTTP[codigo]}\r\n"
+                         f"Content-Type: application/json; charset=utf-8\r\n"
+                         f"Content-Length: {len(contenido)}\r\n"
+                         f"Connection: close\r\n\r\n".encode('latin-1') + contenido)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _leer_peticion(self, reader):
+        linea = (await reader.readline()).decode('latin-1').split()
+        if len(linea) != 3:
+            raise ErrorPeticion(400, "Línea de petición inválida.")
+        metodo, ruta = linea[0], linea[1]
+        largo = 0
+        while True:
+            encabezado = await reader.readline()
+            if encabezado in (b'\r\n', b'\n', b''):
+                break
+            nombre, _, valor = encabezado.decode('latin-1').partition(':')
+            if nombre.strip().lower() == 'content-length':
+                try:
+                    largo = int(valor.strip() or 0)
+                except ValueError:
+                    raise ErrorPeticion(400, "Content-Length debe ser un entero.") from None
+                if largo < 0:
+                    raise ErrorPeticion(400, "Content-Length no puede ser negativo.")
+        if largo > self.max_cuerpo:
+            raise ErrorPeticion(413, "El cuerpo de la petición es demasiado grande.")
+        cuerpo = await reader.readexactly(largo) if largo else b''
+        return metodo, ruta.split('?', 1)[0], cuerpo
+
+    async def _enrutar(self, metodo, ruta, cuerpo):
+        if ruta == '/resolver':
+            if metodo != 'POST':
+                raise ErrorPeticion(405, "Use POST en /resolver.")
+            try:
+                datos = json.loads(cuerpo.decode('utf-8'))
+            except (UnicodeDecodeError, ValueError) as error:
+                raise ErrorPeticion(400, f"JSON inválido: {error}") from error
+            return await self.resolver(datos)
+        if ruta in ('/metricas', '/salud'):
+            if metodo != 'GET':
+                raise ErrorPeticion(405, f"Use GET en {ruta}.")
+            return self.metricas() if ruta == '/metricas' else {'estado': 'ok'}
+        raise ErrorPeticion(404, f"No existe la ruta {ruta}.")
+
+
+def servir(host='127.0.0.1', puerto=8765, **opciones):
+    """Ejecuta el servicio hasta que se interrumpa (Ctrl+C)."""
+    try:
+        asyncio.run(ServicioSimplex(**opciones).servir_por_siempre(host, puerto))
+    except KeyboardInterrupt:
+        pass
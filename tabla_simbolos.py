@@ -0,0 +1,143 @@
+"""
+==================================================================================
+MÓDULO DE LA TABLA DE SÍMBOLOS
+==================================================================================
+Clase de cada columna del problema extendido (decisión, holgura, exceso o
+artificial), fila a la que pertenece y nombre, calculados una sola vez.
+==================================================================================
+"""
+
+import numpy as np
+
+
+# ==================================================================================
+# CLASES DE VARIABLES
+# ==================================================================================
+
+DECISION = 0
+HOLGURA = 1
+EXCESO = 2
+ARTIFICIAL = 3
+
+PREFIJOS = ('x', 's', 'e', 'a')
+
+# Clase de la variable lógica que agrega cada tipo de restricción
+CLASE_POR_TIPO = {'<=': HOLGURA, '>=': EXCESO, '=': ARTIFICIAL}
+
+
+# ==================================================================================
+# CLASE TABLA DE SÍMBOLOS
+# ==================================================================================
+
+class TablaSimbolos:
+    """
+    Tabla de símbolos del problema extendido, con un arreglo por atributo:
+
+    - clase: DECISION, HOLGURA, EXCESO o ARTIFICIAL para cada columna;
+    - ordinal: número de la variable dentro de su clase (el 3 de 's3');
+    - fila: restricción a la que pertenece cada columna lógica (-1 en las de decisión);
+    - logica_de_fila: holgura o exceso de cada restricción (-1 si no tiene).
+
+    Los nombres no se guardan: se generan al consultarlos con tabla[j].
+    """
+
+    __slots__ = ('clase', 'ordinal', 'fila', 'num_filas', 'logica_de_fila')
+
+    def __init__(self, clase, ordinal, fila, num_filas):
+        """
+        Args:
+            clase: Clase de cada columna
+            ordinal: Número de cada columna dentro de su clase (desde 1)
+            fila: Fila de cada columna lógica (-1 en las de decisión)
+            num_filas: Número de restricciones
+        """
+        self.clase = np.asarray(clase, dtype=np.int8)
+        self.ordinal = np.asarray(ordinal, dtype=np.intp)
+        self.fila = np.asarray(fila, dtype=np.intp)
+        self.num_filas = num_filas
+        self.logica_de_fila = np.full(num_filas, -1, dtype=np.intp)
+        logicas = np.flatnonzero((self.clase == HOLGURA) | (self.clase == EXCESO))
+        self.logica_de_fila[self.fila[logicas]] = logicas
+
+    @classmethod
+    def construir(cls, n_decision, clases_logicas, filas_logicas, num_filas):
+        """
+        Construye la tabla a partir de las columnas lógicas en orden de aparición.
+
+        Args:
+            n_decision: Número de variables de decisión
+            clases_logicas: Clase de cada columna lógica (HOLGURA, EXCESO o ARTIFICIAL)
+            filas_logicas: Fila de cada columna lógica
+            num_filas: Número de restricciones
+
+        Returns:
+            TablaSimbolos: Tabla con las columnas de decisión seguidas de las lógicas
+        """
+        clases_logicas = np.asarray(clases_logicas, dtype=np.int8)
+        ordinal_logicas = np.zeros(len(clases_logicas), dtype=np.intp)
+        for k in (HOLGURA, EXCESO, ARTIFICIAL):
+            de_clase = clases_logicas == k
+            ordinal_logicas[de_clase] = np.arange(1, de_clase.sum() + 1)
+        return cls(np.concatenate([np.full(n_decision, DECISION, dtype=np.int8), clases_logicas]),
+                   np.concatenate([np.arange(1, n_decision + 1), ordinal_logicas]),
+                   np.concatenate([np.full(n_decision, -1, dtype=np.intp), np.asarray(filas_logicas, dtype=np.intp)]),
+                   num_filas)
+
+    # ------------------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.clase)
+
+    def __getitem__(self, j):
+        return f"{PREFIJOS[self.clase[j]]}{self.ordinal[j]}"
+
+    def __iter__(self):
+        return (self[j] for j in range(len(self.clase)))
+
+    def __repr__(self):
+        return f"TablaSimbolos({list(self)})"
+
+    def mascara(self, clase):
+        """Máscara booleana de las columnas de una clase."""
+        return self.clase == clase
+
+    def indices(self, clase):
+        """Índices de las columnas de una clase, en orden creciente."""
+        return np.flatnonzero(self.clase == clase)
+
+    def columna_logica(self, fila):
+        """Holgura o exceso de una fila, o None si la fila es de igualdad."""
+        j = self.logica_de_fila[fila]
+        return int(j) if j >= 0 else None
+
+    # ------------------------------------------------------------------------------
+    # Modificación (cada operación retorna una tabla nueva)
+    # ------------------------------------------------------------------------------
+
+    def con_fila(self, clase):
+        """Agrega una restricción con su variable lógica al final."""
+        de_clase = self.clase == clase
+        siguiente = int(self.ordinal[de_clase].max()) + 1 if de_clase.any() else 1
+        return TablaSimbolos(np.append(self.clase, clase), np.append(self.ordinal, siguiente),
+                             np.append(self.fila, self.num_filas), self.num_filas + 1)
+
+    def sin_fila(self, fila):
+        """Quita una restricción junto con su holgura o exceso, si la tiene."""
+        conservar = np.ones(len(self.clase), dtype=bool)
+        if self.logica_de_fila[fila] >= 0:
+            conservar[self.logica_de_fila[fila]] = False
+        filas = self.fila[conservar]
+        filas = np.where(filas > fila, filas - 1, np.where(filas == fila, -1, filas))
+        return TablaSimbolos(self.clase[conservar], self.ordinal[conservar], filas, self.num_filas - 1)
+
+    def con_decision(self):
+        """Agrega una variable de decisión a continuación de las existentes."""
+        n = int((self.clase == DECISION).sum())
+        return TablaSimbolos(np.insert(self.clase, n, DECISION), np.insert(self.ordinal, n, n + 1),
+                             np.insert(self.fila, n, -1), self.num_filas)
+
+    def filtrar(self, conservar):
+        """Tabla con solo las columnas marcadas en la máscara conservar."""
+        return TablaSimbolos(self.clase[conservar], self.ordinal[conservar], self.fila[conservar], self.num_filas)
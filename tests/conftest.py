@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos del proyecto se importan con rutas absolutas desde la raíz
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
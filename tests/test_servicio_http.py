@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+from servicio_http import ServicioSimplex
+
+PROBLEMA = {'c': [3.0, 5.0], 'A': [[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]], 'b': [4.0, 12.0, 18.0]}
+
+
+def _peticion(puerto, crudo):
+    async def enviar():
+        reader, writer = await asyncio.open_connection('127.0.0.1', puerto)
+        writer.write(crudo)
+        await writer.drain()
+        respuesta = await reader.read()
+        writer.close()
+        encabezado, _, cuerpo = respuesta.partition(b'\r\n\r\n')
+        return int(encabezado.split()[1]), json.loads(cuerpo)
+    return enviar()
+
+
+def _post(puerto, datos):
+    cuerpo = json.dumps(datos).encode()
+    return _peticion(puerto, b"POST /resolver HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(cuerpo), cuerpo))
+
+
+def _con_servicio(prueba):
+    async def ejecutar():
+        servicio = ServicioSimplex(procesos=1, tam_cache=0)
+        puerto = await servicio.iniciar(puerto=0)
+        try:
+            return await prueba(puerto)
+        finally:
+            await servicio.detener()
+    return asyncio.run(ejecutar())
+
+
+def test_content_length_invalido_responde_400():
+    async def prueba(puerto):
+        for valor in (b'abc', b'-5'):
+            codigo, respuesta = await _peticion(puerto, b"POST /resolver HTTP/1.1\r\nContent-Length: " + valor
+                                                + b"\r\n\r\n{}")
+            assert codigo == 400
+            assert 'Content-Length' in respuesta['mensaje']
+    _con_servicio(prueba)
+
+
+def test_opciones_de_tipo_invalido_responden_400():
+    async def prueba(puerto):
+        for opciones in ({'tiempo_maximo': 'x'}, {'tiempo_maximo': -1}, {'max_iteraciones': 'x'},
+                         {'max_iteraciones': 1.5}, {'max_iteraciones': -2}):
+            codigo, respuesta = await _post(puerto, {**PROBLEMA, **opciones})
+            assert codigo == 400, opciones
+            assert respuesta['estado'] == 'error'
+    _con_servicio(prueba)
+
+
+def test_max_iteraciones_cero_se_respeta():
+    async def prueba(puerto):
+        codigo, limitado = await _post(puerto, {**PROBLEMA, 'max_iteraciones': 0})
+        _, completo = await _post(puerto, PROBLEMA)
+        return codigo, limitado, completo
+    codigo, limitado, completo = _con_servicio(prueba)
+    assert codigo == 200
+    assert limitado['estado'] == 'limite'
+    assert completo['estado'] == 'optimo'
+    assert completo['valor'] == 36.0
@@ -0,0 +1,213 @@
+"""
+==================================================================================
+MÓDULO DE TRAZA DEL SIMPLEX
+==================================================================================
+Registro binario compacto de una resolución (fase, variable entrante y
+saliente, paso, objetivo e infactibilidad de cada pivote) en arreglos
+preasignados, guardado en un archivo .npz. El tablero de cualquier iteración
+se reconstruye después, fuera de la resolución, re-aplicando los pivotes
+desde la base inicial de su fase.
+==================================================================================
+"""
+
+import numpy as np
+from base_simplex import BaseSimplex
+from observadores import INICIO_FASE, PIVOTE, FIN_FASE, columnas_ventana, mostrar_tablero_revisado
+
+
+# ==================================================================================
+# REGISTRO DE LA TRAZA (OBSERVADOR)
+# ==================================================================================
+
+class TrazaSimplex:
+    """
+    Observador que registra cada pivote en arreglos preasignados de capacidad
+    fija, que se duplican solo si se llenan. Por cada fase del simplex
+    revisado guarda además la base inicial, los costos y las columnas activas;
+    junto con la matriz del problema extendido, eso basta para reconstruir
+    cualquier tablero (ver ReproductorTraza).
+
+    Los pivotes del método de la Gran M también se registran, pero sus
+    tableros no se pueden reconstruir (la penalización M cambia en la fase).
+
+    Uso:
+
+        traza = TrazaSimplex()
+        resolver_problema_general(problema, silencioso=True, observadores=[traza])
+        traza.guardar('resolucion.npz')
+    """
+
+    def __init__(self, capacidad=1024):
+        """
+        Args:
+            capacidad: Número de pivotes para el que se reservan los arreglos
+        """
+        self.num_pivotes = 0
+        self.fase = np.empty(capacidad, dtype=np.int8)
+        self.iteracion = np.empty(capacidad, dtype=np.int32)
+        self.entrante = np.empty(capacidad, dtype=np.int32)
+        self.saliente = np.empty(capacidad, dtype=np.int32)
+        self.paso = np.empty(capacidad, dtype=np.float64)
+        self.objetivo = np.empty(capacidad, dtype=np.float64)
+        self.infactibilidad = np.empty(capacidad, dtype=np.float64)
+        self.fases = []  # Nombre, base inicial, costos, columnas, es_fase_1 y estado final
+        self.A = None
+        self.b = None
+        self.n = 0
+        self.nombres = None
+
+    def __call__(self, evento):
+        if evento.tipo == PIVOTE:
+            if self.num_pivotes == len(self.fase):
+                self._ampliar()
+            k = self.num_pivotes
+            self.fase[k] = len(self.fases) - 1
+            self.iteracion[k] = evento.iteracion
+            self.entrante[k] = evento.entrante
+            self.saliente[k] = evento.saliente
+            self.paso[k] = evento.paso
+            self.objetivo[k] = evento.objetivo
+            self.infactibilidad[k] = evento.infactibilidad or 0.0
+            self.num_pivotes += 1
+        elif evento.tipo == INICIO_FASE:
+            self._iniciar_fase(evento)
+        elif evento.tipo == FIN_FASE and self.fases:
+            self.fases[-1]['estado'] = evento.estado
+
+    def _iniciar_fase(self, evento):
+        ctx = evento.contexto
+        fase = {'nombre': evento.fase, 'iteracion_inicial': evento.iteracion, 'estado': None,
+                'base': None, 'c': None, 'columnas': None, 'es_fase_1': False}
+        if ctx is not None:
+            if self.A is None:
+                self.A, self.b, self.n = ctx['A'], ctx['b'], ctx['n']
+                self.nombres = [ctx['nombres'][j] for j in range(ctx['A'].shape[1])]
+            fase.update(base=ctx['base'].indices.copy(), c=ctx['c'].copy(),
+                        columnas=np.asarray(ctx['columnas'], dtype=np.intp), es_fase_1=ctx['es_fase_1'])
+        self.fases.append(fase)
+
+    def _ampliar(self):
+        capacidad = 2 * max(1, len(self.fase))
+        for campo in ('fase', 'iteracion', 'entrante', 'saliente', 'paso', 'objetivo', 'infactibilidad'):
+            anterior = getattr(self, campo)
+            nuevo = np.empty(capacidad, dtype=anterior.dtype)
+            nuevo[:len(anterior)] = anterior
+            setattr(self, campo, nuevo)
+
+    def guardar(self, ruta):
+        """
+        Guarda la traza en un archivo .npz comprimido: los pivotes, una fila
+        por fase y el problema extendido.
+        """
+        total = self.A.shape[1] if self.A is not None else 0
+        m = self.A.shape[0] if self.A is not None else 0
+        num_fases = len(self.fases)
+        reconstruible = np.array([f['base'] is not None for f in self.fases], dtype=bool)
+        bases = np.zeros((num_fases, m), dtype=np.intp)
+        costos = np.zeros((num_fases, total))
+        columnas = np.zeros((num_fases, total), dtype=bool)
+        for k, f in enumerate(self.fases):
+            if f['base'] is not None:
+                bases[k], costos[k] = f['base'], f['c']
+                columnas[k, f['columnas']] = True
+
+        k = self.num_pivotes
+        np.savez_compressed(
+            ruta, fase=self.fase[:k], iteracion=self.iteracion[:k], entrante=self.entrante[:k],
+            saliente=self.saliente[:k], paso=self.paso[:k], objetivo=self.objetivo[:k],
+            infactibilidad=self.infactibilidad[:k],
+            nombres_fases=np.array([f['nombre'] for f in self.fases], dtype=str),
+            estados_fases=np.array([f['estado'] or '' for f in self.fases], dtype=str),
+            iteracion_inicial=np.array([f['iteracion_inicial'] for f in self.fases], dtype=np.int32),
+            es_fase_1=np.array([f['es_fase_1'] for f in self.fases], dtype=bool),
+            reconstruible=reconstruible, bases=bases, costos=costos, columnas=columnas,
+            A=self.A if self.A is not None else np.zeros((0, 0)),
+            b=self.b if self.b is not None else np.zeros(0),
+            n=np.int64(self.n), nombres=np.array(self.nombres or [], dtype=str))
+
+
+# ==================================================================================
+# REPRODUCCIÓN DE LA TRAZA
+# ==================================================================================
+
+class ReproductorTraza:
+    """
+    Reconstruye los tableros de una traza guardada. El tablero del pivote k
+    se obtiene re-aplicando los pivotes de su fase a la base inicial de la
+    fase y factorizando esa base; nada de esto se calcula durante la resolución.
+    """
+
+    def __init__(self, ruta):
+        with np.load(ruta, allow_pickle=False) as datos:
+            self.datos = {clave: datos[clave] for clave in datos.files}
+        self.A = self.datos['A']
+        self.b = self.datos['b']
+        self.n = int(self.datos['n'])
+        self.nombres = [str(nombre) for nombre in self.datos['nombres']]
+        self.nombres_fases = [str(nombre) for nombre in self.datos['nombres_fases']]
+
+    @property
+    def num_pivotes(self):
+        return len(self.datos['entrante'])
+
+    def pivotes(self):
+        """Resumen de cada pivote: (k, fase, iteración, entrante, saliente, paso, objetivo)."""
+        d = self.datos
+        return [(k, self.nombres_fases[d['fase'][k]], int(d['iteracion'][k]), self.nombres[d['entrante'][k]],
+                 self.nombres[d['saliente'][k]], float(d['paso'][k]), float(d['objetivo'][k]))
+                for k in range(self.num_pivotes)]
+
+    def base_en(self, k):
+        """
+        Base antes del pivote k (0 <= k < num_pivotes) o, con k = num_pivotes,
+        la base final de la última fase.
+
+        Returns:
+            tuple: (índice de la fase, BaseSimplex)
+        """
+        d = self.datos
+        if not 0 <= k <= self.num_pivotes:
+            raise IndexError(f"La traza tiene {self.num_pivotes} pivotes.")
+        if k < self.num_pivotes:
+            fase = int(d['fase'][k])
+        else:
+            fase = len(self.nombres_fases) - 1
+        if not d['reconstruible'][fase]:
+            raise ValueError(f"Los tableros de la fase {self.nombres_fases[fase]} no se pueden reconstruir.")
+
+        base = BaseSimplex(d['bases'][fase], self.A.shape[1])
+        for p in np.flatnonzero(d['fase'][:k] == fase):
+            base.reemplazar(base.posicion_de(int(d['saliente'][p])), int(d['entrante'][p]))
+        return fase, base
+
+    def mostrar_tablero(self, k, ventana=None):
+        """
+        Muestra el tablero del pivote k con la variable entrante y la saliente
+        resaltadas, igual que el modo paso a paso; con k = num_pivotes muestra
+        el tablero final. ventana limita las columnas como en ObservadorTablero.
+        """
+        d = self.datos
+        fase, base = self.base_en(k)
+        c = d['costos'][fase]
+        columnas = np.flatnonzero(d['columnas'][fase])
+        B_inv = np.linalg.inv(self.A[:, base.indices])
+        c_B = c[base.indices]
+        x_B = B_inv @ self.b
+        Z = c_B @ x_B
+        entrante = int(d['entrante'][k]) if k < self.num_pivotes else None
+        if ventana is not None:
+            columnas = columnas_ventana(base, B_inv, self.A, c_B, c, ventana, columnas, entrante)
+
+        if k == self.num_pivotes:
+            mostrar_tablero_revisado('final', self.nombres_fases[fase], bool(d['es_fase_1'][fase]), base, B_inv,
+                                     self.A, c_B, c, x_B, Z, self.n, self.nombres, columnas=columnas)
+            return
+
+        saliente = int(d['saliente'][k])
+        costo_entrante = c_B @ (B_inv @ self.A[:, entrante]) - c[entrante]
+        base_futura = base.copia()
+        base_futura.reemplazar(base.posicion_de(saliente), entrante)
+        mostrar_tablero_revisado(int(d['iteracion'][k]), self.nombres_fases[fase], bool(d['es_fase_1'][fase]), base,
+                                 B_inv, self.A, c_B, c, x_B, Z, self.n, self.nombres, entrante, saliente,
+                                 costo_entrante, float(d['paso'][k]), [self.nombres[j] for j in base_futura],
+                                 columnas=columnas)